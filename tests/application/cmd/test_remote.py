@@ -0,0 +1,48 @@
+import asyncio
+import io
+import threading
+import types
+
+import pytest
+from rich.console import Console
+
+from umk import core
+from umk.application.cmd.remote import parallel
+
+
+@pytest.fixture
+def output(monkeypatch):
+    result = io.StringIO()
+    monkeypatch.setattr(core.globals, "console", Console(file=result, width=200))
+    return result
+
+
+def instances(*names: str, fail: str = "") -> list[types.SimpleNamespace]:
+    # every remote waits for the others, so the action passes only if they run concurrently
+    barrier = threading.Barrier(len(names), timeout=5)
+    result = []
+    for name in names:
+        def build(force: bool, name=name):
+            barrier.wait()
+            if name == fail:
+                raise RuntimeError("no space left")
+        result.append(types.SimpleNamespace(name=name, build=build))
+    return result
+
+
+def test_parallel_runs_remotes_concurrently(output):
+    asyncio.run(parallel(instances("a", "b", "c"), "build", force=True))
+    text = output.getvalue()
+    for name in "abc":
+        assert f"[{name}] build started" in text
+        assert f"[{name}] build done in " in text
+    assert "build: 3/3 remote environments in " in text
+
+
+def test_parallel_fails_if_any_remote_fails(output):
+    with pytest.raises(SystemExit):
+        asyncio.run(parallel(instances("a", "b", fail="b"), "build", force=False))
+    text = output.getvalue()
+    assert "[a] build done in " in text
+    assert "[b] build failed in " in text and "no space left" in text
+    assert "build: 1/2 remote environments in " in text
@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from umk import core
+from umk.application import agent
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / ".unimake").mkdir()
+    (tmp_path / "sub" / "dir").mkdir(parents=True)
+    monkeypatch.setattr(core.globals.paths, "work", tmp_path / "sub")
+    return tmp_path
+
+
+def test_locate_finds_project_root(project):
+    assert agent.locate() == project / agent.SOCKET
+    assert agent.locate("/tmp/agent.sock") == agent.Path("/tmp/agent.sock")
+
+
+def test_client_reaches_agent_from_subdirectory(project):
+    socket = project / agent.SOCKET
+    env = {**os.environ, "PYTHONPATH": str(Path(__file__).parents[2])}
+    script = "from umk.application import agent; agent.Server(agent.locate()).serve()"
+    server = subprocess.Popen(
+        [sys.executable, "-c", script],
+        cwd=project,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while not socket.exists() and time.monotonic() < deadline:
+            time.sleep(0.1)
+        assert socket.exists()
+        # the missing executable proves that the command is not executed cold
+        results = [
+            subprocess.run(
+                agent.command(agent.SOCKET, ["umk-missing", "--help"]),
+                cwd=project / "sub" / "dir",
+                capture_output=True,
+                text=True,
+                env={**env, "PATH": os.path.dirname(sys.executable)},
+            )
+            for _ in range(3)
+        ]
+    finally:
+        server.terminate()
+        server.wait()
+    for result in results:
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "Usage" in result.stdout
@@ -0,0 +1,10 @@
+import pytest
+
+from umk import core
+
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path_factory, monkeypatch):
+    result = tmp_path_factory.mktemp("cache")
+    monkeypatch.setattr(core.globals.paths, "cache", result)
+    return result
@@ -0,0 +1,51 @@
+import pytest
+
+from umk.framework.adapters import docker
+
+
+@pytest.mark.parametrize("mount, expected", [
+    (docker.FileMount(target="/cache"), "--mount=type=cache,target=/cache"),
+    (
+        docker.FileMount.cache("/cache", id="c", sharing="locked", uid=1000, gid=0),
+        "--mount=type=cache,target=/cache,id=c,sharing=locked,uid=1000,gid=0",
+    ),
+    (
+        docker.FileMount(type="bind", target="/src", source="src", stage="builder", readonly=True),
+        "--mount=type=bind,target=/src,source=src,from=builder,readonly",
+    ),
+    (
+        docker.FileMount(type="secret", target="/run/secret", mode="0400"),
+        "--mount=type=secret,target=/run/secret,mode=0400",
+    ),
+    (docker.FileMount.gocache()[0], "--mount=type=cache,target=/root/.cache/go-build,id=gocache"),
+    (docker.FileMount.gomodcache()[0], "--mount=type=cache,target=/go/pkg/mod,id=gomodcache"),
+    (docker.FileMount.pip()[0], "--mount=type=cache,target=/root/.cache/pip,id=pip"),
+])
+def test_mount(mount, expected):
+    assert str(mount) == expected
+
+
+def test_run_mounts(tmp_path):
+    file = docker.File(path=tmp_path)
+    file.froms("golang")
+    file.run(["go mod download", "go build ./..."], mounts=docker.FileMount.gomodcache())
+    file.run(["apt-get update", "apt-get install -y git"], True, docker.FileMount.apt())
+    apt = " ".join(str(mount) for mount in docker.FileMount.apt())
+    assert apt == "--mount=type=cache,target=/var/cache/apt,sharing=locked " \
+                  "--mount=type=cache,target=/var/lib/apt,sharing=locked"
+    assert file.text().splitlines() == [
+        "FROM golang",
+        "",
+        "RUN --mount=type=cache,target=/go/pkg/mod,id=gomodcache go mod download && \\",
+        "    go build ./...",
+        "",
+        f"RUN {apt} apt-get update",
+        f"RUN {apt} apt-get install -y git",
+    ]
+
+
+def test_compose_build_cache():
+    build = docker.ComposeBuild(context=".")
+    build.cache("/tmp/cache", mode="min")
+    assert build.cache_from == ["type=local,src=/tmp/cache"]
+    assert build.cache_to == ["type=local,dest=/tmp/cache,mode=min"]
@@ -0,0 +1,57 @@
+import threading
+
+import pytest
+
+from umk.framework.adapters.go.coverage import Coverage
+from umk.framework.filesystem import Path
+
+
+class Tool:
+    def __init__(self, fail: str = ""):
+        self.fail = fail
+        self.merges: list[tuple[list[str], str]] = []
+        self.lock = threading.Lock()
+
+    def command(self, *args: str):
+        assert args[:3] == ("tool", "covdata", "merge")
+        inputs = args[3].removeprefix("-i=").split(",")
+        output = args[4].removeprefix("-o=")
+        with self.lock:
+            self.merges.append((inputs, output))
+        code = 1 if self.fail in inputs else 0
+        return type("Shell", (), {"sync": lambda self: code})()
+
+
+@pytest.mark.parametrize("count, jobs, chunks", [
+    (1, 4, []),
+    (2, 4, []),
+    (5, 1, []),
+    (4, 4, [2, 2]),
+    (8, 4, [2, 2, 2, 2]),
+    (5, 8, [2, 2, 1]),
+    (9, 2, [5, 4]),
+])
+def test_merge(tmp_path, count, jobs, chunks):
+    coverage = Coverage(root=tmp_path / "cover")
+    dirs = [tmp_path / "runs" / str(i) for i in range(count)]
+    output = tmp_path / "merged"
+    tool = Tool()
+    assert coverage.merge(tool, dirs, output, jobs)
+    assert output.is_dir()
+
+    *partials, final = tool.merges
+    assert final[1] == str(output)
+    assert sorted(len(inputs) for inputs, _ in partials) == sorted(chunks)
+    # every run directory is merged exactly once, partial results are merged into the output
+    merged = [d for inputs, _ in partials for d in inputs] if partials else final[0]
+    assert sorted(merged) == sorted(str(d) for d in dirs)
+    if partials:
+        assert sorted(final[0]) == sorted(out for _, out in partials)
+        assert all(Path(out).is_dir() for _, out in partials)
+
+
+@pytest.mark.parametrize("count", [2, 6])
+def test_merge_fails(tmp_path, count):
+    dirs = [tmp_path / "runs" / str(i) for i in range(count)]
+    tool = Tool(fail=str(dirs[-1]))
+    assert not Coverage(root=tmp_path / "cover").merge(tool, dirs, tmp_path / "merged", 3)
@@ -0,0 +1,53 @@
+import pytest
+
+from umk.framework.adapters.go.packages import Package, Packages
+from umk.framework.filesystem import Path
+
+ROOT = Path("/src/app")
+MAIN = {"Path": "example.com/app", "Main": True}
+
+
+def package(name: str, **kwargs) -> Package:
+    path = f"example.com/app/{name}"
+    return Package(ImportPath=path, Dir=str(ROOT / name), Module=MAIN, **kwargs)
+
+
+PACKAGES = Packages(items=[
+    package("a"),
+    package("b", Imports=["example.com/app/a", "fmt"]),
+    package("c", Imports=["example.com/app/b"]),
+    package("d", TestImports=["example.com/app/a"]),
+    package("e", XTestImports=["example.com/app/c"]),
+    package("f"),
+    Package(ImportPath="fmt", Dir="/usr/lib/go/src/fmt", Standard=True),
+])
+
+
+@pytest.mark.parametrize("files, expected", [
+    ([], set()),
+    (["README.md"], set()),
+    (["f/f.go"], {"f"}),
+    (["c/c.go"], {"c", "e"}),
+    (["b/b_test.go"], {"b", "c", "e"}),
+    (["a/a.go"], {"a", "b", "c", "d", "e"}),
+    (["a/internal/x.go"], {"a", "b", "c", "d", "e"}),
+    (["f/f.go", "c/c.go"], {"c", "e", "f"}),
+    (["/usr/lib/go/src/fmt/print.go"], set()),
+    (["go.mod"], None),
+    (["f/f.go", "go.sum"], None),
+    (["vendor/example.com/lib/lib.go"], None),
+])
+def test_affected(files, expected):
+    result = PACKAGES.affected([ROOT / f for f in files])
+    if expected is not None:
+        expected = {f"example.com/app/{name}" for name in expected}
+    assert result == expected
+
+
+def test_dependents_and_imports():
+    assert PACKAGES.dependents() == {
+        "example.com/app/a": {"example.com/app/b"},
+        "example.com/app/b": {"example.com/app/c"},
+        "fmt": {"example.com/app/b"},
+    }
+    assert PACKAGES.imports() == {"fmt"}
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from umk.framework.adapters.go.proxy import Module, Proxy, escape
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("golang.org/x/mod", "golang.org/x/mod"),
+    ("github.com/BurntSushi/toml", "github.com/!burnt!sushi/toml"),
+    ("v1.0.0-RC1", "v1.0.0-!r!c1"),
+])
+def test_escape(path, expected):
+    assert escape(path) == expected
+
+
+def download(tmp_path, path: str, version: str, error: str = "") -> dict:
+    files = {}
+    for key, suffix in (("Info", "info"), ("GoMod", "mod"), ("Zip", "zip")):
+        file = tmp_path / "modcache" / f"{escape(path)}@{version}.{suffix}"
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(f"{path} {version} {suffix}")
+        files[key] = str(file)
+    return {"Path": path, "Version": version, "Error": error, **(files if not error else {})}
+
+
+def test_populate_copies_new_files_only(tmp_path):
+    text = "\n".join(json.dumps(m, indent=2) for m in [
+        download(tmp_path, "github.com/Acme/lib", "v1.0.0"),
+        download(tmp_path, "github.com/Acme/lib", "v1.0.0"),
+        download(tmp_path, "example.com/broken", "v0.1.0", error="not found"),
+    ])
+    modules = Module.parse(text)
+    assert [(m.path, m.error) for m in modules] == [
+        ("github.com/Acme/lib", ""),
+        ("github.com/Acme/lib", ""),
+        ("example.com/broken", "not found"),
+    ]
+    proxy = Proxy(root=tmp_path / "proxy")
+    assert proxy.populate(modules) == (3, 0)
+    versions = tmp_path / "proxy" / "github.com" / "!acme" / "lib" / "@v"
+    names = sorted(f.name for f in versions.iterdir())
+    assert names == ["list", "v1.0.0.info", "v1.0.0.mod", "v1.0.0.zip"]
+    assert (versions / "v1.0.0.zip").read_text() == "github.com/Acme/lib v1.0.0 zip"
+    assert not (tmp_path / "proxy" / "example.com").exists()
+
+    modules += Module.parse(json.dumps(download(tmp_path, "github.com/Acme/lib", "v1.1.0")))
+    assert proxy.populate(modules) == (3, 3)
+    assert (versions / "list").read_text() == "v1.0.0\nv1.1.0\n"
+
+
+@pytest.mark.parametrize("flags, expected", [
+    ("", "-mod=mod"),
+    ("-trimpath", "-trimpath -mod=mod"),
+    ("-mod=mod -trimpath", "-mod=mod -trimpath"),
+])
+def test_environs(tmp_path, flags, expected):
+    environs = Proxy(root=tmp_path).environs(flags)
+    assert environs["GOPROXY"] == f"file://{tmp_path.as_posix()}"
+    assert environs["GOFLAGS"] == expected
+    assert environs["GOSUMDB"] == "off"
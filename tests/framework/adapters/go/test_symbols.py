@@ -0,0 +1,56 @@
+import pytest
+
+from umk.framework.adapters.go.symbols import Symbols, package
+
+NM = """\
+  4a2f00       1024 T main.main
+  401000      65536 T runtime.mallocgc
+  520000        512 R go:string.*
+  530000        256 D github.com/acme/lib.(*Client).Do
+  540000       4096 B runtime.mheap_
+                  0 U _cgo_init
+  550000        128 R type:*github.com/acme/lib.Client
+  560000         64 R type:[]int
+garbage line
+"""
+
+
+def test_parse():
+    symbols = Symbols.parse(NM)
+    assert [(s.address, s.size, s.type, s.name) for s in symbols.items] == [
+        ("401000", 65536, "T", "runtime.mallocgc"),
+        ("540000", 4096, "B", "runtime.mheap_"),
+        ("4a2f00", 1024, "T", "main.main"),
+        ("520000", 512, "R", "go:string.*"),
+        ("530000", 256, "D", "github.com/acme/lib.(*Client).Do"),
+        ("550000", 128, "R", "type:*github.com/acme/lib.Client"),
+        ("560000", 64, "R", "type:[]int"),
+    ]
+    # BSS takes no space in the file
+    assert symbols.total == 65536 + 1024 + 512 + 256 + 128 + 64
+    assert symbols.packages() == {
+        "runtime": 65536,
+        "main": 1024,
+        "go:string": 512,
+        "github.com/acme/lib": 256 + 128,
+        "type:": 64,
+    }
+    assert symbols.top(2) == {"runtime.mallocgc": 65536, "main.main": 1024}
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("main.main", "main"),
+    ("runtime.mallocgc", "runtime"),
+    ("github.com/acme/lib.(*Client).Do", "github.com/acme/lib"),
+    ("github.com/acme/lib.Map[go.shape.int].Get", "github.com/acme/lib"),
+    # dots of the last path element are escaped by the linker
+    ("gopkg.in/yaml%2ev3.Unmarshal", "gopkg.in/yaml%2ev3"),
+    ("go:buildid", "go:buildid"),
+    ("go:string.*", "go:string"),
+    ("type:*github.com/acme/lib.Client", "github.com/acme/lib"),
+    ("type:[4]main.T", "main"),
+    ("type:[]int", "type:"),
+    ("type:int", "type:"),
+])
+def test_package(name, expected):
+    assert package(name) == expected
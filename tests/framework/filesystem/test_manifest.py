@@ -0,0 +1,72 @@
+import pytest
+
+from umk.framework.filesystem.manifest import Entry, Manifest, Patterns
+
+
+@pytest.mark.parametrize("patterns, path, expected", [
+    (["*.txt"], "notes.txt", True),
+    (["*.txt"], "docs/notes.txt", False),
+    (["**/*.txt"], "docs/notes.txt", True),
+    (["**/*.txt"], "notes.txt", True),
+    (["docs"], "docs/api/index.md", True),
+    (["/docs/"], "docs/index.md", True),
+    (["doc?"], "docs", True),
+    (["doc?"], "doc", False),
+    (["[a-c].go"], "b.go", True),
+    (["[!a-c].go"], "b.go", False),
+    (["[!a-c].go"], "d.go", True),
+    (["\\*.go"], "*.go", True),
+    (["\\*.go"], "main.go", False),
+    (["*.md", "!README.md"], "README.md", False),
+    (["*.md", "!README.md", "README*"], "README.md", True),
+    (["# comment", "", "."], "main.go", False),
+    ([], "main.go", False),
+])
+def test_patterns_match(patterns, path, expected):
+    assert Patterns(*patterns).match(path) is expected
+
+
+def test_patterns_load(tmp_path):
+    file = tmp_path / ".dockerignore"
+    assert not Patterns.load(file)
+    file.write_text("# build outputs\nbuild\n!build/keep\n")
+    patterns = Patterns.load(file)
+    assert patterns.negations
+    assert patterns.match("build/app") and not patterns.match("build/keep")
+
+
+def manifest(**files: str) -> Manifest:
+    return Manifest(entries={path: Entry(digest=digest) for path, digest in files.items()})
+
+
+@pytest.mark.parametrize("current, previous, changed, removed", [
+    ({}, {}, [], []),
+    ({"a": "1"}, {"a": "1"}, [], []),
+    ({"a": "1"}, {}, ["a"], []),
+    ({}, {"a": "1"}, [], ["a"]),
+    ({"a": "2", "b": "1"}, {"a": "1", "b": "1"}, ["a"], []),
+    ({"b": "1", "c": "1"}, {"a": "1", "b": "1"}, ["c"], ["a"]),
+])
+def test_manifest_diff(current, previous, changed, removed):
+    assert manifest(**current).diff(manifest(**previous)) == (changed, removed)
+
+
+def test_manifest_scan(tmp_path):
+    exclude = Patterns("build")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "app").write_text("binary")
+    (tmp_path / "main.go").write_text("package main\n")
+    first = Manifest.scan(tmp_path, exclude)
+    assert list(first.entries) == ["main.go"]
+    digest = first.digest()
+
+    # unchanged files are not hashed again
+    cached = first.model_copy(deep=True)
+    cached.entries["main.go"].digest = "cached"
+    assert Manifest.scan(tmp_path, exclude, cached).entries["main.go"].digest == "cached"
+
+    # timestamps do not change the digest, contents do
+    (tmp_path / "main.go").write_text("package main\n")
+    assert Manifest.scan(tmp_path, exclude, first).digest() == digest
+    (tmp_path / "main.go").write_text("package app\n")
+    assert Manifest.scan(tmp_path, exclude, first).digest() != digest
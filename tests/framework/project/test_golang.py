@@ -0,0 +1,14 @@
+from umk.framework.project.golang import GolangLayout
+
+
+def test_ignores_vendor_of_not_vendored_module(tmp_path):
+    layout = GolangLayout(root=tmp_path)
+    assert layout.vendor in layout.ignores()
+
+
+def test_keeps_vendor_of_vendored_module(tmp_path):
+    (tmp_path / "vendor").mkdir()
+    (tmp_path / "vendor" / "modules.txt").write_text("# example.com/dep v1.0.0\n")
+    layout = GolangLayout(root=tmp_path)
+    assert layout.vendor not in layout.ignores()
+    assert layout.output in layout.ignores()
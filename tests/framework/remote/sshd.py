@@ -0,0 +1,188 @@
+import os
+import socket
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+import paramiko
+
+KEY = paramiko.RSAKey.generate(2048)
+
+
+class Handle(paramiko.SFTPHandle):
+    def stat(self):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.fstat(self.readfile.fileno()))
+        except OSError as err:
+            return paramiko.SFTPServer.convert_errno(err.errno)
+
+    def chattr(self, attr):
+        try:
+            paramiko.SFTPServer.set_file_attr(self.filename, attr)
+        except OSError as err:
+            return paramiko.SFTPServer.convert_errno(err.errno)
+        return paramiko.SFTP_OK
+
+
+class Filesystem(paramiko.SFTPServerInterface):
+    """
+    SFTP server serving the host root directory (remote home).
+    """
+
+    def __init__(self, server, *args, root: Path, **kwargs):
+        super().__init__(server, *args, **kwargs)
+        self.root = root
+
+    def _real(self, path: str) -> str:
+        return str(self.root / path.lstrip("/"))
+
+    def _call(self, func, *args):
+        try:
+            return func(*args)
+        except OSError as err:
+            return paramiko.SFTPServer.convert_errno(err.errno)
+
+    def canonicalize(self, path):
+        return "/" + os.path.normpath(path).lstrip("/.")
+
+    def list_folder(self, path):
+        path = self._real(path)
+
+        def items():
+            result = []
+            for name in os.listdir(path):
+                attr = paramiko.SFTPAttributes.from_stat(os.stat(os.path.join(path, name)))
+                attr.filename = name
+                result.append(attr)
+            return result
+
+        return self._call(items)
+
+    def stat(self, path):
+        return self._call(lambda: paramiko.SFTPAttributes.from_stat(os.stat(self._real(path))))
+
+    def lstat(self, path):
+        return self._call(lambda: paramiko.SFTPAttributes.from_stat(os.lstat(self._real(path))))
+
+    def open(self, path, flags, attr):
+        path = self._real(path)
+        mode = getattr(attr, "st_mode", None)
+        try:
+            fd = os.open(path, flags, mode if mode is not None else 0o666)
+        except OSError as err:
+            return paramiko.SFTPServer.convert_errno(err.errno)
+        if flags & os.O_WRONLY:
+            kind = "ab" if flags & os.O_APPEND else "wb"
+        elif flags & os.O_RDWR:
+            kind = "a+b" if flags & os.O_APPEND else "r+b"
+        else:
+            kind = "rb"
+        result = Handle(flags)
+        result.filename = path
+        result.readfile = result.writefile = os.fdopen(fd, kind)
+        return result
+
+    def remove(self, path):
+        return self._call(os.remove, self._real(path)) or paramiko.SFTP_OK
+
+    def rename(self, old, new):
+        return self._call(os.rename, self._real(old), self._real(new)) or paramiko.SFTP_OK
+
+    def mkdir(self, path, attr):
+        return self._call(os.mkdir, self._real(path)) or paramiko.SFTP_OK
+
+    def rmdir(self, path):
+        return self._call(os.rmdir, self._real(path)) or paramiko.SFTP_OK
+
+    def chattr(self, path, attr):
+        set_file_attr = paramiko.SFTPServer.set_file_attr
+        return self._call(set_file_attr, self._real(path), attr) or paramiko.SFTP_OK
+
+
+class Session(paramiko.ServerInterface):
+    def __init__(self, host: 'Host', transport: paramiko.Transport):
+        self.host = host
+        self.transport = transport
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_auth_password(self, username, password):
+        return paramiko.AUTH_SUCCESSFUL
+
+    def check_channel_request(self, kind, chanid):
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_pty_request(self, *args):
+        return True
+
+    def check_channel_exec_request(self, channel, command):
+        args = (self.transport, channel, command.decode())
+        threading.Thread(target=self.host.run, args=args, daemon=True).start()
+        return True
+
+
+class Host:
+    """
+    In-process SSH server (exec and SFTP) on localhost. Commands run by the
+    local shell within the host root directory (after 'delay' seconds). A host
+    created with 'die' drops every connection and stops listening on the first
+    command, so the client sees -1 exit status.
+    """
+
+    def __init__(self, root: Path, die: bool = False, delay: float = 0.0):
+        self.root = root
+        self.die = die
+        self.delay = delay
+        self.commands: list[str] = []
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.listen(16)
+        self.port = self.listener.getsockname()[1]
+        self.transports: list[paramiko.Transport] = []
+        self.lock = threading.Lock()
+        threading.Thread(target=self.serve, daemon=True).start()
+
+    def serve(self):
+        while True:
+            try:
+                conn, _ = self.listener.accept()
+            except OSError:
+                return
+            transport = paramiko.Transport(conn)
+            transport.add_server_key(KEY)
+            transport.set_subsystem_handler("sftp", paramiko.SFTPServer, Filesystem, root=self.root)
+            with self.lock:
+                self.transports.append(transport)
+            transport.start_server(server=Session(self, transport))
+
+    def run(self, transport: paramiko.Transport, channel: paramiko.Channel, command: str):
+        self.commands.append(command)
+        if self.die:
+            # drop the connection mid-command
+            channel.sendall(b"running\n")
+            time.sleep(0.1)
+            self.stop()
+            return
+        time.sleep(self.delay)
+        process = subprocess.Popen(
+            command, shell=True, cwd=self.root, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+        )
+        for line in process.stdout:
+            channel.sendall(line)
+        channel.send_exit_status(process.wait())
+        channel.close()
+
+    def stop(self):
+        try:
+            self.listener.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.listener.close()
+        with self.lock:
+            for transport in self.transports:
+                transport.close()
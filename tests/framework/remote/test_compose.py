@@ -0,0 +1,287 @@
+import datetime
+import io
+import re
+import socket
+import tarfile
+import time
+import types
+
+import pytest
+from rich.console import Console
+
+from umk import core
+from umk.framework.adapters import docker
+from umk.framework.project.base import Layout
+from umk.framework.project.golang import GolangLayout
+from umk.framework.remote import docker as remote
+from umk.framework.remote.docker import LABEL_BUILD
+
+
+class Images:
+    def __init__(self):
+        self.items: dict[str, types.SimpleNamespace] = {}
+        self.count = 0
+
+    def exists(self, name: str) -> bool:
+        return name in self.items
+
+    def inspect(self, name: str):
+        return self.items[name]
+
+    def tag(self, source: str, target: str):
+        self.items[target] = self.items[source]
+
+
+class Compose:
+    def __init__(self, owner: remote.Compose, images: Images):
+        self.owner = owner
+        self.images = images
+        self.built: list[str] = []
+
+    def build(self, services: list[str]):
+        for name in services:
+            self.images.count += 1
+            labels = {LABEL_BUILD: f'"{self.owner.digest(name)[0]}"'}
+            self.images.items[self.owner.image(name)] = types.SimpleNamespace(
+                id=f"sha256:{self.images.count}",
+                config=types.SimpleNamespace(labels=labels),
+            )
+            self.built.append(name)
+
+    def create(self, **kwargs):
+        pass
+
+    def ps(self, **kwargs):
+        return []
+
+
+@pytest.fixture
+def compose(tmp_path, monkeypatch):
+    (tmp_path / "main.go").write_text("package main\n")
+    dockerfile = docker.File(path=tmp_path, name="Dockerfile")
+    dockerfile.froms("alpine")
+    dockerfile.copy("main.go", "/src/")
+    result = remote.Compose(
+        name="dev",
+        composefile=docker.ComposeFile(
+            path=tmp_path,
+            services={"app": docker.ComposeService(build=dockerfile.compose(tmp_path))},
+        ),
+        dockerfiles=[dockerfile],
+        tagging=True,
+    )
+    client = types.SimpleNamespace(image=Images())
+    client.compose = Compose(result, client.image)
+    monkeypatch.setattr(remote.Compose, "client", property(lambda self: client))
+    return result
+
+
+def test_build_tracks_context_files(compose):
+    built = compose.client.compose.built
+    compose.build()
+    assert built == ["app"]
+
+    compose.build()
+    assert built == ["app"]
+
+    # sources copied from the context change the image
+    (compose.composefile.path / "main.go").write_text("package main\n\nfunc main() {}\n")
+    compose.build()
+    assert built == ["app", "app"]
+
+
+def test_build_reuses_content_tag(compose):
+    built = compose.client.compose.built
+    images = compose.client.image
+    source = compose.composefile.path / "main.go"
+
+    compose.build()
+    first = images.inspect(compose.image("app")).id
+    source.write_text("package main\n\nfunc main() {}\n")
+    compose.build()
+    assert images.inspect(compose.image("app")).id != first
+
+    # back to the first sources: retag instead of building
+    source.write_text("package main\n")
+    compose.build()
+    assert built == ["app", "app"]
+    assert images.inspect(compose.image("app")).id == first
+
+
+def container(id: str, status: str, exit_code: int = 0, health: None | str = None):
+    return types.SimpleNamespace(
+        id=id,
+        config=types.SimpleNamespace(labels={"com.docker.compose.project": "dev"}),
+        state=types.SimpleNamespace(
+            status=status,
+            running=status == "running",
+            exit_code=exit_code,
+            health=types.SimpleNamespace(status=health) if health else None,
+        ),
+    )
+
+
+def event(id: str, action: str):
+    actor = types.SimpleNamespace(id=id)
+    return types.SimpleNamespace(type="container", actor=actor, action=action)
+
+
+@pytest.fixture
+def services(tmp_path):
+    result = remote.Compose(
+        name="dev",
+        composefile=docker.ComposeFile(
+            path=tmp_path,
+            services={
+                name: docker.ComposeService(image="alpine") for name in ("fast", "slow", "job")
+            },
+        ),
+    )
+    return result
+
+
+@pytest.fixture
+def output(monkeypatch):
+    result = io.StringIO()
+    monkeypatch.setattr(core.globals, "console", Console(file=result, width=200))
+    return result
+
+
+def client(containers: dict[str, list], events: list[tuple[float, types.SimpleNamespace]]):
+    def stream(**kwargs):
+        for delay, item in events:
+            time.sleep(delay)
+            yield item
+
+    # exited containers are listed with 'all' only
+    def ps(services: list[str], all: bool = False):
+        return containers[services[0]] if all else []
+
+    return types.SimpleNamespace(
+        compose=types.SimpleNamespace(ps=ps),
+        system=types.SimpleNamespace(events=stream),
+    )
+
+
+def test_ready_reports_time_per_service(services, output, monkeypatch):
+    fake = client(
+        {
+            "fast": [container("f", "running", health="starting")],
+            "slow": [container("s", "running", health="starting")],
+            "job": [container("j", "running")],
+        },
+        [(0.1, event("f", "health_status: healthy")), (0.5, event("s", "health_status: healthy"))],
+    )
+    monkeypatch.setattr(remote.Compose, "client", property(lambda self: fake))
+    services.ready(["fast", "slow", "job"], datetime.datetime.now(), 5)
+    elapsed = {
+        name: float(seconds)
+        for name, seconds in re.findall(r"(\w+) is ready in ([\d.]+)s", output.getvalue())
+    }
+    assert elapsed["job"] < elapsed["fast"] < elapsed["slow"]
+    assert elapsed["slow"] >= 0.5
+
+
+def test_ready_fails_on_exited_container(services, output, monkeypatch):
+    fake = client(
+        {"fast": [container("f", "running")], "job": [container("j", "exited", exit_code=1)]},
+        [],
+    )
+    monkeypatch.setattr(remote.Compose, "client", property(lambda self: fake))
+    with pytest.raises(TimeoutError, match="job"):
+        services.ready(["fast", "job"], datetime.datetime.now(), 5)
+    assert "job: exited (exit code 1)" in output.getvalue()
+
+
+def test_ready_cancels_probes_of_failed_service(services, output, monkeypatch):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    services.probes = {"job": [f"127.0.0.1:{port}"]}
+    fake = client(
+        {"job": [container("j", "running", health="starting")]},
+        [(0.1, event("j", "die"))],
+    )
+    monkeypatch.setattr(remote.Compose, "client", property(lambda self: fake))
+    start = time.monotonic()
+    with pytest.raises(TimeoutError, match="job"):
+        services.ready(["job"], datetime.datetime.now(), 30)
+    assert time.monotonic() - start < 5
+
+
+def test_build_sends_cached_context_tarball(compose, monkeypatch):
+    root = compose.composefile.path
+    (root / "notes.txt").write_text("not copied\n")
+    (root / ".dockerignore").write_text("notes.txt\n")
+    compose.archive = True
+    builds = []
+
+    def run(cmd, stdin):
+        with tarfile.open(fileobj=stdin) as tar:
+            builds.append((cmd, sorted(tar.getnames())))
+        images = compose.client.image
+        images.count += 1
+        labels = dict(cmd[i + 1].split("=", 1) for i, arg in enumerate(cmd) if arg == "--label")
+        images.items[cmd[cmd.index("-t") + 1]] = types.SimpleNamespace(
+            id=f"sha256:{images.count}",
+            config=types.SimpleNamespace(labels=labels),
+        )
+        return types.SimpleNamespace(returncode=0)
+
+    monkeypatch.setattr(remote.subprocess, "run", run)
+    compose.build()
+    compose.build()
+    assert compose.client.compose.built == []
+    assert len(builds) == 1
+    cmd, names = builds[0]
+    assert cmd[:3] == ["docker", "build", "-t"] and cmd[-1] == "-"
+    assert "Dockerfile" in names and "main.go" in names and "notes.txt" not in names
+    # tarball is precomputed on save and reused while the context is unchanged
+    tarball = compose.tarball("app")
+    compose.save()
+    assert compose.tarball("app") == tarball and tarball.exists()
+
+
+def test_build_generates_watch_rules(compose):
+    root = compose.composefile.path
+    (root / "cmd").mkdir()
+    (root / "go.mod").write_text("module example.com/app\n")
+    compose.service = "app"
+    compose.layout = GolangLayout(root=root)
+    compose.build()
+    # no workspace: rules are not generated
+    assert compose.composefile.services["app"].develop is None
+
+    compose.workspace = "/src/"
+    compose.build()
+    watch = compose.composefile.services["app"].develop.watch
+    assert [(w.path, w.action, w.target) for w in watch] == [
+        ((root / "cmd").as_posix(), "sync", "/src/cmd"),
+        ((root / "go.mod").as_posix(), "rebuild", None),
+    ]
+
+    # user defined rules are kept
+    watch[:] = watch[:1]
+    compose.build()
+    assert len(compose.composefile.services["app"].develop.watch) == 1
+
+
+def test_watch_runs_services_with_rules(compose, output, monkeypatch):
+    root = compose.composefile.path
+    (root / ".git").mkdir()
+    commands = []
+    monkeypatch.setattr(remote.Shell, "sync", lambda self, **kwargs: commands.append(self.cmd))
+    compose.client.compose.docker_compose_cmd = ["docker", "compose"]
+    compose.watch()
+    assert commands == []
+    assert "no services with 'develop.watch' rules" in output.getvalue()
+
+    compose.service = "app"
+    compose.layout = Layout(root=root, unimake=root / ".unimake")
+    compose.workspace = "/src"
+    compose.watch()
+    assert commands == [["docker", "compose", "watch", "app"]]
+    # other layouts sync the whole project except VCS and caches
+    (watch,) = compose.composefile.services["app"].develop.watch
+    assert (watch.path, watch.action, watch.target) == (root.as_posix(), "sync", "/src")
+    assert watch.ignore == [".git", ".unimake/.cache"]
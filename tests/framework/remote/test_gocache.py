@@ -0,0 +1,144 @@
+import types
+
+from umk.framework.adapters import docker
+from umk.framework.remote import docker as remote
+
+
+class Volumes:
+    def __init__(self):
+        self.names: set[str] = set()
+
+    def exists(self, name: str) -> bool:
+        return name in self.names
+
+    def create(self, name: str, **kwargs):
+        self.names.add(name)
+
+
+def test_environments_append_proxy_flags(tmp_path):
+    cache = remote.GoCache(proxy="/goproxy", mirror=tmp_path / "mirror")
+    envs = cache.environments({"GOFLAGS": "-trimpath", "GOCACHE": "/cache"})
+    assert envs["GOFLAGS"] == "-trimpath -mod=mod"
+    assert envs["GOCACHE"] == "/cache"
+    assert envs["GOPROXY"] == "file:///goproxy"
+    # applying twice does not duplicate the flag
+    assert cache.environments(envs)["GOFLAGS"] == "-trimpath -mod=mod"
+    assert "GOFLAGS" not in remote.GoCache().environments()
+
+
+def test_compose_binds_proxy_mirror(tmp_path, monkeypatch):
+    mirror = tmp_path / "mirror"
+    compose = remote.Compose(
+        name="dev",
+        composefile=docker.ComposeFile(
+            path=tmp_path,
+            services={
+                "app": docker.ComposeService(image="golang", environment={"GOFLAGS": "-race"}),
+            },
+        ),
+        gocache=remote.GoCache(proxy="/goproxy", mirror=mirror),
+    )
+    client = types.SimpleNamespace(volume=Volumes())
+    monkeypatch.setattr(remote.Compose, "client", property(lambda self: client))
+    compose.caches()
+    compose.caches()
+
+    svc = compose.composefile.services["app"]
+    binds = [(str(m.source), str(m.target)) for m in svc.volumes.mounts if m.type == "bind"]
+    assert binds == [(str(mirror), "/goproxy")]
+    assert mirror.is_dir()
+    assert svc.environment["GOFLAGS"] == "-race -mod=mod"
+    assert svc.environment["GOPROXY"] == "file:///goproxy"
+
+
+def test_container_copies_changed_mirror(tmp_path, monkeypatch):
+    mirror = tmp_path / "mirror"
+    (mirror / "example.com" / "@v").mkdir(parents=True)
+    (mirror / "example.com" / "@v" / "list").write_text("v1.0.0\n")
+    cache = remote.GoCache(proxy="/goproxy", mirror=mirror)
+    container = remote.Container(name="box", container="box", gocache=cache)
+    copies = []
+    client = types.SimpleNamespace(
+        container=types.SimpleNamespace(
+            execute=lambda **kwargs: None,
+            copy=lambda source, destination: copies.append((source, destination)),
+        )
+    )
+    monkeypatch.setattr(remote.Container, "client", property(lambda self: client))
+    container.push(tmp_path)
+    container.push(tmp_path)
+    assert copies == [(f"{mirror}/.", ("box", "/goproxy"))]
+
+    (mirror / "example.com" / "@v" / "list").write_text("v1.0.0\nv1.1.0\n")
+    container.push(tmp_path)
+    assert len(copies) == 2
+
+
+def test_container_cache_prunes_cache_paths_only(monkeypatch):
+    cache = remote.GoCache(build="/root/.cache/go build", proxy="/goproxy")
+    container = remote.Container(name="box", container="box", gocache=cache)
+    scripts = []
+
+    def execute(container, command, **kwargs):
+        scripts.append(command[-1])
+        return "42\t/path\n"
+
+    client = types.SimpleNamespace(container=types.SimpleNamespace(execute=execute))
+    monkeypatch.setattr(remote.Container, "client", property(lambda self: client))
+    container.cache(prune=True)
+    assert scripts == [
+        "du -sk '/root/.cache/go build' 2>/dev/null || echo 0",
+        "rm -rf '/root/.cache/go build'/* '/root/.cache/go build'/.[!.]*",
+        "du -sk /go/pkg/mod 2>/dev/null || echo 0",
+        "rm -rf /go/pkg/mod/* /go/pkg/mod/.[!.]*",
+    ]
+
+
+def test_compose_attaches_cache_volumes(tmp_path, monkeypatch):
+    compose = remote.Compose(
+        name="dev",
+        composefile=docker.ComposeFile(
+            path=tmp_path,
+            services={
+                "app": docker.ComposeService(image="golang", environment={"GOCACHE": "/custom"}),
+                "db": docker.ComposeService(image="postgres"),
+            },
+        ),
+        gocache=remote.GoCache(prefix="dev", services=["app"]),
+    )
+    client = types.SimpleNamespace(volume=Volumes())
+    monkeypatch.setattr(remote.Compose, "client", property(lambda self: client))
+    compose.caches()
+    compose.caches()
+
+    assert client.volume.names == {"dev-gocache", "dev-gomodcache"}
+    app = compose.composefile.services["app"]
+    volumes = [(str(m.source), str(m.target)) for m in app.volumes.mounts if m.type == "volume"]
+    assert volumes == [("dev-gocache", "/root/.cache/go-build"), ("dev-gomodcache", "/go/pkg/mod")]
+    assert app.environment["GOCACHE"] == "/custom"
+    assert app.environment["GOMODCACHE"] == "/go/pkg/mod"
+    assert not compose.composefile.services["db"].volumes.mounts
+    assert all(compose.composefile.volumes[name].external for name in client.volume.names)
+
+
+def test_host_caches_bind_and_prune(tmp_path, monkeypatch):
+    monkeypatch.setenv("GOCACHE", str(tmp_path / "build"))
+    monkeypatch.setenv("GOMODCACHE", str(tmp_path / "mod"))
+    cache = remote.GoCache(volume=False)
+    sources = cache.sources()
+    assert sources == {
+        "/root/.cache/go-build": str(tmp_path / "build"),
+        "/go/pkg/mod": str(tmp_path / "mod"),
+    }
+
+    cache.provision(types.SimpleNamespace())
+    module = tmp_path / "mod" / "example.com" / "lib@v1.0.0"
+    module.mkdir(parents=True)
+    (module / "lib.go").write_text("package lib\n")
+    # module cache directories are read-only
+    module.chmod(0o555)
+    assert cache.size(types.SimpleNamespace(), sources["/go/pkg/mod"]) == 12
+
+    cache.prune(types.SimpleNamespace(), sources["/go/pkg/mod"])
+    assert (tmp_path / "mod").is_dir() and not any((tmp_path / "mod").iterdir())
+    assert cache.size(types.SimpleNamespace(), sources["/go/pkg/mod"]) == 0
@@ -0,0 +1,63 @@
+import types
+
+import pytest
+
+from umk import core
+from umk.framework.adapters import docker
+from umk.framework.remote.docker import Pool
+from umk.framework.system.environs import Environs
+
+
+class Containers:
+    def __init__(self, pool: Pool, files: dict[str, str]):
+        self.pool = pool
+        self.files = files
+        self.calls: list[dict] = []
+
+    def list(self, **kwargs):
+        return [types.SimpleNamespace(name=self.pool.container(i)) for i in range(self.pool.size)]
+
+    def execute(self, container, command, stream=False, **kwargs):
+        if not stream:
+            # workspace recycling
+            return None
+        self.calls.append({"command": command, **kwargs})
+        if command[0] == "false":
+            raise docker.DockerException(command, 2)
+        return iter([("stdout", b"ok\n")])
+
+    def copy(self, source, destination):
+        container, path = source
+        if path not in self.files:
+            raise docker.DockerException(["docker", "cp"], 1)
+        destination.write_text(self.files[path])
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(core.globals.paths, "work", tmp_path)
+    environments = Environs(inherit=False, BASE="1", MODE="base")
+    result = Pool(name="pool", image="alpine", size=2, environments=environments)
+    client = types.SimpleNamespace(container=Containers(result, {"/workspace/out/app": "binary"}))
+    monkeypatch.setattr(Pool, "client", property(lambda self: client))
+    return result
+
+
+def test_execute_honours_cwd_and_env(pool):
+    assert pool.execute(["true"], cwd="sub", env=Environs(inherit=False, MODE="job")) == 0
+    call = pool.client.container.calls[-1]
+    assert call["workdir"] == "/workspace/sub"
+    assert call["envs"] == {"BASE": "1", "MODE": "job"}
+
+
+def test_execute_returns_failures(pool):
+    assert pool.execute(["false"]) == 1
+
+
+def test_dispatch_reports_missing_outputs(pool, tmp_path):
+    failed = pool.dispatch(
+        jobs={"app": ["true"], "lib": ["true"]},
+        outputs={"app": [tmp_path / "out" / "app"], "lib": [tmp_path / "out" / "lib"]},
+    )
+    assert failed == 1
+    assert (tmp_path / "out" / "app").read_text() == "binary"
@@ -0,0 +1,50 @@
+import threading
+import types
+
+from umk.framework.adapters import docker
+from umk.framework.remote import docker as remote
+
+
+def stats(name: str, cpu: float, memory: int, read: int, write: int):
+    return types.SimpleNamespace(
+        container_name=name,
+        cpu_percentage=cpu,
+        memory_used=memory,
+        block_read=read,
+        block_write=write,
+    )
+
+
+def test_sampler_aggregates_containers_usage():
+    samples = iter([
+        [stats("app", 50.0, 100, 1000, 10), stats("db", 10.0, 300, 0, 0)],
+        docker.DockerException(["docker", "stats"], 1),
+        [stats("app", 150.0, 300, 1500, 40), stats("db", 30.0, 500, 200, 100)],
+    ])
+    done = threading.Event()
+
+    def collect(containers: list[str]):
+        assert containers == ["app", "db"]
+        item = next(samples, None)
+        if item is None:
+            done.set()
+            return []
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    client = types.SimpleNamespace(container=types.SimpleNamespace(stats=collect))
+    with remote.Sampler(client, ["app", "db"], interval=0.01) as usage:
+        assert done.wait(5)
+    assert usage.samples == 2
+    assert usage.cpu_peak == 180.0 and usage.cpu_average == 120.0
+    assert usage.memory_peak == 800 and usage.memory_average == 600
+    assert usage.block_read == 700 and usage.block_write == 130
+    assert usage.seconds > 0
+    assert str(usage).startswith("CPU 120% avg / 180% peak")
+
+
+def test_sampling_is_disabled_by_default(tmp_path):
+    compose = remote.Compose(name="dev", composefile=docker.ComposeFile(path=tmp_path))
+    with compose.sample() as usage:
+        assert usage is None
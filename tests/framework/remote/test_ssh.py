@@ -0,0 +1,183 @@
+import io
+
+import pytest
+from rich.console import Console
+
+from umk import core
+from umk.framework.remote.ssh import Pool, SecureShell
+from tests.framework.remote.sshd import Host
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    result = tmp_path / "project"
+    (result / "src").mkdir(parents=True)
+    (result / "src" / "input.txt").write_text("payload\n")
+    monkeypatch.setattr(core.globals.paths, "work", result)
+    return result
+
+
+def hosts(tmp_path, *dies: bool) -> list[Host]:
+    result = []
+    for i, die in enumerate(dies):
+        (tmp_path / f"host{i}").mkdir()
+        # healthy hosts are slowed down, so the dying one surely takes a job
+        delay = 0.0 if die or len(dies) == 1 else 0.2
+        result.append(Host(tmp_path / f"host{i}", die=die, delay=delay))
+    return result
+
+
+def pool(servers: list[Host]) -> Pool:
+    return Pool(
+        name="pool",
+        hosts=[
+            SecureShell(
+                name=f"host{i}", host="127.0.0.1", port=server.port, username="umk", password="umk"
+            )
+            for i, server in enumerate(servers)
+        ],
+    )
+
+
+def jobs(project, names: list[str]) -> tuple[dict[str, list[str]], dict[str, list]]:
+    commands = {
+        name: ["sh", "-c", f"mkdir -p out && cat src/input.txt > out/{name}.txt"] for name in names
+    }
+    outputs = {name: [project / "out" / f"{name}.txt"] for name in names}
+    return commands, outputs
+
+
+def test_dispatch_runs_jobs_and_pulls_outputs(tmp_path, project):
+    servers = hosts(tmp_path, False, False)
+    names = [f"job{i}" for i in range(6)]
+    remote = pool(servers)
+    try:
+        assert remote.dispatch(*jobs(project, names)) == 0
+    finally:
+        for server in servers:
+            server.stop()
+    for name in names:
+        assert (project / "out" / f"{name}.txt").read_text() == "payload\n"
+    # inputs are synced to every host
+    for server in servers:
+        assert (server.root / "project" / "src" / "input.txt").exists()
+    assert sum(len(server.commands) for server in servers) == len(names)
+    # configured hosts are not changed by the dispatch
+    assert not any(host.sync for host in remote.hosts)
+
+
+def test_dispatch_counts_failed_jobs(tmp_path, project):
+    servers = hosts(tmp_path, False)
+    commands, outputs = jobs(project, ["ok"])
+    commands["bad"] = ["sh", "-c", "exit 3"]
+    try:
+        assert pool(servers).dispatch(commands, outputs) == 1
+    finally:
+        servers[0].stop()
+    # a failed job is not retried
+    assert len(servers[0].commands) == 2
+
+
+def test_dispatch_requeues_jobs_of_dead_host(tmp_path, project):
+    # the dying host drops the connection without error (exit status -1)
+    servers = hosts(tmp_path, True, False)
+    names = [f"job{i}" for i in range(4)]
+    try:
+        assert pool(servers).dispatch(*jobs(project, names)) == 0
+    finally:
+        for server in servers:
+            server.stop()
+    assert len(servers[0].commands) == 1
+    assert len(servers[1].commands) == len(names)
+    for name in names:
+        assert (project / "out" / f"{name}.txt").read_text() == "payload\n"
+
+
+def test_dispatch_fails_when_all_hosts_die(tmp_path, project):
+    servers = hosts(tmp_path, True)
+    try:
+        assert pool(servers).dispatch(*jobs(project, ["job"])) == 1
+    finally:
+        servers[0].stop()
+
+
+def test_dispatch_requeues_jobs_of_dead_host_without_outputs(tmp_path, project):
+    servers = hosts(tmp_path, True, False)
+    names = [f"job{i}" for i in range(4)]
+    commands, _ = jobs(project, names)
+    try:
+        assert pool(servers).dispatch(commands, {}) == 0
+    finally:
+        for server in servers:
+            server.stop()
+    assert len(servers[1].commands) == len(names)
+    for name in names:
+        assert (servers[1].root / "project" / "out" / f"{name}.txt").exists()
+
+
+def test_proxy_mirror_is_synced_and_used(tmp_path, project, monkeypatch, capsys):
+    mirror = project / ".unimake" / ".cache" / "goproxy"
+    (mirror / "example.com" / "@v").mkdir(parents=True)
+    (mirror / "example.com" / "@v" / "list").write_text("v1.0.0\n")
+    servers = hosts(tmp_path, False)
+    # remote paths are relative to the user home
+    monkeypatch.setenv("HOME", str(servers[0].root))
+    monkeypatch.setenv("GOFLAGS", "-trimpath")
+    shell = SecureShell(
+        name="host", host="127.0.0.1", port=servers[0].port, username="umk", password="umk",
+        sync=True, proxy=mirror,
+    )
+    try:
+        shell.push(project)
+        script = 'echo "$GOFLAGS"; test -f "${GOPROXY#file://}/example.com/@v/list"'
+        code = shell.execute(["sh", "-c", script])
+    finally:
+        servers[0].stop()
+    assert code == 0
+    assert "-trimpath -mod=mod" in capsys.readouterr().out
+    synced = servers[0].root / "project" / ".unimake" / ".cache" / "goproxy"
+    assert (synced / "example.com" / "@v" / "list").exists()
+
+
+def test_push_and_pull_changed_files_only(tmp_path, project, monkeypatch):
+    output = io.StringIO()
+    monkeypatch.setattr(core.globals, "console", Console(file=output, width=200))
+    (project / "src" / "stale.txt").write_text("stale\n")
+    servers = hosts(tmp_path, False)
+    shell = SecureShell(
+        name="host", host="127.0.0.1", port=servers[0].port, username="umk", password="umk",
+        sync=True,
+    )
+    workspace = servers[0].root / "project"
+
+    def lines() -> list[str]:
+        result = output.getvalue().splitlines()
+        output.seek(0)
+        output.truncate()
+        return result
+
+    try:
+        shell.push(project)
+        assert lines() == ["[host] workspace synced: 2 uploaded, 0 removed (14 bytes)"]
+        shell.push(project)
+        assert lines() == ["[host] workspace is up to date"]
+
+        (project / "src" / "input.txt").write_text("changed\n")
+        (project / "src" / "stale.txt").unlink()
+        shell.push(project)
+        assert lines() == ["[host] workspace synced: 1 uploaded, 1 removed (8 bytes)"]
+        assert (workspace / "src" / "input.txt").read_text() == "changed\n"
+        assert not (workspace / "src" / "stale.txt").exists()
+
+        assert shell.execute(["sh", "-c", "mkdir -p out && cp src/input.txt out/app"]) == 0
+        lines()
+        items = [project / "out" / "app", project / "out" / "missing"]
+        shell.pull(project, items)
+        shell.pull(project, items)
+        assert lines()[1:] == ["[host] output is up to date: out/app"]
+        assert (project / "out" / "app").read_text() == "changed\n"
+        # downloaded outputs are not uploaded back
+        shell.push(project)
+        assert lines() == ["[host] workspace is up to date"]
+    finally:
+        servers[0].stop()
@@ -0,0 +1,17 @@
+from umk.framework.system.shell import Devnull, Fetch, Shell
+
+
+def test_sync_devnull():
+    assert Shell(cmd=["true"], handler=Devnull()).sync() == 0
+    assert Shell(cmd=["false"], handler=Devnull()).sync() == 1
+
+
+def test_sync_fetch_large_output():
+    # stdout and stderr both exceed the pipe buffer
+    script = (
+        "import sys; sys.stdout.write('o' * 200000 + '\\n'); sys.stderr.write('e' * 200000 + '\\n')"
+    )
+    shell = Shell(cmd=["python3", "-c", script], handler=Fetch())
+    assert shell.sync() == 0
+    assert len(shell.handler.outstr().strip()) == 200000
+    assert len(shell.handler.errstr().strip()) == 200000
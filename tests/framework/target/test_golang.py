@@ -0,0 +1,276 @@
+import json
+import os
+
+import pytest
+
+from umk import core
+from umk.framework import utils
+from umk.framework.adapters import go
+from umk.framework.adapters.go import base
+from umk.framework.system.environs import Environs
+from umk.framework.system.shell import Shell
+from umk.framework.target.golang import GolangBench, GolangBinary, GolangMod, GolangTest
+
+
+def test_matrix_overrides_platform_environs(tmp_path):
+    target = GolangBinary(
+        name="app",
+        build=go.Build(output=tmp_path / "app", source=["./cmd/app"]),
+        platforms=[
+            GolangBinary.Platform.parse("linux/arm64"),
+            GolangBinary.Platform.parse("windows/amd64+cgo"),
+        ],
+    )
+    target.tool.shell.environs = Environs(
+        inherit=False, GOOS="darwin", CGO_ENABLED="1", GOFLAGS="-trimpath"
+    )
+    matrix = target.matrix()
+
+    (linux, tool, options), (windows, _, other) = matrix
+    assert tool.shell.environs == {
+        "GOOS": "linux", "GOARCH": "arm64", "CGO_ENABLED": "0", "GOFLAGS": "-trimpath"
+    }
+    assert options.output == tmp_path / "app_linux_arm64"
+    assert other.output == tmp_path / "app_windows_amd64.exe"
+    # base tool is untouched
+    assert target.tool.shell.environs["GOOS"] == "darwin"
+
+
+def test_pgo_and_timing_are_exclusive(tmp_path):
+    target = GolangBinary(
+        name="app",
+        build=go.Build(output=tmp_path / "app", source=["./cmd/app"]),
+        timing=True,
+        pgo=GolangBinary.Pgo(),
+    )
+    with pytest.raises(SystemExit):
+        target.run()
+
+
+def test_profile_stops_on_failed_build(tmp_path, monkeypatch):
+    build = go.Build(output=tmp_path / "app", source=["./cmd/app"])
+    target = GolangBinary(name="app", build=build, timing=True)
+    monkeypatch.setattr(go.Go, "build", lambda self, options, outdir=None: 1)
+    monkeypatch.setattr(go.Go, "packages", lambda *args: pytest.fail("profiled failed build"))
+    with pytest.raises(SystemExit) as err:
+        target.run()
+    assert err.value.code == 1
+
+
+def test_optimize_fails_on_profile_merge_error(tmp_path, monkeypatch):
+    profile = tmp_path / "default.pgo"
+    target = GolangBinary(
+        name="app",
+        build=go.Build(output=tmp_path / "app", source=["./cmd/app"]),
+        pgo=GolangBinary.Pgo(profile=profile, workload=["run", "{binary}"], runs=1),
+    )
+    monkeypatch.setattr(go.Go, "build", lambda self, options, outdir=None: 0)
+    monkeypatch.setattr(
+        GolangBinary, "_workload", lambda self, binary, file: file.write_bytes(b"cpu") or 1.0
+    )
+    monkeypatch.setattr(go.Go, "command", lambda self, *args: Shell(cmd=["false"]))
+    with pytest.raises(SystemExit) as err:
+        target.run()
+    assert err.value.code == 1
+    assert not profile.exists()
+
+
+def test_bench_without_git(tmp_path, monkeypatch):
+    output = tmp_path / "bench.json"
+    events = [
+        {
+            "Action": "output",
+            "Package": "app",
+            "Output": f"BenchmarkRun-8 \t1000\t{ns} ns/op\t0 allocs/op\n",
+        }
+        for ns in (100, 101, 99, 100, 102, 100)
+    ]
+    output.write_text("\n".join(json.dumps(e) for e in events) + "\n")
+    monkeypatch.setattr(go.Go, "command", lambda self, *args: Shell(cmd=["cat", str(output)]))
+    target = GolangBench(name="bench", path=str(tmp_path))
+    target.run()
+    target.run()
+    records = utils.History("bench").load()
+    assert [r["commit"] for r in records] == ["", ""]
+    assert records[-1]["results"]["app.BenchmarkRun-8"]["ns/op"] == [100, 101, 99, 100, 102, 100]
+
+
+def module(root, monkeypatch):
+    (root / "go.mod").write_text("module app\n\ngo 1.21\n")
+    (root / "app_test.go").write_text(
+        'package app\n\nimport "testing"\n\nfunc TestApp(t *testing.T) {}\n'
+    )
+    monkeypatch.setattr(core.globals.paths, "work", root)
+
+
+def test_test_cache_depends_on_toolchain_environs(tmp_path, monkeypatch):
+    module(tmp_path, monkeypatch)
+    target = GolangTest(name="tests", cache=True)
+    target.tool.shell.environs = Environs(GOFLAGS="")
+    target.run()
+    before = target.results()["app"]["fingerprint"]
+    target.tool.shell.environs = Environs(GOFLAGS="-tags=integration")
+    target.run()
+    assert target.results()["app"]["fingerprint"] != before
+
+
+def test_optimize_fails_on_build_with_existing_profile(tmp_path, monkeypatch):
+    profile = tmp_path / "default.pgo"
+    profile.write_bytes(b"cpu")
+    target = GolangBinary(
+        name="app",
+        build=go.Build(output=tmp_path / "app", source=["./cmd/app"]),
+        pgo=GolangBinary.Pgo(profile=profile),
+    )
+    monkeypatch.setattr(go.Go, "build", lambda self, options, outdir=None: 2)
+    with pytest.raises(SystemExit) as err:
+        target.run()
+    assert err.value.code == 1
+
+
+@pytest.mark.parametrize("cmd", [["false"], ["echo", "PASS"]])
+def test_pgo_benchmarks_fail_without_measurement(tmp_path, monkeypatch, cmd):
+    target = GolangBinary(
+        name="app",
+        build=go.Build(output=tmp_path / "app", source=["./cmd/app"]),
+        pgo=GolangBinary.Pgo(benchmarks="."),
+    )
+    monkeypatch.setattr(go.Go, "command", lambda self, *args: Shell(cmd=cmd))
+    with pytest.raises(SystemExit) as err:
+        target._bench("off")
+    assert err.value.code == 1
+    if cmd == ["false"]:
+        with pytest.raises(SystemExit):
+            target._benchmarks(tmp_path)
+
+
+@pytest.mark.parametrize("option", [{"timing": True}, {"pgo": GolangBinary.Pgo()}])
+def test_platforms_reject_timing_and_pgo(tmp_path, monkeypatch, option):
+    target = GolangBinary(
+        name="app",
+        build=go.Build(output=tmp_path / "app", source=["./cmd/app"]),
+        platforms=[GolangBinary.Platform.parse("linux/arm64")],
+        **option,
+    )
+    monkeypatch.setattr(go.Go, "build", lambda self, options, outdir=None: pytest.fail("built"))
+    with pytest.raises(SystemExit):
+        target.run()
+
+
+@pytest.mark.parametrize("shard", ["3", "a/b", "0/2", "3/2", "1/0"])
+def test_test_rejects_invalid_shard(shard):
+    with pytest.raises(SystemExit):
+        GolangTest(name="tests").parse(shard)
+
+
+def test_test_parses_shard():
+    assert GolangTest(name="tests").parse("2/3") == (1, 3)
+
+
+def test_test_cache_depends_on_ambient_environs(tmp_path, monkeypatch):
+    module(tmp_path, monkeypatch)
+    target = GolangTest(name="tests", cache=True)
+    # overrides only, ambient variables are not inherited by the environs
+    target.tool.shell.environs = Environs(
+        inherit=False, PATH=os.environ["PATH"], HOME=os.environ["HOME"]
+    )
+    monkeypatch.setenv("GOEXPERIMENT", "")
+    target.run()
+    before = target.results()["app"]["fingerprint"]
+    monkeypatch.setenv("GOEXPERIMENT", "loopvar")
+    target.run()
+    assert target.results()["app"]["fingerprint"] != before
+
+
+def test_dockerfile_stages(tmp_path):
+    (tmp_path / "go.mod").write_text("module example.com/app\n\ngo 1.21\n")
+    (tmp_path / "go.sum").write_text("")
+    target = GolangBinary(
+        name="app",
+        build=go.Build(output=tmp_path / "bin" / "server", source=[tmp_path / "cmd"]),
+    )
+    dockerfile = target.dockerfile(tmp_path)
+    mounts = "--mount=type=cache,target=/root/.cache/go-build,id=gocache " \
+             "--mount=type=cache,target=/go/pkg/mod,id=gomodcache"
+    assert dockerfile.text().splitlines() == [
+        "FROM golang:1.21 AS deps",
+        "WORKDIR /src",
+        "COPY go.mod go.sum ./",
+        "RUN --mount=type=cache,target=/go/pkg/mod,id=gomodcache go mod download",
+        "",
+        "FROM deps AS build",
+        "COPY . .",
+        f"RUN {mounts} CGO_ENABLED=0 go build -o /out/server ./cmd",
+        "",
+        "FROM gcr.io/distroless/static-debian12",
+        "COPY --from=build /out/server /usr/local/bin/server",
+        'ENTRYPOINT ["/usr/local/bin/server"]',
+    ]
+    assert dockerfile.compose(tmp_path).dockerfile == "Dockerfile.server"
+    # copies from the build stage are not context sources
+    dockerfile.instructions[:] = [
+        i for i in dockerfile.instructions if getattr(i, "src", "") != "."
+    ]
+    assert dockerfile.sources() == ["go.mod", "go.sum"]
+
+
+def test_dockerfile_vendored_cgo(tmp_path):
+    (tmp_path / "vendor").mkdir()
+    target = GolangBinary(name="app", build=go.Build(source=["./cmd/app"]))
+    text = target.dockerfile(tmp_path, cgo=True, builder="golang:1.22").text()
+    assert "go mod download" not in text
+    assert "CGO_ENABLED=1 go build -o /out/app -mod vendor ./cmd/app" in text
+    assert "FROM gcr.io/distroless/base-debian12" in text
+
+    target.build.source = [tmp_path.parent]
+    with pytest.raises(ValueError, match="outside of the build context"):
+        target.dockerfile(tmp_path)
+
+
+def test_mod_skips_tidy_of_unchanged_module(tmp_path, monkeypatch):
+    module(tmp_path, monkeypatch)
+    tidy = base.Mod.tidy
+    runs = []
+
+    def counted(self, compat=""):
+        runs.append(compat)
+        return tidy(self, compat)
+
+    monkeypatch.setattr(base.Mod, "tidy", counted)
+    target = GolangMod(name="mod", path=tmp_path)
+    target.run()
+    target.run()
+    assert len(runs) == 1
+
+    # new imports change the fingerprint
+    (tmp_path / "app.go").write_text('package app\n\nimport "strings"\n\nvar _ = strings.ToUpper\n')
+    target.run()
+    target.run()
+    assert len(runs) == 2
+    target.fingerprint = False
+    target.run()
+    assert len(runs) == 3
+
+
+@pytest.mark.parametrize("gomod, modules, expected", [
+    ("module app\n", None, False),
+    ("module app\n", "", True),
+    ("module app\n\nrequire example.com/a v1.0.0\n", "# example.com/a v1.0.0\n", True),
+    ("module app\n\nrequire example.com/a v1.1.0\n", "# example.com/a v1.0.0\n", False),
+    (
+        "module app\n\nrequire (\n\texample.com/a v1.0.0 // indirect\n\texample.com/b v0.1.0\n)\n",
+        "# example.com/a v1.0.0\n## explicit\nexample.com/a\n# example.com/b v0.1.0\n",
+        True,
+    ),
+    (
+        "module app\n\nrequire (\n\texample.com/a v1.0.0\n\texample.com/b v0.1.0\n)\n",
+        "# example.com/a v1.0.0\n",
+        False,
+    ),
+])
+def test_mod_vendored(tmp_path, gomod, modules, expected):
+    (tmp_path / "go.mod").write_text(gomod)
+    if modules is not None:
+        (tmp_path / "vendor").mkdir()
+        (tmp_path / "vendor" / "modules.txt").write_text(modules)
+    assert GolangMod.vendored(tmp_path) is expected
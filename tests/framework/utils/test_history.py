@@ -0,0 +1,24 @@
+from umk import core
+from umk.framework.utils import History
+
+
+class Record(core.Model):
+    remote: str = core.Field(default="")
+
+
+def test_history_appends_and_loads(tmp_path):
+    history = History("usage", root=tmp_path)
+    assert history.load() == []
+    history.append(Record(remote="a"))
+    history.append({"remote": "b"})
+    with open(history.file, "a") as stream:
+        stream.write("{broken\n")
+    history.append({"remote": "c"})
+
+    assert [r["remote"] for r in history.load()] == ["a", "b", "c"]
+    assert [r["remote"] for r in history.load(limit=2)] == ["b", "c"]
+    assert all("time" in r for r in history.load())
+
+
+def test_history_is_kept_in_cache(cache):
+    assert History("usage").file == cache / "history" / "usage.jsonl"
@@ -0,0 +1,41 @@
+import math
+
+import pytest
+
+from umk.framework.utils import stats
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    ([], [1.0], 1.0),
+    ([1.0, 1.0], [1.0, 1.0], 1.0),
+    ([1.0, 2.0, 3.0], [4.0, 5.0, 6.0], 0.1),
+    ([4.0, 5.0, 6.0], [1.0, 2.0, 3.0], 0.1),
+    ([1.0, 3.0, 5.0], [2.0, 4.0, 6.0], 0.7),
+    ([1.0, 2.0, 3.0, 4.0, 5.0], [6.0, 7.0, 8.0, 9.0, 10.0], 2 / 252),
+    # ties: normal approximation with continuity correction
+    ([1.0, 1.0, 2.0], [2.0, 3.0, 3.0], 0.1101),
+])
+def test_mannwhitney(a, b, expected):
+    assert stats.mannwhitney(a, b) == pytest.approx(expected, abs=1e-4)
+
+
+def test_mannwhitney_large_samples():
+    a = [float(i) for i in range(40)]
+    assert stats.mannwhitney(a, a) == pytest.approx(1.0, abs=1e-2)
+    assert stats.mannwhitney(a, [v + 100 for v in a]) < 1e-6
+
+
+@pytest.mark.parametrize("values, level, expected", [
+    ([5.0], 0.95, (5.0, 5.0)),
+    ([3.0, 1.0, 2.0, 5.0, 4.0], 0.95, (1.0, 5.0)),
+    ([float(i) for i in range(10)], 0.95, (1.0, 8.0)),
+    ([float(i) for i in range(10)], 0.5, (3.0, 6.0)),
+    ([float(i) for i in range(20)], 0.95, (5.0, 14.0)),
+])
+def test_confidence(values, level, expected):
+    assert stats.confidence(values, level) == expected
+
+
+def test_empty():
+    assert all(math.isnan(v) for v in stats.confidence([]))
+    assert math.isnan(stats.median([]))
@@ -0,0 +1,54 @@
+import os
+import shutil
+from pathlib import Path
+
+from umk import runtime
+
+SAMPLE = Path(__file__).parents[2] / "docs" / "sample"
+
+
+def touch(file: Path, text: str):
+    stat = file.stat()
+    file.write_text(text)
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_reload_after_script_change(tmp_path):
+    shutil.copytree(SAMPLE, tmp_path, dirs_exist_ok=True)
+    options = runtime.Options(root=tmp_path / ".unimake")
+    container = runtime.Container()
+
+    container.load(options)
+    assert "server" in container.targets
+
+    script = tmp_path / ".unimake" / "project.py"
+    touch(script, script.read_text().replace('s.name = "server"', 's.name = "backend"'))
+    container.load(options)
+    assert "backend" in container.targets
+    assert "server" not in container.targets
+    assert [t.name for t in container.targets].count("deps.go") == 1
+
+
+def test_load_unchanged_keeps_instances(tmp_path):
+    shutil.copytree(SAMPLE, tmp_path, dirs_exist_ok=True)
+    options = runtime.Options(root=tmp_path / ".unimake")
+    container = runtime.Container()
+
+    container.load(options)
+    targets = container.targets
+    container.load(options)
+    assert container.targets is targets
+
+
+def test_reload_after_imported_script_change(tmp_path):
+    shutil.copytree(SAMPLE, tmp_path, dirs_exist_ok=True)
+    options = runtime.Options(root=tmp_path / ".unimake")
+    container = runtime.Container()
+
+    container.load(options)
+    assert container.targets.get("server").debug.port == 2345
+
+    script = tmp_path / ".unimake" / "config.py"
+    touch(script, script.read_text().replace("default=2345", "default=2346"))
+    container.load(options)
+    assert container.targets.get("server").debug.port == 2346
@@ -0,0 +1,23 @@
+from umk.framework.adapters import go
+from umk.framework.target.golang import GolangBinary
+from umk.framework.target.interface import Command
+from umk.runtime.targets import Targets
+
+
+def binary(tmp_path, name: str) -> GolangBinary:
+    return GolangBinary(name=name, build=go.Build(output=tmp_path / name, source=[f"./cmd/{name}"]))
+
+
+def test_batches_keep_declaration_order(tmp_path):
+    targets = Targets()
+    for item in (
+        binary(tmp_path, "api"),
+        Command(name="generate"),
+        binary(tmp_path, "worker"),
+        binary(tmp_path, "cli"),
+    ):
+        targets.items[item.name] = item
+
+    batches = targets.batches("api", "generate", "worker", "cli", "cli")
+    names = [[t.name for t in batch] for batch in batches]
+    assert names == [["api"], ["generate"], ["worker", "cli"]]
@@ -0,0 +1,214 @@
+import asyncio
+import json
+import os
+import signal
+import socket
+import sys
+import threading
+
+from umk import core
+from umk import runtime
+from umk.framework.filesystem import Path
+
+SOCKET = ".unimake/.cache/agent.sock"
+TRAILER = "\0umk:exit:"
+
+# Minimal agent client. It is executed by the remote python interpreter
+# ('python3 -c') and does not import umk at all: connects to the agent
+# socket, sends command line and streams the output back. If the agent
+# is not running, client starts it in background and executes command
+# as usual (cold run). Relative socket path is resolved like 'locate' does.
+CLIENT = f"""
+import json, os, socket, subprocess, sys
+path, argv = sys.argv[1], sys.argv[2:]
+root = os.getcwd()
+while not os.path.isdir(os.path.join(root, ".unimake")) and os.path.dirname(root) != root:
+    root = os.path.dirname(root)
+if not os.path.isdir(os.path.join(root, ".unimake")):
+    root = os.getcwd()
+path = os.path.join(root, path)
+try:
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.connect(path)
+except OSError:
+    try:
+        subprocess.Popen(
+            [argv[0], "agent", "serve", "--detach"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        pass
+    os.execvp(argv[0], argv)
+env = {{k: v for k, v in os.environ.items() if k.startswith("UMK_")}}
+conn.sendall((json.dumps({{"argv": argv[1:], "env": env}}) + "\\n").encode())
+trailer, keep, pending, out = {TRAILER!r}.encode(), 32, b"", sys.stdout.buffer
+while True:
+    chunk = conn.recv(65536)
+    if not chunk:
+        break
+    pending += chunk
+    if len(pending) > keep:
+        out.write(pending[:-keep])
+        out.flush()
+        pending = pending[-keep:]
+code, i = 1, pending.rfind(trailer)
+if i >= 0:
+    code, pending = int(pending[i + len(trailer):] or 1), pending[:i]
+out.write(pending)
+out.flush()
+sys.exit(code)
+"""
+
+
+def locate(path: str | Path = SOCKET) -> Path:
+    """
+    Resolves relative socket path against the project root: the nearest
+    directory with '.unimake' (the work directory if there is no one). The
+    client resolves it the same way, so they meet from any subdirectory.
+    """
+    path = Path(path).expanduser()
+    if path.is_absolute():
+        return path
+    for root in [core.globals.paths.work, *core.globals.paths.work.parents]:
+        if (root / ".unimake").is_dir():
+            return root / path
+    return core.globals.paths.work / path
+
+
+def command(path: str | Path, cmd: list[str]) -> list[str]:
+    """
+    Wraps 'umk ...' command line to be executed by the remote agent.
+    """
+    return ["python3", "-c", CLIENT, str(path)] + cmd
+
+
+class Server:
+    def __init__(self, path: Path):
+        self.path = Path(path).expanduser().resolve().absolute()
+        self.pid = self.path.with_suffix(".pid")
+
+    def stop(self) -> bool:
+        """
+        Terminate running agent. Returns False if there is no agent.
+        """
+        if not self.pid.exists():
+            return False
+        try:
+            os.kill(int(self.pid.read_text().strip()), signal.SIGTERM)
+        except (ValueError, ProcessLookupError):
+            return False
+        finally:
+            self.pid.unlink(missing_ok=True)
+        return True
+
+    def preload(self):
+        """
+        Load '.unimake' (it is reloaded only if scripts were changed).
+        """
+        try:
+            runtime.c.load(runtime.Options())
+        except Exception as err:
+            runtime.c.reset()
+            core.globals.log.warning(f"Agent: failed to preload '.unimake': {err}")
+
+    def serve(self):
+        self.path.unlink(missing_ok=True)
+        os.makedirs(self.path.parent, exist_ok=True)
+        self.preload()
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(self.path))
+        listener.listen()
+        self.pid.write_text(str(os.getpid()))
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        core.globals.console.print(f"[bold]Agent is listening on '{self.path}'")
+        try:
+            while True:
+                conn, _ = listener.accept()
+                # Fork from the main thread only (one at a time): locks held by other
+                # threads at the fork moment would stay locked in the child forever.
+                pid = self.fork(listener, conn)
+                if pid:
+                    threading.Thread(target=self.wait, args=(conn, pid), daemon=True).start()
+        finally:
+            listener.close()
+            self.path.unlink(missing_ok=True)
+            self.pid.unlink(missing_ok=True)
+
+    def fork(self, listener: socket.socket, conn: socket.socket) -> int:
+        """
+        Read the request and fork the command process. Returns child pid
+        (0 if the request is broken).
+        """
+        conn.settimeout(5)
+        try:
+            with conn.makefile("rb") as stream:
+                request = json.loads(stream.readline() or b"{}")
+        except (OSError, ValueError):
+            conn.close()
+            return 0
+        conn.settimeout(None)
+        self.preload()
+        pid = os.fork()
+        if pid == 0:
+            listener.close()
+            code = 1
+            try:
+                code = self.execute(conn, request)
+            finally:
+                os._exit(code)
+        return pid
+
+    @staticmethod
+    def wait(conn: socket.socket, pid: int):
+        """
+        Wait for the command process and send its exit code (waiting threads never fork).
+        """
+        with conn:
+            _, status = os.waitpid(pid, 0)
+            try:
+                conn.sendall(f"{TRAILER}{os.waitstatus_to_exitcode(status)}".encode())
+            except OSError:
+                pass
+
+    @staticmethod
+    def execute(conn: socket.socket, request: dict) -> int:
+        """
+        Executes command line within the forked (already loaded) agent process.
+        """
+        from umk.application import cmd
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        null = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(null, 0)
+        os.dup2(conn.fileno(), 1)
+        os.dup2(conn.fileno(), 2)
+        os.environ.update(request.get("env", {}))
+        argv = request.get("argv", [])
+        sys.argv = ["umk"] + argv
+        try:
+            asyncio.run(cmd.root.main(args=argv, prog_name="umk"))
+            code = 0
+        except SystemExit as err:
+            code = err.code if isinstance(err.code, int) else int(err.code is not None)
+        except Exception as err:
+            runtime.errors(err)
+            code = 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+        return code
+
+
+def detach():
+    """
+    Detach current process from the terminal (double fork).
+    """
+    if os.fork() > 0:
+        os._exit(0)
+    os.setsid()
+    if os.fork() > 0:
+        os._exit(0)
+    null = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(null, fd)
@@ -2,3 +2,4 @@ from .root import root
 from . import target
 from . import config
 from . import remote
+from . import agent
@@ -0,0 +1,30 @@
+import os
+
+import asyncclick
+
+from umk.application.cmd import root
+
+if not os.environ.get('_UMK_COMPLETE', None):
+    from umk import core
+    from umk.application import agent as server
+
+
+@root.group(help="Warm agent to execute forwarded commands")
+def agent():
+    pass
+
+
+@agent.command(help="Start agent with preloaded '.unimake'")
+@asyncclick.option('--socket', default="", help="Agent socket path")
+@asyncclick.option('--detach', is_flag=True, help="Run agent in background")
+def serve(socket: str, detach: bool):
+    if detach:
+        server.detach()
+    server.Server(server.locate(socket or server.SOCKET)).serve()
+
+
+@agent.command(help="Stop agent")
+@asyncclick.option('--socket', default="", help="Agent socket path")
+def stop(socket: str):
+    if not server.Server(server.locate(socket or server.SOCKET)).stop():
+        core.globals.console.print("[bold]Agent is not running")
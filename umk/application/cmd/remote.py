@@ -1,4 +1,6 @@
+import asyncio
 import os
+import time
 
 import asyncclick
 
@@ -13,10 +15,21 @@ if not os.environ.get('_UMK_COMPLETE', None):
 
 
 @root.group(help="Remote environments management commands",)
-@asyncclick.option('-n', default="", help="Remote environment name")
+@asyncclick.option(
+    '-n',
+    default="",
+    help="Remote environment name (comma separated names for build, up, down and login)",
+)
+@asyncclick.option(
+    '--all',
+    'every',
+    is_flag=True,
+    help="Apply build, up, down and login to all remote environments",
+)
 @utils.options.config.all
 @asyncclick.pass_context
-async def remote(ctx: asyncclick.Context, n: str, c: tuple[str], p: tuple[str], f: bool):
+async def remote(ctx: asyncclick.Context, n: str, every: bool, c: tuple[str], p: tuple[str],
+                 f: bool):
     pass
     opt = runtime.Options()
     opt.config = utils.config(f, p, c)
@@ -24,14 +37,63 @@ async def remote(ctx: asyncclick.Context, n: str, c: tuple[str], p: tuple[str],
 
     if ctx.invoked_subcommand != "ls":
         ctx.ensure_object(dict)
-        ctx.obj["instance"] = runtime.c.find_remote(n == "", n)
+        names = [name.strip() for name in n.split(",") if name.strip()]
+        if every:
+            instances = list(runtime.c.remotes)
+        elif len(names) > 1:
+            instances = [runtime.c.find_remote(False, name) for name in names]
+        else:
+            instances = [runtime.c.find_remote(n == "", n)]
+        if len(instances) > 1 and ctx.invoked_subcommand not in ("build", "up", "down", "login"):
+            core.globals.error_console.print(
+                f"Subcommand '{ctx.invoked_subcommand}' accepts single remote environment"
+            )
+            core.globals.close(-1)
+        ctx.obj["instances"] = instances
+        ctx.obj["instance"] = instances[0] if instances else None
+
+
+async def parallel(instances: list[Interface], action: str, **kwargs):
+    """
+    Run remote environment action concurrently and report per-remote timing.
+    """
+    if len(instances) == 1:
+        getattr(instances[0], action)(**kwargs)
+        return
+
+    async def one(instance: Interface) -> bool:
+        start = time.monotonic()
+        core.globals.console.print(f"[bold]\[{instance.name}] {action} started")
+        try:
+            await asyncio.to_thread(getattr(instance, action), **kwargs)
+        except Exception as err:
+            core.globals.console.print(
+                f"[bold red]\[{instance.name}] {action} failed "
+                f"in {time.monotonic() - start:.1f}s: {err}"
+            )
+            return False
+        core.globals.console.print(
+            f"[bold green]\[{instance.name}] {action} done in {time.monotonic() - start:.1f}s"
+        )
+        return True
+
+    start = time.monotonic()
+    results = await asyncio.gather(*[one(instance) for instance in instances])
+    core.globals.console.print(
+        f"[bold]{action}: {sum(results)}/{len(results)} remote environments "
+        f"in {time.monotonic() - start:.1f}s"
+    )
+    if not all(results):
+        core.globals.close(-1)
 
 
 @remote.command(help="Build remote environment")
+@asyncclick.option(
+    '--force', is_flag=True, help="Rebuild from scratch, even if nothing was changed"
+)
 @asyncclick.pass_context
-def build(ctx: asyncclick.Context):
-    instance: Interface = ctx.obj.get("instance")
-    instance.build()
+async def build(ctx: asyncclick.Context, force: bool):
+    await parallel(ctx.obj.get("instances"), "build", force=force)
 
 
 @remote.command(help="Destroy remote environment")
@@ -42,24 +104,43 @@ def destroy(ctx: asyncclick.Context):
 
 
 @remote.command(help="Start remote environment")
+@asyncclick.option('--wait', is_flag=True, default=None, help="Wait for the services readiness")
+@asyncclick.option('--timeout', type=float, default=None, help="Readiness timeout in seconds")
 @asyncclick.pass_context
-def up(ctx: asyncclick.Context):
-    instance: Interface = ctx.obj.get("instance")
-    instance.up()
+async def up(ctx: asyncclick.Context, wait: bool, timeout: float):
+    kwargs = {}
+    if wait:
+        kwargs["wait"] = True
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    await parallel(ctx.obj.get("instances"), "up", **kwargs)
 
 
 @remote.command(help="Stop remote environment")
 @asyncclick.pass_context
-def down(ctx: asyncclick.Context):
-    instance: Interface = ctx.obj.get("instance")
-    instance.down()
+async def down(ctx: asyncclick.Context):
+    await parallel(ctx.obj.get("instances"), "down")
 
 
 @remote.command(help="Login remote environment")
 @asyncclick.pass_context
-def login(ctx: asyncclick.Context):
+async def login(ctx: asyncclick.Context):
+    await parallel(ctx.obj.get("instances"), "login")
+
+
+@remote.command(help="Watch project files and sync them to remote environment")
+@asyncclick.pass_context
+def watch(ctx: asyncclick.Context):
+    instance: Interface = ctx.obj.get("instance")
+    instance.watch()
+
+
+@remote.command(help="Report remote environment caches size")
+@asyncclick.option('--prune', is_flag=True, help="Remove cache contents")
+@asyncclick.pass_context
+def cache(ctx: asyncclick.Context, prune: bool):
     instance: Interface = ctx.obj.get("instance")
-    instance.login()
+    instance.cache(prune=prune)
 
 
 @remote.command(help="Open remote environment shell")
@@ -94,7 +175,9 @@ def execute(ctx: asyncclick.Context, program: str, arguments: tuple[str]):
     cmd = list(arguments)
     cmd.insert(0, program)
     rem: Interface = ctx.obj.get("instance")
-    rem.execute(cmd=cmd)
+    code = rem.execute(cmd=cmd)
+    if isinstance(code, int) and code != 0:
+        core.globals.close(1)
 
 
 @remote.command(help='Show remote environment details')
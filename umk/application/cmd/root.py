@@ -18,13 +18,17 @@ async def root(r):
 
 @root.command(help="Run project targets")
 @utils.options.config.all
+@asyncclick.option(
+    '--affected-since', 'since', default="",
+    help="Run only targets (and packages) affected by git changes since the reference"
+)
 @asyncclick.argument('names', required=True, nargs=-1)
-def run(c: tuple[str], p: tuple[str], f: bool, names: tuple[str]):
+def run(c: tuple[str], p: tuple[str], f: bool, since: str, names: tuple[str]):
     opt = runtime.Options()
     opt.config = utils.config(f, p, c)
     runtime.c.load(opt)
     utils.forward(runtime.c)
-    runtime.c.targets.run(*names)
+    runtime.c.targets.run(*names, since=since)
 
 
 @root.command(name='inspect', help="Inspect project details")
@@ -65,6 +65,9 @@ if not state.complete:
 
     from umk import core
     from umk import runtime
+    from umk.application import agent
+    from umk.kit import remote
+    from umk.framework.utils import History
 
 
     def forward(container: runtime.Container):
@@ -75,8 +78,36 @@ if not state.complete:
         else:
             return
         umk.core.globals.console.print(f"[bold]Forward execution to '{re.name}' remote environment: '{' '.join(state.remote.cmd)}'")
-        re.execute(state.remote.cmd)
-        sys.exit(0)
+        targets = [t for t in container.targets if t.name in state.remote.cmd]
+        if isinstance(re, (remote.DockerPool, remote.SecureShellPool)) and targets:
+            # each target runs isolated in its own pool container (or host)
+            names = [t.name for t in targets]
+            base = [arg for arg in state.remote.cmd if arg not in names]
+            failed = re.dispatch(
+                jobs={t.name: base + [t.name] for t in targets},
+                outputs={t.name: t.outputs() for t in targets},
+            )
+            sys.exit(min(failed, 1))
+        re.push(root=core.globals.paths.work)
+        with re.sample() as usage:
+            if re.agent:
+                code = re.execute(agent.command(agent.SOCKET, state.remote.cmd))
+            else:
+                code = re.execute(state.remote.cmd)
+        if usage is not None:
+            umk.core.globals.console.print(f"[bold]\[{re.name}] {usage}")
+            History("usage").append({
+                "remote": re.name,
+                "targets": [t.name for t in targets],
+                "command": state.remote.cmd,
+                "usage": usage.model_dump(mode="json"),
+            })
+        outputs = []
+        for target in targets:
+            outputs += target.outputs()
+        re.pull(root=core.globals.paths.work, items=outputs)
+        # remotes report failures by exit status (or the number of failed jobs)
+        sys.exit(1 if isinstance(code, int) and code != 0 else 0)
 
     def config(file: bool, presets: tuple[str] | None = None, overrides: None | tuple[str] = None) -> runtime.Options.Config:
         result = runtime.Options.Config()
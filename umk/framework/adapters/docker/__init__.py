@@ -19,6 +19,9 @@ from python_on_whales import SystemInfo
 from python_on_whales import Task
 from python_on_whales import Volume
 
+# Build context
+from . import context
+
 # Dockerfile
 from .file import File
 from .file import Add as FileAdd
@@ -32,6 +35,7 @@ from .file import From as FileFrom
 from .file import Healthcheck as FileHealthcheck
 from .file import Label as FileLabel
 from .file import Maintainer as FileMaintainer
+from .file import Mount as FileMount
 from .file import OnBuild as FileOnBuild
 from .file import Run as FileRun
 from .file import Shell as FileShell
@@ -106,6 +110,7 @@ __all__ = [
     "FileHealthcheck",
     "FileLabel",
     "FileMaintainer",
+    "FileMount",
     "FileOnBuild",
     "FileRun",
     "FileShell",
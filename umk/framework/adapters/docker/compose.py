@@ -91,6 +91,15 @@ class Build(cli.NoEmpty):
         description="List of target platforms."
     )
 
+    @core.typeguard
+    def cache(self, path: Path | str, mode: str = "max"):
+        """
+        Import and export build cache from/to the local directory.
+        Note: cache export requires builder with 'docker-container' driver.
+        """
+        self.cache_from = [f"type=local,src={path}"]
+        self.cache_to = [f"type=local,dest={path},mode={mode}"]
+
     @core.field.serializer('args')
     def serialize_args(self, value: dict[str, str], _info):
         res = copy.deepcopy(value)
@@ -0,0 +1,128 @@
+import os
+import tarfile
+
+from umk import core
+from umk.framework import utils
+from umk.framework.filesystem import Path
+from umk.framework.filesystem.manifest import Manifest, Patterns
+
+BEGIN = "# umk:begin (generated by umk, do not edit this block)"
+END = "# umk:end"
+
+
+def _cache(root: Path) -> Path:
+    return core.globals.paths.cache / "docker" / f"context-{utils.digest(root.as_posix())[:16]}"
+
+
+@core.typeguard
+def manifest(root: Path) -> Manifest:
+    """
+    Returns manifest of the build context (respects context '.dockerignore').
+    Previous manifest is cached to avoid hashing unchanged files.
+    """
+    root = Path(root).expanduser().resolve().absolute()
+    cache = _cache(root).with_suffix(".json")
+    result = Manifest.scan(
+        root=root,
+        exclude=Patterns.load(root / ".dockerignore"),
+        previous=Manifest.load(cache),
+    )
+    result.save(cache)
+    return result
+
+
+@core.typeguard
+def size(root: Path, patterns: list[str]) -> int:
+    """
+    Returns size of the build context filtered by the given patterns.
+    """
+    return Manifest.scan(root=root, exclude=Patterns(*patterns), checksum=False).size()
+
+
+@core.typeguard
+def ignores(root: Path) -> tuple[list[str], list[str]]:
+    """
+    Returns (generated, user) lines of the context '.dockerignore'.
+    """
+    file = Path(root) / ".dockerignore"
+    if not file.exists():
+        return [], []
+    generated, user = [], []
+    block = False
+    with open(file, "r") as stream:
+        for line in stream.read().splitlines():
+            if line == BEGIN:
+                block = True
+            elif line == END:
+                block = False
+            elif block:
+                generated.append(line)
+            else:
+                user.append(line)
+    return generated, user
+
+
+@core.typeguard
+def minimize(root: Path, exclude: list[Path | str], sources: None | list[str]) -> tuple[int, int]:
+    """
+    Augment context '.dockerignore' by generated block: allow just the given
+    COPY/ADD sources (whole context if None) and ignore the given paths.
+    User lines are kept after the block, so they are take precedence.
+    Returns context size before and after.
+    """
+    root = Path(root).expanduser().resolve().absolute()
+    _, user = ignores(root)
+
+    generated = []
+    if sources is not None:
+        generated.append("*")
+        generated += [f"!{src}" for src in sources]
+    for path in exclude:
+        path = Path(path)
+        if path.is_absolute():
+            if not path.is_relative_to(root) or path == root:
+                continue
+            path = path.relative_to(root)
+        generated.append(path.as_posix())
+
+    before = size(root, user)
+    with open(root / ".dockerignore", "w") as stream:
+        stream.write("\n".join([BEGIN] + generated + [END] + user) + "\n")
+    after = size(root, generated + user)
+    return before, after
+
+
+@core.typeguard
+def archive(root: Path, dockerfile: str = "Dockerfile") -> Path:
+    """
+    Returns build context tarball (respects context '.dockerignore'). The
+    tarball is cached by context manifest digest and built once per content.
+    """
+    root = Path(root).expanduser().resolve().absolute()
+    content = manifest(root)
+    prefix = _cache(root)
+    result = prefix.parent / f"{prefix.name}-{content.digest()[:16]}.tar"
+    if result.exists():
+        return result
+    for old in prefix.parent.glob(f"{prefix.name}-*.tar"):
+        old.unlink()
+    os.makedirs(result.parent, exist_ok=True)
+    tmp = result.with_suffix(".tmp")
+    with tarfile.open(tmp, "w") as tar:
+        for path in content.entries:
+            tar.add(root / path, arcname=path, recursive=False)
+        # Dockerfile is sent even if it is ignored
+        for path in (dockerfile, ".dockerignore"):
+            if path not in content.entries and (root / path).exists():
+                tar.add(root / path, arcname=path, recursive=False)
+    tmp.rename(result)
+    return result
+
+
+def human(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} TB"
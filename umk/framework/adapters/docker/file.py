@@ -4,6 +4,9 @@ from datetime import timedelta
 
 from umk import core
 from umk.core.typings import TextIO, Optional, Any
+from umk.framework import utils
+from umk.framework.adapters.docker import compose
+from umk.framework.adapters.docker import context as ctx
 from umk.framework.system.user import User as OSUser
 from umk.framework.filesystem import Path
 
@@ -101,10 +104,13 @@ class Copy(Commentable):
     dst: str = ""
     chown: Optional[OSUser] = None
     chmod: Optional[int] = None
+    stage: Optional[str] = None
 
     def write(self, buffer: TextIO):
         super().write(buffer)
         text = "COPY"
+        if self.stage is not None:
+            text += f" --from={self.stage}"
         if self.chown is not None:
             text += f" --chown={self.chown.name}"
             if self.chown.group.name:
@@ -258,19 +264,97 @@ class OnBuild(Commentable):
         buffer.write(text)
 
 
+class Mount(core.Model):
+    """
+    BuildKit mount of the RUN instruction (RUN --mount=...).
+    """
+    type: str = "cache"
+    target: str
+    id: Optional[str] = None
+    sharing: Optional[str] = None
+    source: Optional[str] = None
+    stage: Optional[str] = None
+    mode: Optional[str] = None
+    uid: Optional[int] = None
+    gid: Optional[int] = None
+    readonly: Optional[bool] = None
+
+    def __str__(self):
+        text = f"--mount=type={self.type},target={self.target}"
+        if self.id:
+            text += f",id={self.id}"
+        if self.sharing:
+            text += f",sharing={self.sharing}"
+        if self.source:
+            text += f",source={self.source}"
+        if self.stage:
+            text += f",from={self.stage}"
+        if self.mode:
+            text += f",mode={self.mode}"
+        if self.uid is not None:
+            text += f",uid={self.uid}"
+        if self.gid is not None:
+            text += f",gid={self.gid}"
+        if self.readonly:
+            text += ",readonly"
+        return text
+
+    @staticmethod
+    def cache(target: str, id: None | str = None, sharing: None | str = None,
+              uid: None | int = None, gid: None | int = None) -> 'Mount':
+        return Mount(type="cache", target=target, id=id, sharing=sharing, uid=uid, gid=gid)
+
+    @staticmethod
+    def apt(uid: None | int = None, gid: None | int = None) -> list['Mount']:
+        """
+        Apt caches. Debian based images remove downloaded packages by the
+        '/etc/apt/apt.conf.d/docker-clean', remove it before to use cache.
+        """
+        return [
+            Mount.cache("/var/cache/apt", sharing="locked", uid=uid, gid=gid),
+            Mount.cache("/var/lib/apt", sharing="locked", uid=uid, gid=gid),
+        ]
+
+    @staticmethod
+    def pip(target: str = "/root/.cache/pip", uid: None | int = None,
+            gid: None | int = None) -> list['Mount']:
+        """
+        Pip cache (target must match pip cache directory).
+        """
+        return [Mount.cache(target, id="pip", uid=uid, gid=gid)]
+
+    @staticmethod
+    def gocache(target: str = "/root/.cache/go-build", uid: None | int = None,
+                gid: None | int = None) -> list['Mount']:
+        """
+        Golang build cache (target must match GOCACHE).
+        """
+        return [Mount.cache(target, id="gocache", uid=uid, gid=gid)]
+
+    @staticmethod
+    def gomodcache(target: str = "/go/pkg/mod", uid: None | int = None,
+                   gid: None | int = None) -> list['Mount']:
+        """
+        Golang modules cache (target must match GOMODCACHE).
+        """
+        return [Mount.cache(target, id="gomodcache", uid=uid, gid=gid)]
+
+
 class Run(Commentable):
     """
     Execute build commands.
     """
     commands: list[str] = core.Field(default_factory=list)
     separate: bool = core.Field(default=False)
+    mounts: list[Mount] = core.Field(default_factory=list)
 
     def write(self, buffer: TextIO):
         super().write(buffer)
+        run = " ".join(["RUN"] + [str(mount) for mount in self.mounts])
         if self.separate:
-            text = "\n".join([f"RUN {cmd}" for cmd in self.commands])
+            text = "\n".join([f"{run} {cmd}" for cmd in self.commands])
         else:
-            text = "RUN " + " && \\\n    ".join(self.commands) + "\n"
+            text = f"{run} " + " && \\\n    ".join(self.commands) + "\n"
         buffer.write(text)
 
 
@@ -409,6 +493,51 @@ class File(core.Model):
         self.write(buf)
         return buf.getvalue()
 
+    def sources(self) -> None | list[str]:
+        """
+        Build context paths used by COPY/ADD instructions (None if the whole context is used).
+        """
+        result = []
+        for instruction in self.instructions:
+            if not isinstance(instruction, (Add, Copy)):
+                continue
+            if isinstance(instruction, Copy) and instruction.stage is not None:
+                continue
+            for src in instruction.src.split():
+                if "://" in src or src.startswith("git@"):
+                    continue
+                src = os.path.normpath(src).replace(os.sep, "/").lstrip("/")
+                if src in (".", ""):
+                    return None
+                result.append(src)
+        return result
+
+    @core.typeguard
+    def digest(self, context: None | Path = None) -> str:
+        """
+        Digest of the Dockerfile text and the build context files.
+        """
+        chunks = [self.text()]
+        if context is not None:
+            chunks.append(ctx.manifest(context).digest())
+        return utils.digest(*chunks)
+
+    @core.typeguard
+    def tag(self, repository: str, context: None | Path = None) -> str:
+        """
+        Content addressed image tag: '<repository>:umk-<digest>'.
+        """
+        return f"{repository}:umk-{self.digest(context)[:16]}"
+
+    @core.typeguard
+    def compose(self, context: Path, target: None | str = None) -> compose.Build:
+        """
+        Compose service build section that builds this Dockerfile within the given context.
+        """
+        context = Path(context).expanduser().resolve().absolute()
+        dockerfile = os.path.relpath(self.file.expanduser().resolve().absolute(), context)
+        return compose.Build(context=context, dockerfile=Path(dockerfile).as_posix(), target=target)
+
     @core.typeguard
     def add(self, src: str, dst: str, chown: None | OSUser = None, chmod: None | int = None,
             checksum: None | str = None, *, space: int = 1, comment: list[str] = None):
@@ -427,9 +556,10 @@ class File(core.Model):
         self.instructions.append(instruction)
 
     @core.typeguard
-    def copy(self, src: str, dst: str, chown: None | OSUser = None, chmod: None | int = None, *, space: int = 1,
-             comment: list[str] = None):
-        instruction = Copy(comment=comment or [], space=space, src=src, dst=dst, chmod=chmod, chown=chown)
+    def copy(self, src: str, dst: str, chown: None | OSUser = None, chmod: None | int = None,
+             stage: None | str = None, *, space: int = 1, comment: list[str] = None):
+        instruction = Copy(comment=comment or [], space=space, src=src, dst=dst, chmod=chmod,
+                           chown=chown, stage=stage)
         self.instructions.append(instruction)
 
     @core.typeguard
@@ -493,8 +623,10 @@ class File(core.Model):
         self.instructions.append(inst)
 
     @core.typeguard
-    def run(self, commands: list[str], separate: bool = False, *, space: int = 1, comment: list[str] = None):
-        instruction = Run(comment=comment or [], separate=separate, space=space, commands=commands)
+    def run(self, commands: list[str], separate: bool = False, mounts: None | list[Mount] = None,
+            *, space: int = 1, comment: list[str] = None):
+        instruction = Run(comment=comment or [], separate=separate, space=space, commands=commands,
+                          mounts=mounts or [])
         self.instructions.append(instruction)
 
     @core.typeguard
@@ -15,3 +15,16 @@ def tag(repo: Repository, on_error: str) -> str:
 @core.typeguard
 def repository(root: Path = core.globals.paths.work):
     return Repository(root)
+
+
+@core.typeguard
+def changes(repo: Repository, since: str) -> list[Path]:
+    """
+    Files changed since the merge base with the given reference: committed,
+    staged, unstaged and untracked ones (absolute paths).
+    """
+    base = repo.merge_base(since, "HEAD")
+    base = base[0].hexsha if base else since
+    names = repo.git.diff("--name-only", base).splitlines() + repo.untracked_files
+    root = Path(repo.working_tree_dir)
+    return [root / name for name in dict.fromkeys(names) if name]
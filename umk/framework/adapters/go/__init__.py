@@ -1,2 +1,11 @@
 from .base import BuildOptions as Build
 from .base import Go
+from .proxy import Proxy
+from .proxy import Module
+from .packages import Package
+from .packages import Packages
+from .toolexec import Profile
+from .testjson import Benchmark
+from .testjson import Stream as TestStream
+from .coverage import Coverage
+from .symbols import Symbols
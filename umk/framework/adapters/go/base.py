@@ -1,9 +1,15 @@
 import copy
+import os
 
 from umk import core
 from umk.framework.utils import cli
+from umk.framework.adapters import git
 from umk.framework.filesystem import Path, AnyPath
-from umk.framework.system.shell import Shell
+from umk.framework.adapters.go.packages import Packages
+from umk.framework.adapters.go.proxy import Proxy
+from umk.framework.adapters.go.symbols import Symbols
+from umk.framework.system.environs import Environs
+from umk.framework.system.shell import Fetch, Shell
 
 
 class BuildOptions(cli.Options):
@@ -219,7 +225,7 @@ class BuildOptions(cli.Options):
     )
     toolexec: list[str] = core.Field(
         default_factory=list,
-        cli=cli.List(name="-toolexec"),
+        cli=cli.List(name="-toolexec", equal="="),
         description="A program to use to invoke toolchain programs like vet and asm.For example, instead of running asm, the go command will run'cmd args /path/to/asm <arguments for asm>'.The TOOLEXEC_IMPORTPATH environment variable will be set,matching 'go list -f {{.ImportPath}}' for the package being built."
     )
     source: list[str | Path] = core.Field(
@@ -254,6 +260,15 @@ class Mod(Command):
             shell.cmd.append(f"-o={out}")
         return shell
 
+    @core.typeguard
+    def download(self, *modules: str, json: bool = False) -> Shell:
+        shell = self.shell
+        shell.cmd += ["mod", "download"]
+        if json:
+            shell.cmd.append("-json")
+        shell.cmd += list(modules)
+        return shell
+
 
 class Go:
     @property
@@ -274,9 +289,117 @@ class Go:
         result.shell = copy.deepcopy(self._shell)
         return result
 
-    def build(self, options: BuildOptions):
+    def offline(self, proxy: Path):
+        """
+        Resolve modules from the local file based proxy only (no network access).
+        """
+        env = Environs(**(self._shell.environs or {}))
+        env.update(Proxy(root=proxy).environs(env.get("GOFLAGS", "")))
+        self._shell.environs = env
+
+    def command(self, *args: str | Path) -> Shell:
+        """
+        Arbitrary go command ('go <args...>') with the tool shell settings.
+        """
+        shell = copy.deepcopy(self._shell)
+        shell.cmd += list(args)
+        return shell
+
+    def version(self) -> str:
+        """
+        Go toolchain version (e.g. 'go1.22.2'), empty string if go is unavailable.
+        """
+        shell = copy.deepcopy(self._shell)
+        shell.cmd += ["env", "GOVERSION"]
+        shell.handler = Fetch()
+        if shell.sync(log=False) != 0:
+            return ""
+        return shell.handler.outstr().strip()
+
+    @core.typeguard
+    def list(self, *patterns: str, deps: bool = False, json: bool = False,
+             errors: bool = False) -> Shell:
+        shell = copy.deepcopy(self._shell)
+        shell.cmd.append("list")
+        if deps:
+            shell.cmd.append("-deps")
+        if json:
+            shell.cmd.append("-json")
+        if errors:
+            shell.cmd.append("-e")
+        shell.cmd += list(patterns) or ["./..."]
+        return shell
+
+    @core.typeguard
+    def packages(self, root: Path, *patterns: str) -> None | Packages:
+        """
+        Returns 'go list -deps -json' packages of the module. Result is cached
+        until go files, go.mod/go.sum or the toolchain version are changed.
+        """
+        patterns = patterns or ("./...",)
+        env = self._shell.environs or os.environ
+        names = ("GOOS", "GOARCH", "GOFLAGS", "CGO_ENABLED")
+        key = Packages.fingerprint(
+            root, self.version(), *self._shell.cmd, *patterns,
+            *[f"{name}={env.get(name, '')}" for name in names]
+        )
+        file = Packages.cache(root, *patterns)
+        result = Packages.load(file, key)
+        if result is not None:
+            return result
+        shell = self.list(*patterns, deps=True, json=True, errors=True)
+        shell.workdir = root
+        shell.handler = Fetch()
+        if shell.sync(log=False) != 0:
+            return None
+        result = Packages.parse(shell.handler.outstr())
+        result.key = key
+        result.save(file)
+        return result
+
+    @core.typeguard
+    def affected(self, root: Path, since: str, *patterns: str) -> None | set[str]:
+        """
+        Main module packages affected by the git changes since the given
+        reference. None means that everything has to be considered affected.
+        """
+        packages = self.packages(root, *patterns)
+        if packages is None:
+            return None
+        try:
+            files = git.changes(git.repository(root), since)
+        except Exception as err:
+            core.globals.log.warning(f"Failed to get git changes since '{since}': {err}")
+            return None
+        unimake = Path(core.globals.paths.unimake).resolve().absolute()
+        files = [Path(f).resolve().absolute() for f in files]
+        return packages.affected([f for f in files if not f.is_relative_to(unimake)])
+
+    @core.typeguard
+    def symbols(self, binary: Path) -> None | Symbols:
+        """
+        Symbols of the binary with sizes ('go tool nm -size -sort size'). Returns
+        None if the symbol table is missing (binary is linked with '-s').
+        """
+        shell = self.command("tool", "nm", "-size", "-sort", "size", binary)
+        shell.handler = Fetch()
+        if shell.sync(log=False) != 0:
+            return None
+        result = Symbols.parse(shell.handler.outstr())
+        return result if result.items else None
+
+    def build(self, options: BuildOptions, outdir: None | Path = None) -> None | int:
+        """
+        Build packages. If 'outdir' is given, options output is replaced by
+        the directory and every main package binary is written into it.
+        """
+        if outdir is not None:
+            options = copy.deepcopy(options)
+            options.output = None
         opt = options.serialize()
         shell = copy.deepcopy(self._shell)
         shell.cmd.append("build")
+        if outdir is not None:
+            shell.cmd += ["-o", Path(outdir).as_posix().rstrip("/") + "/"]
         shell.cmd += opt
-        shell.sync()
+        return shell.sync()
@@ -0,0 +1,108 @@
+import math
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from umk import core
+from umk.framework.filesystem import Path
+from umk.framework.system.shell import Fetch
+
+PERCENT = re.compile(r"^\s*(\S+)\s+coverage:\s+([\d.]+)% of statements")
+
+
+class Coverage(core.Model):
+    root: Path = core.Field(
+        default_factory=lambda: core.globals.paths.cache / "go" / "cover",
+        description="Directory of the coverage runs ('GOCOVERDIR' of each run) and merged data"
+    )
+
+    def run(self, name: str = "") -> Path:
+        """
+        Create new empty coverage directory for a single run.
+        """
+        result = Path(self.root) / "runs" / f"{time.time_ns()}-{name}".rstrip("-")
+        os.makedirs(result)
+        return result
+
+    def runs(self) -> list[Path]:
+        """
+        Run directories with coverage data.
+        """
+        directory = Path(self.root) / "runs"
+        if not directory.exists():
+            return []
+        return [d for d in sorted(directory.iterdir()) if d.is_dir() and any(d.iterdir())]
+
+    def clean(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def merge(self, tool, dirs: list[Path], output: Path, jobs: None | int = None) -> bool:
+        """
+        Merge coverage directories with 'go tool covdata merge'. Many directories
+        are merged by chunks in parallel first, then partial results together.
+        """
+        jobs = jobs or os.cpu_count() or 1
+        shutil.rmtree(output, ignore_errors=True)
+        os.makedirs(output)
+        if len(dirs) <= 2 or jobs == 1:
+            return self._merge(tool, dirs, output)
+        size = math.ceil(len(dirs) / min(jobs, math.ceil(len(dirs) / 2)))
+        chunks = [dirs[i:i + size] for i in range(0, len(dirs), size)]
+        partials = [Path(self.root) / "partial" / str(i) for i in range(len(chunks))]
+        for partial in partials:
+            shutil.rmtree(partial, ignore_errors=True)
+            os.makedirs(partial)
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            done = list(executor.map(lambda item: self._merge(tool, *item), zip(chunks, partials)))
+        return all(done) and self._merge(tool, partials, output)
+
+    @staticmethod
+    def _merge(tool, dirs: list[Path], output: Path) -> bool:
+        inputs = ','.join(str(d) for d in dirs)
+        shell = tool.command("tool", "covdata", "merge", f"-i={inputs}", f"-o={output}")
+        return shell.sync() == 0
+
+    @staticmethod
+    def percent(tool, directory: Path) -> dict[str, float]:
+        """
+        Statements coverage percent by package.
+        """
+        shell = tool.command("tool", "covdata", "percent", f"-i={directory}")
+        shell.handler = Fetch()
+        shell.sync()
+        result = {}
+        for line in shell.handler.outstr().splitlines():
+            found = PERCENT.match(line)
+            if found:
+                result[found.group(1)] = float(found.group(2))
+        return result
+
+    @staticmethod
+    def textfmt(tool, directory: Path, output: Path) -> bool:
+        """
+        Convert coverage data to the legacy text profile ('-coverprofile' format).
+        """
+        os.makedirs(Path(output).parent, exist_ok=True)
+        shell = tool.command("tool", "covdata", "textfmt", f"-i={directory}", f"-o={output}")
+        return shell.sync() == 0
+
+    @staticmethod
+    def total(profile: Path) -> float:
+        """
+        Total statements coverage percent of the text profile.
+        """
+        statements = covered = 0
+        if not Path(profile).exists():
+            return 0.0
+        with open(profile, "r") as stream:
+            for line in stream:
+                if line.startswith("mode:"):
+                    continue
+                parts = line.split()
+                if len(parts) != 3:
+                    continue
+                statements += int(parts[1])
+                covered += int(parts[1]) if int(parts[2]) > 0 else 0
+        return 100.0 * covered / statements if statements else 0.0
@@ -0,0 +1,260 @@
+import json
+import os
+
+from umk import core
+from umk.core.typings import Any
+from umk.framework import utils
+from umk.framework.filesystem import Path
+from umk.framework.adapters.go.stream import objects
+
+
+class Package(core.Model):
+    path: str = core.Field(
+        default="",
+        alias="ImportPath",
+        description="Package import path"
+    )
+    dir: str = core.Field(
+        default="",
+        alias="Dir",
+        description="Package directory"
+    )
+    name: str = core.Field(
+        default="",
+        alias="Name",
+        description="Package name"
+    )
+    standard: bool = core.Field(
+        default=False,
+        alias="Standard",
+        description="Standard library package"
+    )
+    module: None | dict[str, Any] = core.Field(
+        default=None,
+        alias="Module",
+        description="Package module info"
+    )
+    files: list[str] = core.Field(
+        default_factory=list,
+        alias="GoFiles",
+        description="Go source files"
+    )
+    cgo: list[str] = core.Field(
+        default_factory=list,
+        alias="CgoFiles",
+        description="Go sources importing 'C'"
+    )
+    tests: list[str] = core.Field(
+        default_factory=list,
+        alias="TestGoFiles",
+        description="Package test files"
+    )
+    xtests: list[str] = core.Field(
+        default_factory=list,
+        alias="XTestGoFiles",
+        description="External test files"
+    )
+    imports: list[str] = core.Field(
+        default_factory=list,
+        alias="Imports",
+        description="Imported packages"
+    )
+    timports: list[str] = core.Field(
+        default_factory=list,
+        alias="TestImports",
+        description="Test imports"
+    )
+    ximports: list[str] = core.Field(
+        default_factory=list,
+        alias="XTestImports",
+        description="External test imports"
+    )
+    deps: list[str] = core.Field(
+        default_factory=list,
+        alias="Deps",
+        description="Transitive dependencies"
+    )
+    deponly: bool = core.Field(
+        default=False,
+        alias="DepOnly",
+        description="Package is only a dependency of the listed ones"
+    )
+    error: None | dict[str, Any] = core.Field(
+        default=None,
+        alias="Error",
+        description="Package loading error"
+    )
+
+    @property
+    def main(self) -> bool:
+        """
+        Whether the package belongs to the main module.
+        """
+        return bool(self.module and self.module.get("Main"))
+
+    @property
+    def testable(self) -> bool:
+        return bool(self.tests or self.xtests)
+
+    def sources(self) -> list[Path]:
+        return [Path(self.dir) / f for f in self.files + self.cgo + self.tests + self.xtests]
+
+    def digest(self, data: bool = True) -> str:
+        """
+        Digest of the package source files contents (and 'testdata' if 'data').
+        """
+        files = self.sources()
+        testdata = Path(self.dir) / "testdata"
+        if data and testdata.is_dir():
+            for directory, dirs, names in os.walk(testdata):
+                dirs.sort()
+                files += [Path(directory) / name for name in sorted(names)]
+        return utils.digest(*[f"{f}:{utils.digest(f.read_bytes())}" for f in files if f.is_file()])
+
+
+class Packages(core.Model):
+    key: str = core.Field(
+        default="",
+        description="Fingerprint of the sources the packages were listed from"
+    )
+    items: list[Package] = core.Field(
+        default_factory=list,
+        description="Listed packages ('go list -deps -json')"
+    )
+
+    @staticmethod
+    def parse(text: str) -> 'Packages':
+        return Packages(items=[Package.model_validate(obj) for obj in objects(text)])
+
+    @staticmethod
+    def fingerprint(root: Path, *chunks: str) -> str:
+        """
+        Cheap fingerprint of the module sources (go files, go.mod, go.sum,
+        vendor/modules.txt): paths, sizes and modification times only.
+        """
+        root = Path(root).expanduser().resolve().absolute()
+        entries = []
+        for directory, dirs, files in os.walk(root):
+            dirs[:] = sorted(
+                d for d in dirs if not d.startswith((".", "_")) and d not in ("testdata", "vendor")
+            )
+            for name in sorted(files):
+                if not name.endswith(".go") and name not in ("go.mod", "go.sum", "go.work"):
+                    continue
+                stat = os.stat(os.path.join(directory, name))
+                entries.append(f"{os.path.join(directory, name)}:{stat.st_size}:{stat.st_mtime_ns}")
+        modules = root / "vendor" / "modules.txt"
+        if modules.exists():
+            entries.append(f"{modules}:{modules.stat().st_mtime_ns}")
+        return utils.digest(*chunks, *entries)
+
+    @staticmethod
+    def cache(root: Path, *patterns: str) -> Path:
+        name = utils.digest(str(Path(root).expanduser().resolve().absolute()), *patterns)
+        return core.globals.paths.cache / "go" / "list" / f"{name[:16]}.json"
+
+    @staticmethod
+    def load(file: Path, key: str) -> 'None | Packages':
+        """
+        Load cached packages, returns None if cache is missing or outdated.
+        """
+        if not file.exists():
+            return None
+        try:
+            with open(file, "r") as stream:
+                data = json.load(stream)
+            items = [Package.model_validate(p) for p in data["items"]]
+            result = Packages(key=data["key"], items=items)
+        except (ValueError, KeyError, TypeError, core.ValidationError):
+            return None
+        return result if result.key == key else None
+
+    def save(self, file: Path):
+        os.makedirs(file.parent, exist_ok=True)
+        with open(file, "w") as stream:
+            items = [p.model_dump(by_alias=True) for p in self.items]
+            json.dump({"key": self.key, "items": items}, stream)
+
+    def main(self) -> list[Package]:
+        """
+        Packages of the main module (dependencies are omitted).
+        """
+        return [p for p in self.items if p.main]
+
+    def listed(self) -> list[Package]:
+        """
+        Main module packages matched by the patterns (not dependencies only).
+        """
+        return [p for p in self.main() if not p.deponly]
+
+    def fingerprints(self, *chunks: str) -> dict[str, str]:
+        """
+        Fingerprint of the main module packages: own sources, main module
+        dependencies sources and versions of the other modules dependencies.
+        """
+        own = {p.path: p.digest() for p in self.main()}
+        versions = {
+            p.path: f"{p.module.get('Path')}@{p.module.get('Version', '')}"
+            for p in self.items if p.module and not p.main
+        }
+        index = {p.path: p for p in self.items}
+        result = {}
+        for package in self.main():
+            names = set(package.deps + package.timports + package.ximports)
+            for name in package.timports + package.ximports:
+                if name in index:
+                    names.update(index[name].deps)
+            deps = [f"{d}:{own.get(d) or versions.get(d, '')}" for d in sorted(names)]
+            result[package.path] = utils.digest(*chunks, own[package.path], *deps)
+        return result
+
+    def dependents(self) -> dict[str, set[str]]:
+        """
+        Reverse dependency index of the main module: package -> importers.
+        """
+        result: dict[str, set[str]] = {}
+        for package in self.main():
+            for name in package.imports:
+                result.setdefault(name, set()).add(package.path)
+        return result
+
+    def affected(self, files: list[Path]) -> None | set[str]:
+        """
+        Main module packages affected by the changed files: packages containing
+        them, their importers (transitively) and packages whose tests import any
+        of these. None means everything is affected (module files are changed).
+        """
+        dirs = {Path(p.dir): p.path for p in self.main()}
+        changed = set()
+        for file in files:
+            if file.name in ("go.mod", "go.sum", "go.work") or "vendor" in file.parts:
+                return None
+            for parent in file.parents:
+                if parent in dirs:
+                    changed.add(dirs[parent])
+                    break
+        dependents = self.dependents()
+        result = set()
+        queue = list(changed)
+        while queue:
+            name = queue.pop()
+            if name in result:
+                continue
+            result.add(name)
+            queue.extend(dependents.get(name, ()))
+        for package in self.main():
+            if result.intersection(package.timports + package.ximports):
+                result.add(package.path)
+        return result
+
+    def imports(self, tests: bool = True) -> set[str]:
+        """
+        Packages imported by the main module (except the main module ones).
+        """
+        own = {p.path for p in self.main()}
+        result = set()
+        for package in self.main():
+            result.update(package.imports)
+            if tests:
+                result.update(package.timports + package.ximports)
+        return result - own
@@ -0,0 +1,87 @@
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+from umk import core
+from umk.framework.filesystem import Path
+from umk.framework.adapters.go.stream import objects
+
+
+def escape(path: str) -> str:
+    """
+    Module path escaping of the module proxy protocol ('A' -> '!a').
+    """
+    return "".join(f"!{c.lower()}" if c.isupper() else c for c in path)
+
+
+class Module(core.Model):
+    path: str = core.Field(default="", alias="Path", description="Module path")
+    version: str = core.Field(default="", alias="Version", description="Module version")
+    info: str = core.Field(default="", alias="Info", description="Cached '.info' file")
+    gomod: str = core.Field(default="", alias="GoMod", description="Cached '.mod' file")
+    zip: str = core.Field(default="", alias="Zip", description="Cached '.zip' file")
+    error: str = core.Field(default="", alias="Error", description="Download error")
+
+    @staticmethod
+    def parse(text: str) -> list['Module']:
+        """
+        Parse 'go mod download -json' output (stream of JSON objects).
+        """
+        return [Module.model_validate(obj) for obj in objects(text)]
+
+
+class Proxy(core.Model):
+    root: Path = core.Field(
+        default_factory=lambda: core.globals.paths.cache / "goproxy",
+        description="File based GOPROXY directory"
+    )
+
+    @property
+    def url(self) -> str:
+        return "file://" + Path(self.root).expanduser().resolve().absolute().as_posix()
+
+    def environs(self, flags: str = "") -> dict[str, str]:
+        """
+        Environment variables to resolve modules from this proxy only.
+        '-mod=mod' is appended to the given (current) GOFLAGS.
+        """
+        if "-mod=mod" not in flags.split():
+            flags = f"{flags} -mod=mod".strip()
+        return {"GOPROXY": self.url, "GOFLAGS": flags, "GOSUMDB": "off"}
+
+    def populate(self, modules: list[Module], jobs: None | int = None) -> tuple[int, int]:
+        """
+        Copy downloaded modules (from GOMODCACHE) to the proxy in parallel.
+        Modules are deduplicated and already mirrored files are skipped.
+        Returns numbers of copied and skipped files.
+        """
+        copies: dict[Path, Path] = {}
+        versions: dict[str, set[str]] = {}
+        for module in modules:
+            if module.error or not module.version:
+                continue
+            directory = Path(self.root) / escape(module.path) / "@v"
+            versions.setdefault(escape(module.path), set()).add(module.version)
+            for src, suffix in ((module.info, "info"), (module.gomod, "mod"), (module.zip, "zip")):
+                if src:
+                    copies[directory / f"{escape(module.version)}.{suffix}"] = Path(src)
+
+        def copy(item: tuple[Path, Path]) -> bool:
+            dst, src = item
+            if dst.exists() and dst.stat().st_size == src.stat().st_size:
+                return False
+            os.makedirs(dst.parent, exist_ok=True)
+            tmp = dst.with_name(dst.name + ".tmp")
+            shutil.copyfile(src, tmp)
+            os.replace(tmp, dst)
+            return True
+
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as executor:
+            copied = sum(executor.map(copy, copies.items()))
+
+        for module, found in versions.items():
+            listing = Path(self.root) / module / "@v" / "list"
+            known = set(listing.read_text().split()) if listing.exists() else set()
+            if not found <= known:
+                listing.write_text("\n".join(sorted(known | found)) + "\n")
+        return copied, len(copies) - copied
@@ -0,0 +1,19 @@
+import json
+
+from umk.core.typings import Any
+
+
+def objects(text: str) -> list[dict[str, Any]]:
+    """
+    Decode concatenated JSON objects ('go list -json', 'go mod download -json').
+    """
+    result = []
+    decoder = json.JSONDecoder()
+    i = 0
+    while True:
+        while i < len(text) and text[i].isspace():
+            i += 1
+        if i >= len(text):
+            return result
+        obj, i = decoder.raw_decode(text, i)
+        result.append(obj)
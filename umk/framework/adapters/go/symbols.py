@@ -0,0 +1,91 @@
+import re
+
+from umk import core
+
+# 'go tool nm -size' line: address (absent for undefined symbols), size, type, name
+LINE = re.compile(r"^\s*(?:([0-9a-fA-F]+)\s+)?(\d+)\s+(\S)\s+(.+)$")
+
+
+def package(name: str) -> str:
+    """
+    Package of the symbol name: 'github.com/a/b.(*T).M' -> 'github.com/a/b'.
+    Linker generated symbols ('go:buildid', 'go:string.*', ...) are grouped
+    by the prefix, type descriptors are attributed to the type package (the
+    builtin and anonymous ones are grouped as 'type:').
+    """
+    if name.startswith("go:"):
+        return name.split(".", 1)[0]
+    stripped = name.removeprefix("type:").lstrip("*[]0123456789")
+    stripped = stripped.split("[", 1)[0]
+    slash = stripped.rfind("/")
+    dot = stripped.find(".", slash + 1)
+    if dot > 0:
+        return stripped[:dot]
+    return "type:" if name.startswith("type:") else stripped
+
+
+class Symbol(core.Model):
+    address: str = core.Field(default="", description="Symbol address (hex)")
+    size: int = core.Field(default=0, description="Symbol size in bytes")
+    type: str = core.Field(
+        default="",
+        description="Symbol type (T text, R read-only data, D data, B bss, ...)"
+    )
+    name: str = core.Field(default="", description="Symbol name")
+
+    @property
+    def package(self) -> str:
+        return package(self.name)
+
+
+class Symbols(core.Model):
+    items: list[Symbol] = core.Field(
+        default_factory=list,
+        description="Defined symbols ('go tool nm -size -sort size'), the largest first"
+    )
+
+    @staticmethod
+    def parse(text: str) -> 'Symbols':
+        result = Symbols()
+        for line in text.splitlines():
+            found = LINE.match(line)
+            if not found or found.group(3) in "Uu":
+                continue
+            result.items.append(Symbol(
+                address=found.group(1) or "",
+                size=int(found.group(2)),
+                type=found.group(3),
+                name=found.group(4).strip(),
+            ))
+        result.items.sort(key=lambda s: s.size, reverse=True)
+        return result
+
+    def stored(self) -> list[Symbol]:
+        """
+        Symbols taking space in the file (BSS is allocated at runtime).
+        """
+        return [s for s in self.items if s.type not in "Bb"]
+
+    @property
+    def total(self) -> int:
+        return sum(s.size for s in self.stored())
+
+    def packages(self) -> dict[str, int]:
+        """
+        Total symbols size by package (the largest first).
+        """
+        result: dict[str, int] = {}
+        for symbol in self.stored():
+            result[symbol.package] = result.get(symbol.package, 0) + symbol.size
+        return dict(sorted(result.items(), key=lambda item: item[1], reverse=True))
+
+    def top(self, count: int) -> dict[str, int]:
+        """
+        The largest symbols sizes by name.
+        """
+        result: dict[str, int] = {}
+        for symbol in self.stored():
+            if len(result) >= count and symbol.name not in result:
+                break
+            result[symbol.name] = result.get(symbol.name, 0) + symbol.size
+        return result
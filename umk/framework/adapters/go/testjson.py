@@ -0,0 +1,111 @@
+import json
+import re
+
+from umk import core
+from umk.framework.system.shell import Handler
+
+BENCHMARK = re.compile(r"^(Benchmark\S+)\s+(\d+)\s+(.+)$")
+METRIC = re.compile(r"([-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)\s+(\S+)")
+
+
+class Event(core.Model):
+    time: str = core.Field(default="", alias="Time", description="Event time")
+    action: str = core.Field(
+        default="",
+        alias="Action",
+        description="run, pause, cont, pass, bench, fail, output, skip"
+    )
+    package: str = core.Field(default="", alias="Package", description="Package import path")
+    test: str = core.Field(default="", alias="Test", description="Test name")
+    elapsed: None | float = core.Field(default=None, alias="Elapsed", description="Seconds")
+    output: str = core.Field(default="", alias="Output", description="Output text")
+
+
+class Benchmark(core.Model):
+    package: str = core.Field(default="", description="Package import path")
+    name: str = core.Field(default="", description="Benchmark name (with GOMAXPROCS suffix)")
+    iterations: int = core.Field(default=0, description="Number of iterations")
+    metrics: dict[str, float] = core.Field(
+        default_factory=dict,
+        description="Values by unit (ns/op, B/op, ...)"
+    )
+
+    @property
+    def key(self) -> str:
+        return f"{self.package}.{self.name}"
+
+    @staticmethod
+    def parse(package: str, line: str) -> 'None | Benchmark':
+        found = BENCHMARK.match(line.strip())
+        if not found:
+            return None
+        metrics = {unit: float(value) for value, unit in METRIC.findall(found.group(3))}
+        if not metrics:
+            return None
+        return Benchmark(
+            package=package, name=found.group(1), iterations=int(found.group(2)), metrics=metrics
+        )
+
+
+class Package(core.Model):
+    action: str = core.Field(default="", description="Final package action (pass, fail, skip)")
+    elapsed: float = core.Field(default=0.0, description="Package tests duration in seconds")
+    cached: bool = core.Field(
+        default=False,
+        description="Result was reported from the go test cache"
+    )
+    failed: list[str] = core.Field(default_factory=list, description="Failed tests")
+    output: list[str] = core.Field(default_factory=list, description="Package output")
+
+
+class Stream(Handler):
+    """
+    Shell handler parses 'go test -json' events as they are printed.
+    """
+
+    def __init__(self, echo: bool = False):
+        self.echo = echo
+        self.packages: dict[str, Package] = {}
+        self.benchmarks: list[Benchmark] = []
+        self.errors: list[str] = []
+        self._pending: dict[str, str] = {}
+
+    def on_output(self, text: str):
+        try:
+            event = Event.model_validate(json.loads(text))
+        except (ValueError, core.ValidationError):
+            self.errors.append(text)
+            return
+        self.event(event)
+
+    def on_error(self, text: str):
+        self.errors.append(text)
+
+    def on_exception(self, exc: Exception):
+        self.errors.append(str(exc))
+
+    def event(self, event: Event):
+        package = self.packages.setdefault(event.package, Package())
+        if event.action == "output":
+            package.output.append(event.output)
+            if self.echo:
+                core.globals.console.out(event.output, end="", highlight=False)
+            # Benchmark result may be split into several output events
+            text = self._pending.get(event.package, "") + event.output
+            *lines, self._pending[event.package] = text.split("\n")
+            for line in lines:
+                bench = Benchmark.parse(event.package, line)
+                if bench:
+                    self.benchmarks.append(bench)
+                elif line.startswith("ok") and "(cached)" in line:
+                    package.cached = True
+        elif event.action in ("pass", "fail", "skip"):
+            if event.test:
+                if event.action == "fail":
+                    package.failed.append(event.test)
+            else:
+                package.action = event.action
+                package.elapsed = event.elapsed or 0.0
+
+    def failed(self) -> list[str]:
+        return [name for name, package in self.packages.items() if package.action == "fail"]
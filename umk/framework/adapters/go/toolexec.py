@@ -0,0 +1,155 @@
+import json
+import os
+import sys
+
+from umk import core
+from umk.framework.filesystem import Path
+from umk.framework.adapters.go.packages import Packages
+
+# Toolexec shim: 'go build -toolexec="python3 shim.py log.jsonl"' runs it as
+# 'python3 shim.py log.jsonl /path/to/tool args...'. It runs the tool and
+# appends (single write, O_APPEND) one record per invocation.
+SHIM = """
+import json, os, subprocess, sys, time
+log, argv = sys.argv[1], sys.argv[2:]
+start = time.time()
+code = subprocess.call(argv)
+end = time.time()
+if not any(a.startswith("-V") for a in argv[1:]):
+    record = {
+        "tool": os.path.basename(argv[0]).removesuffix(".exe"),
+        "package": os.environ.get("TOOLEXEC_IMPORTPATH", ""),
+        "start": start,
+        "end": end,
+    }
+    fd = os.open(log, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, (json.dumps(record) + "\\n").encode())
+    finally:
+        os.close(fd)
+sys.exit(code)
+"""
+
+
+class Record(core.Model):
+    tool: str = core.Field(default="", description="Tool name (compile, asm, link, ...)")
+    package: str = core.Field(default="", description="Package import path (TOOLEXEC_IMPORTPATH)")
+    start: float = core.Field(default=0.0, description="Start timestamp in seconds")
+    end: float = core.Field(default=0.0, description="End timestamp in seconds")
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class Profile(core.Model):
+    records: list[Record] = core.Field(
+        default_factory=list,
+        description="Toolchain invocations"
+    )
+
+    @staticmethod
+    def shim() -> Path:
+        """
+        Write the shim script to the cache and return its path.
+        """
+        result = core.globals.paths.cache / "go" / "toolexec.py"
+        if not result.exists() or result.read_text() != SHIM:
+            os.makedirs(result.parent, exist_ok=True)
+            result.write_text(SHIM)
+        return result
+
+    @staticmethod
+    def toolexec(log: Path) -> list[str]:
+        """
+        Value of 'BuildOptions.toolexec' to record invocations to the log file.
+        """
+        os.makedirs(log.parent, exist_ok=True)
+        return [
+            f'"{item}"' if " " in item else item
+            for item in (sys.executable, str(Profile.shim()), str(log))
+        ]
+
+    @staticmethod
+    def load(log: Path) -> 'Profile':
+        result = Profile()
+        if not log.exists():
+            return result
+        with open(log, "r") as stream:
+            for line in stream:
+                try:
+                    result.records.append(Record.model_validate(json.loads(line)))
+                except (ValueError, core.ValidationError):
+                    continue
+        result.records.sort(key=lambda r: r.start)
+        return result
+
+    @property
+    def wall(self) -> float:
+        if not self.records:
+            return 0.0
+        return max(r.end for r in self.records) - min(r.start for r in self.records)
+
+    def packages(self) -> dict[str, float]:
+        """
+        Total tools time by package (slowest first).
+        """
+        result: dict[str, float] = {}
+        for record in self.records:
+            result[record.package] = result.get(record.package, 0.0) + record.duration
+        return dict(sorted(result.items(), key=lambda item: item[1], reverse=True))
+
+    def critical(self, packages: None | Packages = None) -> tuple[float, list[str]]:
+        """
+        Critical path of the build: the chain of dependent packages with the
+        largest total time. Without package graph the longest package is used.
+        """
+        own = self.packages()
+        if not own:
+            return 0.0, []
+        if packages is None:
+            name, value = next(iter(own.items()))
+            return value, [name]
+        imports = {p.path: p.imports for p in packages.items}
+        memo: dict[str, tuple[float, list[str]]] = {}
+
+        def cost(name: str) -> tuple[float, list[str]]:
+            if name in memo:
+                return memo[name]
+            memo[name] = (own.get(name, 0.0), [name])
+            best = (0.0, [])
+            for dep in imports.get(name, []):
+                candidate = cost(dep)
+                if candidate[0] > best[0]:
+                    best = candidate
+            memo[name] = (own.get(name, 0.0) + best[0], best[1] + [name])
+            return memo[name]
+
+        return max((cost(name) for name in own), key=lambda item: item[0])
+
+    def trace(self, file: Path):
+        """
+        Export invocations as Chrome trace (chrome://tracing, Perfetto).
+        Concurrent invocations are placed on separate lanes.
+        """
+        origin = min((r.start for r in self.records), default=0.0)
+        lanes: list[float] = []
+        events = []
+        for record in self.records:
+            lane = next((i for i, end in enumerate(lanes) if end <= record.start), len(lanes))
+            if lane == len(lanes):
+                lanes.append(0.0)
+            lanes[lane] = record.end
+            events.append({
+                "name": record.package or record.tool,
+                "cat": record.tool,
+                "ph": "X",
+                "ts": int((record.start - origin) * 1e6),
+                "dur": int(record.duration * 1e6),
+                "pid": 1,
+                "tid": lane,
+                "args": {"tool": record.tool, "package": record.package},
+            })
+        os.makedirs(file.parent, exist_ok=True)
+        with open(file, "w") as stream:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, stream)
@@ -0,0 +1,200 @@
+import hashlib
+import os
+import re
+from pathlib import Path
+
+from umk import core
+from umk.framework import utils
+
+
+class Patterns:
+    """
+    Path patterns with the '.dockerignore' semantics: '*', '?', '**',
+    '[...]' wildcards, '!' negation, the last matched pattern wins and
+    a pattern matched a directory matches everything inside it.
+    """
+
+    def __init__(self, *patterns: str):
+        self._items: list[tuple[bool, re.Pattern]] = []
+        for pattern in patterns:
+            self.add(pattern)
+
+    def __bool__(self):
+        return bool(self._items)
+
+    @property
+    def negations(self) -> bool:
+        return any(negated for negated, _ in self._items)
+
+    @staticmethod
+    def load(file: Path) -> 'Patterns':
+        """
+        Load patterns from '.dockerignore' like file.
+        """
+        result = Patterns()
+        if file.exists():
+            with open(file, "r") as stream:
+                for line in stream.readlines():
+                    result.add(line)
+        return result
+
+    def add(self, pattern: str):
+        pattern = pattern.strip()
+        if not pattern or pattern.startswith("#"):
+            return
+        negated = pattern.startswith("!")
+        if negated:
+            pattern = pattern[1:].strip()
+        pattern = os.path.normpath(pattern).replace(os.sep, "/").lstrip("/")
+        if pattern == ".":
+            return
+        self._items.append((negated, re.compile(f"^{self._translate(pattern)}$")))
+
+    def match(self, path: str) -> bool:
+        """
+        Whether the given relative (posix) path is matched.
+        """
+        parts = path.split("/")
+        parents = ["/".join(parts[:i]) for i in range(1, len(parts))]
+        result = False
+        for negated, regex in self._items:
+            if regex.match(path) or any(regex.match(p) for p in parents):
+                result = not negated
+        return result
+
+    @staticmethod
+    def _translate(pattern: str) -> str:
+        result = ""
+        i = 0
+        while i < len(pattern):
+            c = pattern[i]
+            if pattern.startswith("**/", i):
+                result += "(?:.*/)?"
+                i += 3
+                continue
+            if pattern.startswith("**", i):
+                result += ".*"
+                i += 2
+                continue
+            if c == "*":
+                result += "[^/]*"
+            elif c == "?":
+                result += "[^/]"
+            elif c == "[":
+                end = pattern.find("]", i + 1)
+                if end < 0:
+                    result += re.escape(c)
+                else:
+                    body = pattern[i + 1:end]
+                    if body.startswith(("!", "^")):
+                        body = "^" + body[1:]
+                    result += f"[{body}]"
+                    i = end
+            elif c == "\\" and i + 1 < len(pattern):
+                i += 1
+                result += re.escape(pattern[i])
+            else:
+                result += re.escape(c)
+            i += 1
+        return result
+
+
+class Entry(core.Model):
+    size: int = core.Field(
+        default=0,
+        description="File size in bytes"
+    )
+    mtime: int = core.Field(
+        default=0,
+        description="File modification time in nanoseconds"
+    )
+    digest: str = core.Field(
+        default="",
+        description="File content sha256 digest"
+    )
+
+
+class Manifest(core.Model):
+    entries: dict[str, Entry] = core.Field(
+        default_factory=dict,
+        description="Files (relative posix path -> entry)"
+    )
+
+    @staticmethod
+    def scan(root: Path, exclude: None | Patterns = None, previous: 'None | Manifest' = None,
+             checksum: bool = True) -> 'Manifest':
+        """
+        Collect files of the given directory. Files with the same size and
+        modification time as in the previous manifest are not hashed again.
+        """
+        root = Path(root).expanduser().resolve().absolute()
+        exclude = exclude or Patterns()
+        prune = not exclude.negations
+        previous = previous or Manifest()
+        result = Manifest()
+        for directory, dirs, files in os.walk(root):
+            rel = Path(directory).relative_to(root).as_posix()
+            rel = "" if rel == "." else rel + "/"
+            if prune:
+                dirs[:] = [d for d in dirs if not exclude.match(rel + d)]
+            dirs.sort()
+            for name in sorted(files):
+                path = rel + name
+                if exclude.match(path):
+                    continue
+                file = Path(directory) / name
+                if not file.is_file():
+                    continue
+                stat = file.stat()
+                old = previous.entries.get(path)
+                same = old and old.size == stat.st_size and old.mtime == stat.st_mtime_ns
+                if same and (old.digest or not checksum):
+                    result.entries[path] = old
+                    continue
+                result.entries[path] = Entry(
+                    size=stat.st_size,
+                    mtime=stat.st_mtime_ns,
+                    digest=Manifest.hash(file) if checksum else "",
+                )
+        return result
+
+    @staticmethod
+    def hash(file: Path) -> str:
+        result = hashlib.sha256()
+        with open(file, "rb") as stream:
+            for chunk in iter(lambda: stream.read(1 << 20), b""):
+                result.update(chunk)
+        return result.hexdigest()
+
+    @staticmethod
+    def load(file: Path) -> 'Manifest':
+        if not file.exists():
+            return Manifest()
+        try:
+            return Manifest.model_validate(core.json.load(file))
+        except (ValueError, core.ValidationError):
+            return Manifest()
+
+    def save(self, file: Path):
+        core.json.save(self, file)
+
+    def digest(self) -> str:
+        """
+        Digest of the file paths and contents (timestamps are ignored).
+        """
+        entries = sorted(self.entries.items())
+        return utils.digest(*[f"{path}:{entry.digest}" for path, entry in entries])
+
+    def size(self) -> int:
+        return sum(entry.size for entry in self.entries.values())
+
+    def diff(self, previous: 'Manifest') -> tuple[list[str], list[str]]:
+        """
+        Returns (changed, removed) files relative to the previous manifest.
+        """
+        changed = [
+            path for path, entry in self.entries.items()
+            if path not in previous.entries or previous.entries[path].digest != entry.digest
+        ]
+        removed = [path for path in previous.entries if path not in self.entries]
+        return changed, removed
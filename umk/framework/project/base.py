@@ -120,6 +120,12 @@ class Layout(core.Model):
         description="'.unimake' root directory."
     )
 
+    def ignores(self) -> list[Path]:
+        """
+        Paths that are not a part of the project sources (VCS, caches, outputs, ...).
+        """
+        return [self.root / ".git", self.unimake / ".cache"]
+
 
 class Interface:
     def __init__(self):
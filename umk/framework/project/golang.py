@@ -1,4 +1,5 @@
 from umk.framework.adapters import go
+from umk.framework.filesystem import Path
 from umk.framework.project.base import Layout
 from umk.framework.project.base import Scratch
 
@@ -61,6 +62,13 @@ class GolangLayout(Layout):
     @property
     def output(self): return self.root / "output"
 
+    def ignores(self) -> list[Path]:
+        result = super().ignores() + [self.output, self.build]
+        # vendored modules ('vendor/modules.txt') are a part of the sources
+        if not (self.vendor / "modules.txt").exists():
+            result.append(self.vendor)
+        return result
+
 
 class Golang(Scratch):
     def __init__(self):
@@ -1,20 +1,252 @@
+import contextlib
+import copy
+import datetime
+import fcntl
+import os
+import re
+import shlex
+import shutil
+import socket
+import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from umk import core
+from umk.framework import utils
 from umk.framework.adapters import docker
-from umk.framework.filesystem import AnyPath, OptPath
+from umk.framework.adapters.go import Proxy as GoProxy
+from umk.framework.filesystem import AnyPath, OptPath, Path
+from umk.framework.filesystem.manifest import Manifest, Patterns
+from umk.framework.project.base import Layout
+from umk.framework.project.golang import GolangLayout
 from umk.framework.remote.interface import Interface
 from umk.framework.system.environs import OptEnv
 from umk.framework.system.shell import Shell
 from umk.framework.system.user import User
 
 
+LABEL_BUILD = "umk.digest.build"
+LABEL_SERVICE = "umk.digest.service"
+LABEL_POOL = "umk.pool"
+POOL_LOCK = threading.Lock()
+
+
 class Login(core.Model):
     server: str = core.Field(default="", description="Server URL")
     user: str = core.Field(default="", description="Docker repository user")
     password: str = core.Field(default="", description="Docker repository password")
 
 
+class Usage(core.Model):
+    samples: int = core.Field(default=0, description="Number of the collected samples")
+    seconds: float = core.Field(default=0.0, description="Sampling duration")
+    cpu_peak: float = core.Field(
+        default=0.0,
+        description="Peak CPU usage (percents, sum of the containers)"
+    )
+    cpu_average: float = core.Field(
+        default=0.0,
+        description="Average CPU usage (percents, sum of the containers)"
+    )
+    memory_peak: int = core.Field(default=0, description="Peak memory usage in bytes")
+    memory_average: int = core.Field(default=0, description="Average memory usage in bytes")
+    block_read: int = core.Field(
+        default=0,
+        description="Bytes read from block devices while sampling"
+    )
+    block_write: int = core.Field(
+        default=0,
+        description="Bytes written to block devices while sampling"
+    )
+
+    def __str__(self):
+        human = docker.context.human
+        return (
+            f"CPU {self.cpu_average:.0f}% avg / {self.cpu_peak:.0f}% peak, "
+            f"memory {human(self.memory_average)} avg / {human(self.memory_peak)} peak, "
+            f"block IO {human(self.block_read)} read / {human(self.block_write)} written "
+            f"({self.samples} samples in {self.seconds:.1f}s)"
+        )
+
+
+class Sampler:
+    """
+    Collects containers stats in background thread.
+    """
+
+    def __init__(self, client: docker.Client, containers: list[str], interval: float = 1.0):
+        self.client = client
+        self.containers = containers
+        self.interval = interval
+        self.usage = Usage()
+        self._cpu = 0.0
+        self._memory = 0
+        self._first: dict[str, tuple[int, int]] = {}
+        self._last: dict[str, tuple[int, int]] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._start = 0.0
+
+    def __enter__(self) -> Usage:
+        self._start = time.monotonic()
+        self._thread.start()
+        return self.usage
+
+    def __exit__(self, *args):
+        self._stop.set()
+        self._thread.join()
+        self.usage.seconds = time.monotonic() - self._start
+        if self.usage.samples:
+            self.usage.cpu_average = self._cpu / self.usage.samples
+            self.usage.memory_average = self._memory // self.usage.samples
+        for name, (read, write) in self._last.items():
+            first = self._first[name]
+            self.usage.block_read += read - first[0]
+            self.usage.block_write += write - first[1]
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                # 'docker stats --no-stream' blocks for a sampling period itself
+                stats: list[docker.ContainerStats] = self.client.container.stats(self.containers)
+            except docker.DockerException:
+                stats = []
+            if stats:
+                cpu = sum(s.cpu_percentage for s in stats)
+                memory = sum(s.memory_used for s in stats)
+                self.usage.samples += 1
+                self.usage.cpu_peak = max(self.usage.cpu_peak, cpu)
+                self.usage.memory_peak = max(self.usage.memory_peak, memory)
+                self._cpu += cpu
+                self._memory += memory
+                for s in stats:
+                    self._first.setdefault(s.container_name, (s.block_read, s.block_write))
+                    self._last[s.container_name] = (s.block_read, s.block_write)
+            self._stop.wait(self.interval)
+
+
+class GoCache(core.Model):
+    volume: bool = core.Field(
+        default=True,
+        description="Use named docker volumes (or bind host GOCACHE and GOMODCACHE otherwise)"
+    )
+    prefix: str = core.Field(
+        default="umk",
+        description="Named volumes prefix (volumes are shared between remotes with the same prefix)"
+    )
+    build: str = core.Field(
+        default="/root/.cache/go-build",
+        description="Go build cache path inside containers (GOCACHE)"
+    )
+    modules: str = core.Field(
+        default="/go/pkg/mod",
+        description="Go modules cache path inside containers (GOMODCACHE)"
+    )
+    services: list[str] = core.Field(
+        default_factory=list,
+        description="Compose services to attach caches to (all if empty)"
+    )
+    proxy: None | str = core.Field(
+        default=None,
+        description="File based GOPROXY path inside containers ('mirror' is mounted there)"
+    )
+    mirror: Path = core.Field(
+        default_factory=lambda: GoProxy().root,
+        description="Host GOPROXY mirror directory (see 'target.GolangMod.proxy')"
+    )
+
+    def environments(self, envs: None | dict = None) -> dict[str, str]:
+        """
+        Returns the given environments completed by the cache ones. The given
+        values win, but '-mod=mod' of the proxy is appended to their GOFLAGS.
+        """
+        result = {"GOCACHE": self.build, "GOMODCACHE": self.modules}
+        result.update(envs or {})
+        if self.proxy:
+            proxy = GoProxy(root=Path(self.proxy)).environs(str(result.get("GOFLAGS", "")))
+            result["GOFLAGS"] = proxy.pop("GOFLAGS")
+            for key, value in proxy.items():
+                result.setdefault(key, value)
+        return result
+
+    def binds(self) -> dict[str, str]:
+        """
+        Returns host directories to bind by container paths (GOPROXY mirror).
+        """
+        if not self.proxy:
+            return {}
+        return {self.proxy: str(Path(self.mirror).expanduser().resolve().absolute())}
+
+    def sources(self) -> dict[str, str]:
+        """
+        Returns cache sources (volume names or host paths) by container paths.
+        """
+        if self.volume:
+            return {
+                self.build: f"{self.prefix}-gocache",
+                self.modules: f"{self.prefix}-gomodcache",
+            }
+        result = {}
+        for target, name, default in (
+            (self.build, "GOCACHE", Path.home() / ".cache" / "go-build"),
+            (self.modules, "GOMODCACHE", Path.home() / "go" / "pkg" / "mod"),
+        ):
+            value = os.environ.get(name, "")
+            if not value and shutil.which("go"):
+                proc = subprocess.run(["go", "env", name], capture_output=True, text=True)
+                value = proc.stdout.strip() if proc.returncode == 0 else ""
+            result[target] = value or str(default)
+        return result
+
+    def provision(self, client: docker.Client):
+        """
+        Create missing cache volumes (or host directories).
+        """
+        for source in self.binds().values():
+            os.makedirs(source, exist_ok=True)
+        for source in self.sources().values():
+            if not self.volume:
+                os.makedirs(source, exist_ok=True)
+            elif not client.volume.exists(source):
+                client.volume.create(source, labels={"umk.cache": "go"})
+
+    def size(self, client: docker.Client, source: str) -> int:
+        if not self.volume:
+            if not Path(source).exists():
+                return 0
+            return sum(
+                os.path.getsize(os.path.join(root, f))
+                for root, _, files in os.walk(source) for f in files
+                if not os.path.islink(os.path.join(root, f))
+            )
+        if not client.volume.exists(source):
+            return 0
+        output = client.run(
+            "busybox", ["du", "-sk", "/cache"], volumes=[(source, "/cache")], remove=True
+        )
+        return int(output.split()[0]) * 1024
+
+    def prune(self, client: docker.Client, source: str):
+        if not self.volume:
+            if Path(source).exists():
+                # module cache is read-only
+                for root, dirs, _ in os.walk(source):
+                    for d in dirs:
+                        os.chmod(os.path.join(root, d), 0o755)
+                shutil.rmtree(source)
+                os.makedirs(source)
+            return
+        if client.volume.exists(source):
+            client.run(
+                "busybox",
+                ["sh", "-c", "rm -rf /cache/* /cache/.[!.]*"],
+                volumes=[(source, "/cache")],
+                remove=True,
+            )
+
+
 class Compose(Interface):
     service: str = core.Field(
         default=None,
@@ -40,6 +272,58 @@ class Compose(Interface):
         default_factory=list,
         description="Private repositories login info"
     )
+    reconcile: bool = core.Field(
+        default=True,
+        description="Build, start and stop only services that differ from the current state"
+    )
+    minimize: bool = core.Field(
+        default=False,
+        description="Generate '.dockerignore' of the build contexts by the 'ignore' list "
+                    "and Dockerfile COPY/ADD sources"
+    )
+    ignore: list[Path | str] = core.Field(
+        default_factory=list,
+        description="Paths to exclude from the build contexts"
+    )
+    archive: bool = core.Field(
+        default=False,
+        description="Build images of Dockerfile objects from context tarballs cached by the "
+                    "context manifest (precomputed on save)"
+    )
+    tagging: bool = core.Field(
+        default=False,
+        description="Tag built images by Dockerfile and build context digest and reuse them "
+                    "instead of building"
+    )
+    gocache: None | GoCache = core.Field(
+        default=None,
+        description="Persistent Go build and modules caches of the services"
+    )
+    wait: bool = core.Field(
+        default=False,
+        description="Wait for the services readiness on 'up' (healthchecks and TCP probes)"
+    )
+    timeout: float = core.Field(
+        default=60.0,
+        description="Services readiness timeout in seconds"
+    )
+    probes: dict[str, list[str | int]] = core.Field(
+        default_factory=dict,
+        description="TCP endpoints ('host:port' or port on localhost) to probe per service"
+    )
+    sampling: bool = core.Field(
+        default=False,
+        description="Sample containers resource usage while forwarded commands run"
+    )
+    workspace: str = core.Field(
+        default="",
+        description="Project path inside the target service, 'develop.watch' rules syncing "
+                    "the project sources there are generated by the 'layout'"
+    )
+    layout: None | Layout = core.Field(
+        default=None,
+        description="Project layout to generate 'develop.watch' rules of"
+    )
 
     @property
     def client(self) -> docker.Client:
@@ -47,26 +331,361 @@ class Compose(Interface):
             compose_files=[self.composefile.file]
         )
 
+    @property
+    def project(self) -> str:
+        return re.sub(r"[^a-z0-9_-]", "", self.composefile.path.name.lower())
+
+    def image(self, service: str) -> str:
+        """
+        Returns image name of the given compose service.
+        """
+        result = self.composefile.services[service].image
+        if result:
+            return result
+        return f"{self.project}-{service}"
+
+    def dockerfile(self, service: str) -> None | docker.File:
+        """
+        Returns Dockerfile object the given compose service is built from.
+        """
+        build = self.composefile.services[service].build
+        if build is None or build.context is None:
+            return None
+        file = (Path(build.context) / (build.dockerfile or "Dockerfile")).expanduser().resolve()
+        for dockerfile in self.dockerfiles:
+            if dockerfile.file.expanduser().resolve() == file:
+                return dockerfile
+        return None
+
+    def digest(self, service: str) -> tuple[str, str]:
+        """
+        Returns (image, container) digests of the given compose service.
+        Image digest covers build section, Dockerfile text and build context
+        files ('.dockerignore' is respected), container digest covers whole
+        service description and image digest.
+        """
+        svc = self.composefile.services[service]
+        dockerfile = self.dockerfile(service)
+        build = utils.digest(
+            core.json.text(svc.build) if svc.build else "",
+            dockerfile.text() if dockerfile else "",
+            self.context(service),
+        )
+        container = utils.digest(core.json.text(svc), build)
+        return build, container
+
+    def context(self, service: str) -> str:
+        """
+        Returns digest of the build context files of the given compose service.
+        Compose file is skipped: it is stamped by this digest.
+        """
+        build = self.composefile.services[service].build
+        if build is None or build.context is None or not Path(build.context).is_dir():
+            return ""
+        root = Path(build.context).expanduser().resolve().absolute()
+        content = docker.context.manifest(root)
+        composefile = self.composefile.file.expanduser().resolve().absolute()
+        if composefile.is_relative_to(root):
+            content.entries.pop(composefile.relative_to(root).as_posix(), None)
+        return content.digest()
+
+    def tag(self, service: str) -> None | str:
+        """
+        Returns content addressed tag of the given service image. The tag
+        covers build section, Dockerfile text and build context files.
+        """
+        if self.dockerfile(service) is None:
+            return None
+        repository = self.image(service)
+        if ":" in repository.rsplit("/", 1)[-1]:
+            repository = repository.rsplit(":", 1)[0]
+        return f"{repository}:umk-{self.digest(service)[0][:16]}"
+
+    def contexts(self):
+        """
+        Minimize build contexts of the services built from Dockerfile objects.
+        """
+        for name in self.composefile.services:
+            dockerfile = self.dockerfile(name)
+            if dockerfile is None:
+                continue
+            root = Path(self.composefile.services[name].build.context)
+            before, after = docker.context.minimize(root, self.ignore, dockerfile.sources())
+            core.globals.console.print(
+                f"[bold]\[{self.name}] build context of '{name}': "
+                f"{docker.context.human(before)} -> {docker.context.human(after)}"
+            )
+
+    def caches(self):
+        """
+        Attach Go cache volumes and environments to the compose services.
+        """
+        if self.gocache is None:
+            return
+        self.gocache.provision(self.client)
+        sources = self.gocache.sources()
+        for name, svc in self.composefile.services.items():
+            if self.gocache.services and name not in self.gocache.services:
+                continue
+            mounted = {str(m.target) for m in svc.volumes.mounts}
+            for target, source in sources.items():
+                if target in mounted:
+                    continue
+                if self.gocache.volume:
+                    svc.volumes.volume(source, target)
+                else:
+                    svc.volumes.bind(source, target)
+            for target, source in self.gocache.binds().items():
+                if target not in mounted:
+                    svc.volumes.bind(source, target)
+            svc.environment.update(self.gocache.environments(svc.environment))
+        if self.gocache.volume:
+            for source in sources.values():
+                # external volumes survive 'down --volumes'
+                self.composefile.volumes[source] = docker.ComposeVolume(external=True)
+
+    def sample(self, **kwargs) -> contextlib.AbstractContextManager[None | Usage]:
+        if not self.sampling:
+            return contextlib.nullcontext()
+        return Sampler(self.client, [c.name for c in self.client.compose.ps()])
+
+    @staticmethod
+    def watches(layout: Layout, target: str) -> list[docker.ComposeWatch]:
+        """
+        Generate 'develop.watch' rules of the project layout: golang sources
+        (cmd, internal, pkg) are synced and go.mod/go.sum changes rebuild
+        the image, other layouts sync the whole project root.
+        """
+        root = layout.root
+        target = target.rstrip("/")
+        result = []
+        if isinstance(layout, GolangLayout):
+            for directory in (layout.cmd, layout.internal, layout.pkg):
+                if directory.exists():
+                    result.append(docker.ComposeWatch(
+                        path=directory.as_posix(),
+                        action="sync",
+                        target=f"{target}/{directory.relative_to(root).as_posix()}",
+                    ))
+            for file in ("go.mod", "go.sum"):
+                if (root / file).exists():
+                    result.append(docker.ComposeWatch(
+                        path=(root / file).as_posix(),
+                        action="rebuild",
+                    ))
+        else:
+            ignore = [
+                p.relative_to(root).as_posix() for p in layout.ignores() if p.is_relative_to(root)
+            ]
+            result.append(docker.ComposeWatch(
+                path=root.as_posix(),
+                action="sync",
+                target=target,
+                ignore=ignore,
+            ))
+        return result
+
     @core.typeguard
-    def build(self, *args, **kwargs):
-        # save docker files
+    def develop(self, layout: Layout, target: str, services: None | list[str] = None):
+        """
+        Fill 'develop.watch' of the given (or target) services by the project layout.
+        """
+        for name in services or [self.service]:
+            svc = self.composefile.services[name]
+            if svc.develop is None:
+                svc.develop = docker.ComposeDevelop()
+            svc.develop.watch = self.watches(layout, target)
+
+    def rules(self):
+        """
+        Generate 'develop.watch' rules of the target service if 'workspace' is
+        set and the service has no rules yet.
+        """
+        if not self.workspace or self.layout is None:
+            return
+        if self.service not in self.composefile.services:
+            return
+        develop = self.composefile.services[self.service].develop
+        if develop is None or not develop.watch:
+            self.develop(self.layout, self.workspace)
+
+    def watch(self, **kwargs):
+        self.rules()
+        self.caches()
+        self.save()
+        services = [
+            name for name, svc in self.composefile.services.items()
+            if svc.develop and svc.develop.watch
+        ]
+        if not services:
+            core.globals.console.print(
+                f"[bold]\[{self.name}] no services with 'develop.watch' rules"
+            )
+            return
+        cmd = self.client.compose.docker_compose_cmd + ["watch"] + services
+        shell = Shell(name=self.name, cmd=cmd)
+        shell.sync()
+
+    def cache(self, **kwargs):
+        if self.gocache is None:
+            core.globals.console.print(f"[bold]\[{self.name}] Go caches are disabled")
+            return
+        for target, source in self.gocache.sources().items():
+            size = self.gocache.size(self.client, source)
+            core.globals.console.print(
+                f"[bold]\[{self.name}] {source} ({target}): {docker.context.human(size)}"
+            )
+            if kwargs.get("prune"):
+                self.gocache.prune(self.client, source)
+                core.globals.console.print(f"[bold]\[{self.name}] {source} pruned")
+
+    def save(self):
+        """
+        Save Dockerfiles and compose file stamped by service digests.
+        """
         for dockerfile in self.dockerfiles:
             dockerfile.save()
+        stamped = copy.deepcopy(self.composefile)
+        for name, svc in stamped.services.items():
+            build, container = self.digest(name)
+            if svc.build:
+                svc.build.labels[LABEL_BUILD] = build
+            svc.labels[LABEL_SERVICE] = container
+        stamped.save()
+        for name in self.composefile.services:
+            self.tarball(name)
+
+    def tarball(self, service: str) -> None | Path:
+        """
+        Returns cached build context tarball of the given service (if 'archive' is set).
+        """
+        if not self.archive or self.dockerfile(service) is None:
+            return None
+        build = self.composefile.services[service].build
+        return docker.context.archive(Path(build.context), build.dockerfile or "Dockerfile")
 
-        # save compose file
-        self.composefile.save()
+    def images(self, services: list[str]):
+        """
+        Build images of the given services. Contexts of the Dockerfile objects
+        are sent as cached tarballs if 'archive' is set.
+        """
+        rest = []
+        for name in services:
+            tarball = self.tarball(name)
+            if tarball is None:
+                rest.append(name)
+                continue
+            build = self.composefile.services[name].build
+            cmd = [
+                "docker", "build", "-t", self.image(name), "-f", build.dockerfile or "Dockerfile",
+                "--label", f"{LABEL_BUILD}={self.digest(name)[0]}",
+            ]
+            for key, value in build.args.items():
+                cmd += ["--build-arg", f"{key}={value}"]
+            for key, value in build.labels.items():
+                cmd += ["--label", f"{key}={value}"]
+            if build.target:
+                cmd += ["--target", build.target]
+            cmd.append("-")
+            with open(tarball, "rb") as stream:
+                code = subprocess.run(cmd, stdin=stream).returncode
+            if code != 0:
+                raise docker.DockerException(cmd, code)
+        if rest:
+            self.client.compose.build(services=rest)
 
+    def outdated(self, service: str) -> bool:
+        """
+        Whether the image of the given service must be rebuilt.
+        """
+        if self.composefile.services[service].build is None:
+            return False
+        image = self.image(service)
+        if not self.client.image.exists(image):
+            return True
+        labels = self.client.image.inspect(image).config.labels or {}
+        # build labels are serialized quoted
+        return labels.get(LABEL_BUILD, "").strip('"') != self.digest(service)[0]
+
+    def stale(self, service: str, running: bool = False) -> bool:
+        """
+        Whether containers of the given service must be (re)created.
+        If 'running' is set, stopped and unhealthy containers are stale too.
+        """
+        containers = self.client.compose.ps(services=[service], all=not running)
+        if not containers:
+            return True
+        expect = self.digest(service)[1]
+        for container in containers:
+            labels = container.config.labels or {}
+            if labels.get(LABEL_SERVICE) != expect:
+                return True
+            if not running:
+                continue
+            if not container.state.running:
+                return True
+            health = container.state.health
+            if health is not None and health.status != "healthy":
+                return True
+        return False
+
+    @core.typeguard
+    def build(self, *args, **kwargs):
+        if self.minimize:
+            self.contexts()
+        self.rules()
+        self.caches()
+        self.save()
         services = list(self.composefile.services.keys())
 
-        # clear old
-        self.client.compose.down(remove_orphans=True, remove_images="all", volumes=True, quiet=False)
-        self.client.compose.rm(services=services, stop=True, volumes=True)
+        if kwargs.get("force") or not self.reconcile:
+            # clear old
+            self.client.compose.down(
+                remove_orphans=True, remove_images="all", volumes=True, quiet=False
+            )
+            self.client.compose.rm(services=services, stop=True, volumes=True)
+
+            # build images
+            self.images(services)
+
+            # create containers
+            self.client.compose.create(services=services, no_recreate=True)
+            return
 
-        # build images
-        self.client.compose.build(services=services)
+        # build outdated images only, content tagged ones are reused instead
+        outdated = []
+        built = []
+        tags = {name: self.tag(name) for name in services} if self.tagging else {}
+        for name in services:
+            tag = tags.get(name)
+            if tag and self.client.image.exists(tag):
+                image = self.image(name)
+                if self.client.image.exists(image) and \
+                        self.client.image.inspect(image).id == self.client.image.inspect(tag).id:
+                    continue
+                core.globals.console.print(f"[bold]\[{self.name}] reuse image '{tag}' for '{name}'")
+                self.client.image.tag(tag, image)
+                outdated.append(name)
+            elif self.outdated(name):
+                outdated.append(name)
+                built.append(name)
+            elif tag:
+                # up to date image built before tagging was enabled
+                self.client.image.tag(self.image(name), tag)
+        if built:
+            self.images(built)
+            for name in built:
+                if tags.get(name):
+                    self.client.image.tag(self.image(name), tags[name])
+        elif not outdated:
+            core.globals.console.print(f"[bold]\[{self.name}] images are up to date")
 
-        # create containers
-        self.client.compose.create(services=services, no_recreate=True)
+        # recreate containers of the changed services only
+        stale = [name for name in services if name in outdated or self.stale(name)]
+        if stale:
+            self.client.compose.create(services=stale, force_recreate=True)
+        else:
+            core.globals.console.print(f"[bold]\[{self.name}] containers are up to date")
 
     def destroy(self, *args, **kwargs):
         services = list(self.composefile.services.keys())
@@ -85,10 +704,135 @@ class Compose(Interface):
 
     @core.typeguard
     def up(self, *args, **kwargs):
+        self.rules()
+        self.caches()
+        self.save()
         services = list(self.composefile.services.keys())
+        if self.reconcile:
+            services = [name for name in services if self.stale(name, running=True)]
+            if not services:
+                core.globals.console.print(f"[bold]\[{self.name}] services are already up")
+                return
+        since = datetime.datetime.now()
         self.client.compose.up(services=services, build=False, detach=True, remove_orphans=True)
+        if kwargs.get("wait", self.wait):
+            self.ready(services, since, kwargs.get("timeout") or self.timeout)
+
+    def ready(self, services: list[str], since: datetime.datetime, timeout: float):
+        """
+        Wait until the services are ready: containers are healthy (if they have
+        healthcheck) or running, and TCP probes are accepted. Container states
+        are taken from the docker events stream, not by polling. Exited
+        containers fail the services, time to ready is reported per service.
+        """
+        deadline = since + datetime.timedelta(seconds=timeout)
+        pending = {}
+        healthchecks = {}
+        times = {name: since for name in services}
+        failed = set()
+        project = None
+        for name in services:
+            for container in self.client.compose.ps(services=[name], all=True):
+                project = (container.config.labels or {}).get("com.docker.compose.project", project)
+                state = container.state
+                if state.status in ("exited", "dead") or state.exit_code:
+                    failed.add(name)
+                    core.globals.console.print(
+                        f"[bold red]\[{self.name}] {name}: {state.status} "
+                        f"(exit code {state.exit_code})"
+                    )
+                    continue
+                health = state.health
+                if state.running and (health is None or health.status == "healthy"):
+                    times[name] = max(times[name], datetime.datetime.now())
+                    continue
+                pending[container.id] = name
+                healthchecks[container.id] = health is not None
+
+        # probes run concurrently with waiting for containers (and are cancelled on failure)
+        cancel = {name: threading.Event() for name in services}
+
+        def probing(name: str) -> None | datetime.datetime:
+            for probe in self.probes.get(name, []):
+                if not self.probe(probe, deadline, cancel[name]):
+                    if not cancel[name].is_set():
+                        core.globals.console.print(
+                            f"[bold red]\[{self.name}] {name}: '{probe}' is not reachable"
+                        )
+                    return None
+            return datetime.datetime.now()
+
+        with ThreadPoolExecutor(max_workers=max(1, len(services))) as executor:
+            probes = {
+                name: executor.submit(probing, name)
+                for name in services if self.probes.get(name) and name not in failed
+            }
+            if pending and project:
+                events = self.client.system.events(
+                    since=since,
+                    until=deadline,
+                    filters={"label": f"com.docker.compose.project={project}"},
+                )
+                for event in events:
+                    actor = event.actor.id if event.actor is not None else None
+                    if event.type != "container" or actor not in pending:
+                        continue
+                    action = event.action or ""
+                    name = pending[actor]
+                    started = action == "start" and not healthchecks[actor]
+                    if action == "health_status: healthy" or started:
+                        pending.pop(actor)
+                        times[name] = max(times[name], datetime.datetime.now())
+                    elif action in ("die", "oom") or action == "health_status: unhealthy":
+                        pending.pop(actor)
+                        failed.add(name)
+                        cancel[name].set()
+                        core.globals.console.print(f"[bold red]\[{self.name}] {name}: {action}")
+                    if not pending:
+                        break
+            for name in pending.values():
+                failed.add(name)
+                cancel[name].set()
+            for name, future in probes.items():
+                reached = future.result()
+                if reached is None:
+                    failed.add(name)
+                else:
+                    times[name] = max(times[name], reached)
+
+        for name in services:
+            if name not in failed:
+                elapsed = (times[name] - since).total_seconds()
+                core.globals.console.print(
+                    f"[bold green]\[{self.name}] {name} is ready in {elapsed:.1f}s"
+                )
+        if failed:
+            raise TimeoutError(f"Services are not ready in {timeout}s: {', '.join(sorted(failed))}")
+
+    @staticmethod
+    def probe(endpoint: str | int, deadline: datetime.datetime,
+              cancel: None | threading.Event = None) -> bool:
+        """
+        Wait for TCP endpoint ('host:port' or port on localhost) accepts connections.
+        """
+        cancel = cancel or threading.Event()
+        host, port = "localhost", endpoint
+        if isinstance(endpoint, str) and ":" in endpoint:
+            host, port = endpoint.rsplit(":", 1)
+        delay = 0.05
+        while datetime.datetime.now() < deadline and not cancel.is_set():
+            try:
+                with socket.create_connection((host, int(port)), timeout=1):
+                    return True
+            except OSError:
+                cancel.wait(delay)
+                delay = min(delay * 2, 1.0)
+        return False
 
     def down(self, *args, **kwargs):
+        if self.reconcile and not self.client.compose.ps(all=True):
+            core.globals.console.print(f"[bold]\[{self.name}] services are already down")
+            return
         self.client.compose.down(remove_orphans=True, volumes=True, quiet=False)
 
     def shell(self, **kwargs):
@@ -165,11 +909,82 @@ class Container(Interface):
         default=None,
         description="Open shell by user."
     )
+    gocache: None | GoCache = core.Field(
+        default=None,
+        description="Go build and modules caches environments (container is long-lived, "
+                    "caches are kept inside)"
+    )
+    sampling: bool = core.Field(
+        default=False,
+        description="Sample container resource usage while forwarded commands run"
+    )
 
     @property
     def client(self) -> docker.Client:
         return docker.Client()
 
+    def sample(self, **kwargs) -> contextlib.AbstractContextManager[None | Usage]:
+        if not self.sampling:
+            return contextlib.nullcontext()
+        return Sampler(self.client, [self.container])
+
+    def envs(self, env: OptEnv = None) -> dict[str, str]:
+        result = {}
+        if self.environments:
+            result.update(self.environments)
+        if env:
+            result.update(env)
+        if self.gocache:
+            result = self.gocache.environments(result)
+        return result
+
+    def push(self, root: Path, **kwargs):
+        """
+        Copy GOPROXY mirror into the container if it is changed since the last push.
+        """
+        if self.gocache is None or not self.gocache.proxy:
+            return
+        mirror = Path(self.gocache.mirror).expanduser().resolve().absolute()
+        if not mirror.is_dir():
+            return
+        file = core.globals.paths.cache / "sync" / f"{self.name}.goproxy.json"
+        previous = Manifest.load(file)
+        current = Manifest.scan(mirror, Patterns(), previous)
+        changed, removed = current.diff(previous)
+        if not changed and not removed:
+            return
+        self.client.container.execute(
+            container=self.container,
+            command=["mkdir", "-p", self.gocache.proxy],
+        )
+        self.client.container.copy(
+            source=f"{mirror}/.",
+            destination=(self.container, self.gocache.proxy)
+        )
+        core.globals.console.print(f"[bold]\[{self.name}] Go proxy mirror is copied")
+        current.save(file)
+
+    def cache(self, **kwargs):
+        if self.gocache is None:
+            core.globals.console.print(f"[bold]\[{self.name}] Go caches are disabled")
+            return
+        for target in (self.gocache.build, self.gocache.modules):
+            path = shlex.quote(target)
+            output = self.client.container.execute(
+                container=self.container,
+                command=["sh", "-c", f"du -sk {path} 2>/dev/null || echo 0"],
+            )
+            size = int(output.split()[0]) * 1024
+            core.globals.console.print(
+                f"[bold]\[{self.name}] {target}: {docker.context.human(size)}"
+            )
+            if kwargs.get("prune"):
+                self.client.container.execute(
+                    container=self.container,
+                    command=["sh", "-c", f"rm -rf {path}/* {path}/.[!.]*"],
+                )
+                core.globals.console.print(f"[bold]\[{self.name}] {target} pruned")
+
     def shell(self, *args, **kwargs):
         usr = None
         if self.user:
@@ -178,7 +993,7 @@ class Container(Interface):
             container=self.container,
             command=self.sh,
             detach=False,
-            envs=self.environments or {},
+            envs=self.envs(),
             interactive=True,
             privileged=self.privileged,
             tty=True,
@@ -189,13 +1004,7 @@ class Container(Interface):
 
     @core.typeguard
     def execute(self, cmd: list[AnyPath], cwd: OptPath = None, env: OptEnv = None, **kwargs):
-        envs = {}
-        if self.environments:
-            envs.update(self.environments)
-        if env:
-            envs.update(env)
-        if not envs:
-            envs = None
+        envs = self.envs(env) or None
         usr = None
         if self.user:
             usr = f"{self.user.id}:{self.user.group.id}"
@@ -215,7 +1024,7 @@ class Container(Interface):
 
     @core.typeguard
     def upload(self, items: dict[AnyPath, AnyPath], **kwargs):
-        for i, (src, dst) in items.items():
+        for src, dst in items.items():
             self.client.container.copy(
                 source=src,
                 destination=(self.container, dst)
@@ -223,8 +1032,232 @@ class Container(Interface):
 
     @core.typeguard
     def download(self, items: dict[AnyPath, AnyPath], **kwargs):
-        for i, (src, dst) in items.items():
+        for src, dst in items.items():
             self.client.container.copy(
                 source=(self.container, src),
                 destination=dst
             )
+
+
+class Pool(Interface):
+    image: str = core.Field(
+        default="",
+        description="Image of the pool containers"
+    )
+    size: int = core.Field(
+        default_factory=lambda: os.cpu_count() or 1,
+        description="Number of the warm containers"
+    )
+    workspace: str = core.Field(
+        default="/workspace",
+        description="Project workspace path inside containers"
+    )
+    overlay: bool = core.Field(
+        default=True,
+        description="Copy-on-write workspace (overlayfs over the read-only project, requires "
+                    "privileged containers) or the project copy otherwise"
+    )
+    environments: OptEnv = core.Field(
+        default=None,
+        description="Containers environment variables"
+    )
+    gocache: None | GoCache = core.Field(
+        default=None,
+        description="Go build and modules caches shared by the pool containers"
+    )
+    command: list[str] = core.Field(
+        default_factory=lambda: ["sleep", "infinity"],
+        description="Containers idle command"
+    )
+    sampling: bool = core.Field(
+        default=False,
+        description="Sample resource usage of each job container"
+    )
+
+    @property
+    def client(self) -> docker.Client:
+        return docker.Client()
+
+    def container(self, index: int) -> str:
+        return f"umk-{self.name}-{index}"
+
+    def running(self) -> list[str]:
+        containers = self.client.container.list(filters={"label": f"{LABEL_POOL}={self.name}"})
+        return sorted(c.name for c in containers)
+
+    def reset(self, container: str):
+        """
+        Recycle workspace of the given container (drop all the changes).
+        """
+        lower = "/mnt/umk/lower"
+        ws = shlex.quote(self.workspace)
+        if self.overlay:
+            script = (
+                f"umount {ws} 2>/dev/null; rm -rf /mnt/umk/upper /mnt/umk/work; "
+                f"mkdir -p /mnt/umk/upper /mnt/umk/work {ws} && "
+                f"mount -t overlay overlay "
+                f"-o lowerdir={lower},upperdir=/mnt/umk/upper,workdir=/mnt/umk/work {ws}"
+            )
+        else:
+            script = f"rm -rf {ws} && mkdir -p {ws} && cp -a {lower}/. {ws}"
+        self.client.container.execute(container=container, command=["sh", "-c", script])
+
+    def build(self, **kwargs):
+        self.client.image.pull(self.image)
+
+    def up(self, **kwargs):
+        running = self.running()
+        volumes = [(core.globals.paths.work, "/mnt/umk/lower", "ro")]
+        envs = dict(self.environments or {})
+        if self.gocache:
+            self.gocache.provision(self.client)
+            for target, source in {**self.gocache.sources(), **self.gocache.binds()}.items():
+                volumes.append((source, target))
+            envs = self.gocache.environments(envs)
+        started = []
+        for index in range(self.size):
+            name = self.container(index)
+            if name in running:
+                continue
+            if self.client.container.exists(name):
+                self.client.container.remove(name, force=True)
+            self.client.container.run(
+                self.image,
+                self.command,
+                name=name,
+                detach=True,
+                labels={LABEL_POOL: self.name},
+                volumes=volumes,
+                envs=envs,
+                privileged=self.overlay,
+                workdir=self.workspace,
+            )
+            started.append(name)
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            list(executor.map(self.reset, started))
+        core.globals.console.print(
+            f"[bold]\[{self.name}] {len(started)} started, {self.size - len(started)} already up"
+        )
+
+    def down(self, **kwargs):
+        containers = self.client.container.list(
+            all=True, filters={"label": f"{LABEL_POOL}={self.name}"}
+        )
+        if containers:
+            self.client.container.remove(containers, force=True)
+
+    def destroy(self, **kwargs):
+        self.down()
+
+    @contextlib.contextmanager
+    def lease(self):
+        """
+        Lease free pool container (waits for it if all of them are busy). Leases are
+        guarded by file locks, so they are shared between concurrent umk processes.
+        """
+        with POOL_LOCK:
+            if len(self.running()) < self.size:
+                self.up()
+        locks = core.globals.paths.cache / "pool" / self.name
+        os.makedirs(locks, exist_ok=True)
+        while True:
+            for index in range(self.size):
+                name = self.container(index)
+                stream = open(locks / f"{name}.lock", "w")
+                try:
+                    fcntl.flock(stream, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    stream.close()
+                    continue
+                try:
+                    yield name
+                finally:
+                    self.reset(name)
+                    fcntl.flock(stream, fcntl.LOCK_UN)
+                    stream.close()
+                return
+            time.sleep(0.1)
+
+    def path(self, local: Path) -> str:
+        rel = Path(local).expanduser().resolve().absolute().relative_to(core.globals.paths.work)
+        return (Path(self.workspace) / rel).as_posix()
+
+    def job(self, name: str, cmd: list[AnyPath], outputs: list[Path], lock: threading.Lock,
+            cwd: OptPath = None, env: OptEnv = None) -> int:
+        """
+        Run command in the leased container, download outputs and recycle it.
+        Relative 'cwd' is resolved against the workspace.
+        """
+        workdir = (Path(self.workspace) / cwd).as_posix() if cwd else self.workspace
+        envs = dict(self.environments or {})
+        envs.update(env or {})
+        with self.lease() as container:
+            start = time.monotonic()
+            code = 0
+            usage = None
+            sampler = contextlib.nullcontext()
+            if self.sampling:
+                sampler = Sampler(self.client, [container])
+            try:
+                with sampler as usage:
+                    for _, line in self.client.container.execute(
+                        container=container,
+                        command=[str(c) for c in cmd],
+                        envs=envs,
+                        workdir=workdir,
+                        stream=True,
+                    ):
+                        with lock:
+                            for text in line.decode(errors="replace").splitlines():
+                                core.globals.console.print(
+                                    f"[dim]\[{name}][/dim] {text}", markup=True, highlight=False
+                                )
+            except docker.DockerException as err:
+                code = err.return_code or 1
+            if usage is not None:
+                with lock:
+                    core.globals.console.print(f"[bold]\[{self.name}] {name}: {usage}")
+                    utils.History("usage").append({
+                        "remote": self.name,
+                        "targets": [name],
+                        "command": [str(c) for c in cmd],
+                        "usage": usage.model_dump(mode="json"),
+                    })
+            for output in outputs:
+                os.makedirs(output.parent, exist_ok=True)
+                try:
+                    self.client.container.copy((container, self.path(output)), output)
+                except docker.DockerException:
+                    code = code or 1
+                    with lock:
+                        core.globals.console.print(
+                            f"[bold red]\[{self.name}] {name}: output is missing: {output}"
+                        )
+            with lock:
+                status = "[green]done" if code == 0 else f"[red]failed ({code})"
+                core.globals.console.print(
+                    f"[bold]\[{self.name}] {name}: {status}[/] "
+                    f"in {time.monotonic() - start:.1f}s ({container})"
+                )
+            return code
+
+    def dispatch(self, jobs: dict[str, list[AnyPath]], outputs: dict[str, list[Path]],
+                 cwd: OptPath = None, env: OptEnv = None) -> int:
+        """
+        Run jobs (name -> command) in parallel, each in its own container.
+        Returns the number of the failed jobs.
+        """
+        lock = threading.Lock()
+        with ThreadPoolExecutor(max_workers=max(1, min(self.size, len(jobs)))) as executor:
+            futures = [
+                executor.submit(self.job, name, cmd, outputs.get(name, []), lock, cwd, env)
+                for name, cmd in jobs.items()
+            ]
+            return sum(1 for f in futures if f.result() != 0)
+
+    @core.typeguard
+    def execute(self, cmd: list[AnyPath], cwd: OptPath = None, env: OptEnv = None, **kwargs) -> int:
+        """
+        Run command in a pool container, returns the number of the failed jobs (0 or 1).
+        """
+        return self.dispatch({self.name: cmd}, {}, cwd, env)
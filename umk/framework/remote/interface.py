@@ -1,6 +1,8 @@
+import contextlib
+
 from umk import core
 from umk.framework import utils
-from umk.framework.filesystem import AnyPath, OptPath
+from umk.framework.filesystem import AnyPath, OptPath, Path
 from umk.framework.system.environs import OptEnv
 
 
@@ -17,6 +19,11 @@ class Interface(core.Model):
         default=False,
         description="Whether this remote environment are default or not",
     )
+    agent: bool = core.Field(
+        default=False,
+        description="Forward commands to the warm agent ('umk agent serve') started inside "
+                    "remote environment",
+    )
 
     def object(self) -> core.Object:
         result = core.Object()
@@ -81,6 +88,18 @@ class Interface(core.Model):
         """
         self.__not_implemented()
 
+    def watch(self, **kwargs):
+        """
+        Watch project files and sync them to remote environment.
+        """
+        self.__not_implemented()
+
+    def cache(self, **kwargs):
+        """
+        Report (and prune) remote environment caches.
+        """
+        self.__not_implemented()
+
     @core.typeguard
     def execute(self, cmd: list[AnyPath], cwd: OptPath = None, env: OptEnv = None, **kwargs):
         """
@@ -88,6 +107,24 @@ class Interface(core.Model):
         """
         self.__not_implemented()
 
+    def sample(self, **kwargs) -> contextlib.AbstractContextManager:
+        """
+        Resources usage sampler of the forwarded command run (nothing to sample by default).
+        """
+        return contextlib.nullcontext()
+
+    def push(self, root: Path, **kwargs):
+        """
+        Synchronize project workspace before forwarding (nothing to do if it is shared).
+        """
+        pass
+
+    def pull(self, root: Path, items: list[Path], **kwargs):
+        """
+        Download target outputs after forwarding (nothing to do if workspace is shared).
+        """
+        pass
+
     @core.typeguard
     def upload(self, items: dict[AnyPath, AnyPath], **kwargs):
         """
@@ -1,11 +1,22 @@
+import collections
+import copy
 import logging
 import os
+import posixpath
+import shlex
+import socket
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import paramiko
 from paramiko import util as paramiko_util
 
 from umk import core
+from umk.framework.adapters.go import Proxy as GoProxy
 from umk.framework.filesystem import Path
+from umk.framework.filesystem.manifest import Entry, Manifest, Patterns
 from umk.framework.remote.interface import Interface
 from umk.framework.system.environs import Environs
 from umk.framework.system.shell import Shell
@@ -32,6 +43,24 @@ class SecureShell(Interface):
         default="",
         description="Default shell (bash, sh, zsh ...)"
     )
+    sync: bool = core.Field(
+        default=False,
+        description="Upload changed project files before forwarding and download target outputs "
+                    "after it"
+    )
+    workdir: str = core.Field(
+        default="",
+        description="Remote project directory (relative to the user home or absolute)"
+    )
+    ignore: list[Path | str] = core.Field(
+        default_factory=list,
+        description="Paths (or '.dockerignore' like patterns) to exclude from synchronization"
+    )
+    proxy: None | Path = core.Field(
+        default=None,
+        description="Local GOPROXY mirror (see 'target.GolangMod.proxy') synced with the "
+                    "workspace, forwarded commands resolve Go modules from it"
+    )
 
     def client(self) -> paramiko.SSHClient:
         paramiko_util.get_logger('paramiko').setLevel(logging.ERROR)
@@ -51,15 +80,164 @@ class SecureShell(Interface):
     def execute(self, cmd: list[str], cwd: None | Path | str = None, env: None | Environs = None, **kwargs):
         paramiko_util.get_logger('paramiko').setLevel(logging.ERROR)
         client = self.client()
+        command = shlex.join([str(c) for c in cmd])
+        if env:
+            command = shlex.join(["env"] + [f"{k}={v}" for k, v in env.items()]) + " " + command
+        if self.proxy and self.sync:
+            command = f"{self.offline(core.globals.paths.work, env)} {command}"
+        if not cwd and self.sync:
+            cwd = self.workdir or core.globals.paths.work.name
+        if cwd:
+            command = f"cd {shlex.quote(str(cwd))} && {command}"
         _, out, err = client.exec_command(
-            command=Shell.stringify(cmd),
+            command=command,
             environment=None,
             get_pty=True
         )
+        prefix = kwargs.get("prefix", "")
         for line in out:
-            print(line.rstrip())
+            print(prefix + line.rstrip())
         for line in err:
-            print(line.rstrip())
+            print(prefix + line.rstrip())
+        code = out.channel.recv_exit_status()
+        client.close()
+        return code
+
+    def remote(self, root: Path, path: Path) -> str:
+        """
+        Returns remote path of the given project file.
+        """
+        rel = Path(path).expanduser().resolve().absolute().relative_to(root).as_posix()
+        return posixpath.join(self.workdir or root.name, rel)
+
+    def mirror(self, root: Path) -> str:
+        """
+        Returns remote path of the GOPROXY mirror (the project one is kept
+        at the same place of the remote workspace).
+        """
+        local = Path(self.proxy).expanduser().resolve().absolute()
+        if local.is_relative_to(root):
+            return self.remote(root, local)
+        return posixpath.join(self.workdir or root.name, ".goproxy")
+
+    def offline(self, root: Path, env: None | Environs = None) -> str:
+        """
+        Returns 'env' command prefix to resolve Go modules from the remote
+        GOPROXY mirror ('-mod=mod' is appended to the remote GOFLAGS).
+        """
+        root = Path(root).expanduser().resolve().absolute()
+        path = self.mirror(root)
+        # relative remote paths are relative to the user home
+        url = "file://" + shlex.quote(path)
+        if not posixpath.isabs(path):
+            url = 'file://"$HOME"/' + shlex.quote(path)
+        flags = '"${GOFLAGS:+$GOFLAGS }-mod=mod"'
+        if env and "GOFLAGS" in env:
+            flags = shlex.quote(GoProxy().environs(env["GOFLAGS"])["GOFLAGS"])
+        return f"env GOPROXY={url} GOFLAGS={flags} GOSUMDB=off"
+
+    def manifest(self, name: str) -> Path:
+        return core.globals.paths.cache / "sync" / f"{self.name}{name}.json"
+
+    def push(self, root: Path, **kwargs):
+        if not self.sync:
+            return
+        root = Path(root).expanduser().resolve().absolute()
+        exclude = Patterns.load(root / ".dockerignore")
+        # synchronization manifests are stored in the cache
+        for item in self.ignore + [core.globals.paths.cache]:
+            if isinstance(item, Path):
+                if not item.is_relative_to(root):
+                    continue
+                item = item.relative_to(root).as_posix()
+            exclude.add(item)
+        self._push(root, self.workdir or root.name, exclude, self.manifest(""), "workspace")
+        if self.proxy:
+            mirror = Path(self.proxy).expanduser().resolve().absolute()
+            if mirror.is_dir():
+                file = self.manifest(".goproxy")
+                self._push(mirror, self.mirror(root), Patterns(), file, "Go proxy mirror")
+
+    def _push(self, local: Path, remote: str, exclude: Patterns, file: Path, title: str):
+        """
+        Upload files of the local directory changed since the last push.
+        """
+        previous = Manifest.load(file)
+        current = Manifest.scan(local, exclude, previous)
+        changed, removed = current.diff(previous)
+        if not changed and not removed:
+            core.globals.console.print(f"[bold]\[{self.name}] {title} is up to date")
+            return
+        client = self.client()
+        with client.open_sftp() as transport:
+            directories = set()
+            for path in changed:
+                dst = posixpath.join(remote, path)
+                self._mkdirs(transport, posixpath.dirname(dst), directories)
+                transport.put(localpath=str(local / path), remotepath=dst)
+            for path in removed:
+                try:
+                    transport.remove(posixpath.join(remote, path))
+                except IOError:
+                    pass
+        client.close()
+        core.globals.console.print(
+            f"[bold]\[{self.name}] {title} synced: {len(changed)} uploaded, {len(removed)} removed "
+            f"({sum(current.entries[p].size for p in changed)} bytes)"
+        )
+        current.save(file)
+
+    def pull(self, root: Path, items: list[Path], **kwargs):
+        if not self.sync or not items:
+            return
+        root = Path(root).expanduser().resolve().absolute()
+        outputs = Manifest.load(self.manifest(".outputs"))
+        workspace = Manifest.load(self.manifest(""))
+        client = self.client()
+        with client.open_sftp() as transport:
+            for item in items:
+                local = Path(item).expanduser().resolve().absolute()
+                rel = local.relative_to(root).as_posix()
+                src = self.remote(root, local)
+                try:
+                    info = transport.stat(src)
+                except IOError:
+                    continue
+                if stat.S_ISDIR(info.st_mode or 0):
+                    continue
+                # remote file stat and local file digest are compared with the last pull
+                old = outputs.entries.get(rel)
+                remote = Entry(size=info.st_size, mtime=int(info.st_mtime) * 10 ** 9)
+                same = old and old.size == remote.size and old.mtime == remote.mtime
+                if same and local.exists() and Manifest.hash(local) == old.digest:
+                    core.globals.console.print(f"[bold]\[{self.name}] output is up to date: {rel}")
+                    continue
+                os.makedirs(local.parent, exist_ok=True)
+                core.globals.console.print(f"[bold]\[{self.name}] download: {src} -> {local}")
+                transport.get(remotepath=src, localpath=str(local))
+                if info.st_mode:
+                    os.chmod(local, info.st_mode & 0o777)
+                remote.digest = Manifest.hash(local)
+                outputs.entries[rel] = remote
+                # downloaded output must not be uploaded back
+                st = local.stat()
+                workspace.entries[rel] = Entry(
+                    size=st.st_size, mtime=st.st_mtime_ns, digest=remote.digest
+                )
+        client.close()
+        outputs.save(self.manifest(".outputs"))
+        workspace.save(self.manifest(""))
+
+    @staticmethod
+    def _mkdirs(transport: paramiko.SFTPClient, path: str, known: set[str]):
+        if not path or path in known:
+            return
+        try:
+            transport.stat(path)
+        except IOError:
+            SecureShell._mkdirs(transport, posixpath.dirname(path), known)
+            transport.mkdir(path)
+        known.add(path)
 
     @core.typeguard
     def upload(self, paths: dict[str | Path, str | Path], **kwargs):
@@ -84,10 +262,140 @@ class SecureShell(Interface):
             for src, dst in items.items():
                 core.globals.console.print(f"[bold]\[{self.name}] download: {src} -> {dst}")
                 dst = Path(dst).expanduser().resolve().absolute()
-                if not dst.parent.exists():
-                    os.makedirs(dst.parent)
-                transport.get(
-                    remotepath=str(src),
-                    localpath=str(dst)
-                )
+                self._get(transport, str(src), dst)
         client.close()
+
+    @staticmethod
+    def _get(transport: paramiko.SFTPClient, src: str, dst: Path):
+        # directories are downloaded recursively
+        if stat.S_ISDIR(transport.stat(src).st_mode or 0):
+            os.makedirs(dst, exist_ok=True)
+            for entry in transport.listdir_attr(src):
+                SecureShell._get(
+                    transport, f"{src.rstrip('/')}/{entry.filename}", dst / entry.filename
+                )
+            return
+        os.makedirs(dst.parent, exist_ok=True)
+        transport.get(remotepath=src, localpath=str(dst))
+
+
+class Load(core.Model):
+    alive: bool = core.Field(default=True, description="Whether host is reachable")
+    running: int = core.Field(default=0, description="Number of the running jobs")
+    done: int = core.Field(default=0, description="Number of the finished jobs")
+    failed: int = core.Field(default=0, description="Number of the failed jobs")
+    seconds: float = core.Field(default=0.0, description="Total jobs execution time")
+
+
+class Pool(Interface):
+    hosts: list[SecureShell] = core.Field(
+        default_factory=list,
+        description="Build hosts (workspace synchronization is enabled for all of them)"
+    )
+    slots: int = core.Field(
+        default=1,
+        description="Number of the concurrent jobs per host"
+    )
+    retries: int = core.Field(
+        default=2,
+        description="Number of the job retries on the other hosts if a host dies"
+    )
+
+    def dispatch(self, jobs: dict[str, list[str]], outputs: dict[str, list[Path]]) -> int:
+        """
+        Run independent jobs (name -> command) on the hosts. Idle hosts take the next
+        queued job, job of a dead host is requeued to the others. Returns the number
+        of the failed jobs.
+        """
+        root = core.globals.paths.work
+        # workspace synchronization is enabled for the copies, the configured hosts are untouched
+        hosts = [copy.deepcopy(host) for host in self.hosts]
+        for host in hosts:
+            host.sync = True
+        loads = {host.name: Load() for host in hosts}
+        queue = collections.deque((name, cmd, 0) for name, cmd in jobs.items())
+        cond = threading.Condition()
+        state = {"pending": len(jobs), "failed": 0}
+
+        def sync(host: SecureShell):
+            try:
+                host.push(root)
+            except (paramiko.SSHException, socket.error, EOFError) as err:
+                loads[host.name].alive = False
+                core.globals.console.print(
+                    f"[bold red]\[{self.name}] host '{host.name}' is unreachable: {err}"
+                )
+
+        def worker(host: SecureShell):
+            load = loads[host.name]
+            while True:
+                with cond:
+                    while not queue and state["pending"] > 0 and load.alive:
+                        cond.wait()
+                    if state["pending"] == 0 or not load.alive:
+                        return
+                    name, cmd, attempt = queue.popleft()
+                    load.running += 1
+                start = time.monotonic()
+                try:
+                    code = host.execute(cmd, prefix=f"[{name}@{host.name}] ")
+                    if code == -1:
+                        # paramiko reports connection dropped mid-command by -1 exit status
+                        raise paramiko.SSHException("connection lost")
+                    host.pull(root, outputs.get(name, []))
+                except (paramiko.SSHException, socket.error, EOFError) as err:
+                    with cond:
+                        load.running -= 1
+                        load.alive = False
+                        others = any(v.alive for v in loads.values())
+                        if attempt < self.retries and others:
+                            core.globals.console.print(
+                                f"[bold yellow]\[{self.name}] host '{host.name}' failed ({err}), "
+                                f"retry '{name}'"
+                            )
+                            queue.append((name, cmd, attempt + 1))
+                        else:
+                            core.globals.console.print(
+                                f"[bold red]\[{self.name}] '{name}' failed: {err}"
+                            )
+                            state["pending"] -= 1
+                            state["failed"] += 1
+                        cond.notify_all()
+                    return
+                with cond:
+                    load.running -= 1
+                    load.done += 1
+                    load.seconds += time.monotonic() - start
+                    if code != 0:
+                        load.failed += 1
+                        state["failed"] += 1
+                    state["pending"] -= 1
+                    cond.notify_all()
+
+        with ThreadPoolExecutor(max_workers=max(1, len(hosts))) as executor:
+            list(executor.map(sync, hosts))
+        workers = [
+            threading.Thread(target=worker, args=(host,), daemon=True)
+            for host in hosts if loads[host.name].alive
+            for _ in range(max(1, self.slots))
+        ]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        # jobs left in queue when all the hosts are dead
+        failed = state["failed"] + len(queue)
+        for host in hosts:
+            load = loads[host.name]
+            status = "alive" if load.alive else "dead"
+            core.globals.console.print(
+                f"[bold]\[{self.name}] {host.name} ({status}): "
+                f"{load.done} done, {load.failed} failed, {load.seconds:.1f}s busy"
+            )
+        return failed
+
+    @core.typeguard
+    def execute(self, cmd: list[str], cwd: None | Path | str = None, env: None | Environs = None,
+                **kwargs):
+        return self.dispatch({self.name: cmd}, {})
@@ -2,6 +2,7 @@ import abc
 import asyncio
 import subprocess
 import sys
+import threading
 from asyncio import subprocess as async_subprocess
 from pathlib import Path
 from umk.core.typings import Callable
@@ -175,27 +176,25 @@ class Shell(core.Model):
             self.handler.on_exception(e)
             return
 
-        if out != err != pipe:
+        if out != err != pipe or not (prc.stdout or prc.stderr):
             return prc.wait()
 
-        while True:
-            code = prc.poll()
-            if code is not None:
-                if prc.stdout:
-                    for line in prc.stdout.readlines():
-                        self.handler.on_output(line.rstrip())
-                if prc.stderr:
-                    for line in prc.stderr.readlines():
-                        self.handler.on_error(line.rstrip())
-                return code
-            if prc.stdout:
-                o = prc.stdout.readline()
-                if o:
-                    self.handler.on_output(o.rstrip())
-            if prc.stderr:
-                e = prc.stderr.readline()
-                if e:
-                    self.handler.on_error(e.strip())
+        # Read stderr in background: blocking on the one pipe while the process
+        # fills the other one deadlocks.
+        def errors():
+            for line in prc.stderr:
+                self.handler.on_error(line.rstrip())
+
+        reader = None
+        if prc.stderr:
+            reader = threading.Thread(target=errors, daemon=True)
+            reader.start()
+        if prc.stdout:
+            for o in prc.stdout:
+                self.handler.on_output(o.rstrip())
+        if reader:
+            reader.join()
+        return prc.wait()
 
     def _descriptors(self):
         inp = None
@@ -1,9 +1,30 @@
 import copy
+import heapq
+import os
+import re
+import shlex
+import shutil
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from rich.table import Table
 
 from umk import core
+from umk.framework import utils
+from umk.framework.utils import stats
+from umk.framework.adapters import docker
+from umk.framework.adapters import git
 from umk.framework.filesystem import Path
 from umk.framework.adapters.go import Go as Tool
 from umk.framework.adapters.go import Build as GoBuild
+from umk.framework.adapters.go import Coverage as GoCoverage
+from umk.framework.adapters.go import Module as GoModule
+from umk.framework.adapters.go import Proxy as GoProxy
+from umk.framework.adapters.go import Profile as GoProfile
+from umk.framework.adapters.go import TestStream as GoTestStream
+from umk.framework.system.environs import Environs
+from umk.framework.system.shell import Fetch, Shell
 from umk.framework.target.interface import Interface
 
 
@@ -14,6 +35,87 @@ class GolangBinary(Interface):
             description="Port to run delve on"
         )
 
+    class Platform(core.Model):
+        os: str = core.Field(
+            default="linux",
+            description="Target operating system (GOOS)"
+        )
+        arch: str = core.Field(
+            default="amd64",
+            description="Target architecture (GOARCH)"
+        )
+        cgo: bool = core.Field(
+            default=False,
+            description="Enable cgo (CGO_ENABLED)"
+        )
+
+        @staticmethod
+        def parse(value: str) -> 'GolangBinary.Platform':
+            """
+            Parse platform from 'os/arch' or 'os/arch+cgo' string.
+            """
+            spec, _, extra = value.strip().partition("+")
+            goos, _, goarch = spec.partition("/")
+            if not goos or not goarch or extra not in ("", "cgo"):
+                raise ValueError(f"Invalid golang platform: given={value}, expect=os/arch[+cgo]")
+            return GolangBinary.Platform(os=goos, arch=goarch, cgo=extra == "cgo")
+
+        def __str__(self):
+            return f"{self.os}/{self.arch}" + ("+cgo" if self.cgo else "")
+
+        def filename(self, name: str) -> str:
+            result = f"{name}_{self.os}_{self.arch}"
+            return result + ".exe" if self.os == "windows" else result
+
+        def environs(self) -> dict[str, str]:
+            return {"GOOS": self.os, "GOARCH": self.arch, "CGO_ENABLED": str(int(self.cgo))}
+
+    class Pgo(core.Model):
+        profile: None | Path = core.Field(
+            default=None,
+            description="Merged profile file ('default.pgo' of the main package by default)"
+        )
+        workload: list[str] = core.Field(
+            default_factory=list,
+            description="Workload command, '{binary}' and '{profile}' are replaced by binary "
+                        "and CPU profile paths"
+        )
+        benchmarks: str = core.Field(
+            default=".",
+            description="Benchmarks pattern to profile and measure if there is no workload"
+        )
+        packages: list[str] = core.Field(
+            default_factory=list,
+            description="Packages to run benchmarks of (build sources by default)"
+        )
+        runs: int = core.Field(
+            default=3,
+            description="Number of runs to collect profiles and to measure speedup"
+        )
+        refresh: bool = core.Field(
+            default=False,
+            description="Collect new profile even if it already exists"
+        )
+
+    class Sizes(core.Model):
+        packages: int = core.Field(
+            default=15,
+            description="Number of the largest packages to report"
+        )
+        symbols: int = core.Field(
+            default=10,
+            description="Number of the largest symbols to report and record"
+        )
+        limit: None | int = core.Field(
+            default=None,
+            description="Fail if binary size (bytes) exceeds the limit"
+        )
+        growth: None | float = core.Field(
+            default=None,
+            description="Fail if binary grows more than the given percent against the previous "
+                        "build"
+        )
+
     tool: Tool = core.Field(
         default_factory=Tool,
         description="Golang tool object"
@@ -26,17 +128,48 @@ class GolangBinary(Interface):
         default_factory=Debug,
         description="Debug options"
     )
+    platforms: list[Platform] = core.Field(
+        default_factory=list,
+        description="Cross compilation matrix (builds '<name>_<os>_<arch>[.exe]' binaries)"
+    )
+    jobs: None | int = core.Field(
+        default=None,
+        description="Number of the concurrent platform builds (CPU count by default)"
+    )
+    timing: bool = core.Field(
+        default=False,
+        description="Profile compile time of the packages ('-toolexec' shim) and print the report "
+                    "(not with 'pgo' or 'platforms')"
+    )
+    trace: None | Path = core.Field(
+        default=None,
+        description="Chrome trace file to export compile time profile to"
+    )
+    pgo: None | Pgo = core.Field(
+        default=None,
+        description="Profile-guided optimization pipeline (profile, merge, rebuild and measure, "
+                    "not with 'timing' or 'platforms')"
+    )
+    sizes: None | Sizes = core.Field(
+        default=None,
+        description="Record binary size with per package and per symbol breakdown and report "
+                    "the deltas"
+    )
 
     @staticmethod
     @core.typeguard
-    def new(*, name: str, tool: Tool, build: GoBuild, port: int = 2345, label: str = "", description: str = "") -> tuple['GolangBinary', 'GolangBinary']:
+    def new(*, name: str, tool: Tool, build: GoBuild, port: int = 2345, label: str = "",
+            description: str = "", platforms: None | list[Platform] = None,
+            jobs: None | int = None) -> tuple['GolangBinary', 'GolangBinary']:
         base = GolangBinary(
             name=name.strip(),
             label=label.strip(),
             description=description.strip(),
             tool=tool,
             build=build,
-            debug=GolangBinary.Debug(port=port)
+            debug=GolangBinary.Debug(port=port),
+            platforms=platforms or [],
+            jobs=jobs,
         )
         if not base.label:
             base.label = f"Binary '{base.name}'"
@@ -65,10 +198,518 @@ class GolangBinary(Interface):
         result.type = "Target.Golang.Binary"
         result.properties.new("Tool", self.tool.shell.cmd, "Golang tool object")
         result.properties.new("Build", " ".join(self.build.serialize()), "Build options")
+        if self.platforms:
+            platforms = [str(p) for p in self.platforms]
+            result.properties.new("Platforms", platforms, "Cross compilation matrix")
+        return result
+
+    @core.typeguard
+    def dockerfile(self, context: Path, *, builder: None | str = None, runtime: None | str = None,
+                   cgo: bool = False, path: None | Path = None) -> docker.File:
+        """
+        Generate multi-stage Dockerfile builds the binary inside the given context.
+        Stages are ordered from the rarely to the frequently changed ones: modules
+        download (go.mod, go.sum), compilation with cache mounts, runtime image.
+        """
+        context = Path(context).expanduser().resolve().absolute()
+        name = Path(self.build.output).name if self.build.output else self.name
+        if builder is None:
+            builder = "golang"
+            modfile = context / "go.mod"
+            if modfile.exists():
+                found = re.search(r"^go\s+(\d+\.\d+)", modfile.read_text(), re.MULTILINE)
+                if found:
+                    builder += f":{found.group(1)}"
+        if runtime is None:
+            runtime = "gcr.io/distroless/" + ("base-debian12" if cgo else "static-debian12")
+
+        options = copy.deepcopy(self.build)
+        options.output = Path("/out") / name
+        options.source = [self._relative(context, source) for source in self.build.source]
+        vendor = (context / "vendor").exists()
+        if vendor:
+            options.mod.strategy = "vendor"
+        mounts = docker.FileMount.gocache() + docker.FileMount.gomodcache()
+
+        result = docker.File(path=path or context, name=f"Dockerfile.{name}")
+        result.froms(builder, alias="deps")
+        result.workdir("/src", space=0)
+        if not vendor:
+            modules = [m for m in ("go.mod", "go.sum") if (context / m).exists()]
+            if modules:
+                result.copy(" ".join(modules), "./", space=0)
+                result.run(["go mod download"], mounts=docker.FileMount.gomodcache(), space=0)
+
+        result.froms("deps", alias="build", space=1)
+        result.copy(".", ".", space=0)
+        result.run(
+            [f"CGO_ENABLED={int(cgo)} go build {shlex.join(options.serialize())}"],
+            mounts=mounts,
+            space=0,
+        )
+
+        result.froms(runtime, space=1)
+        result.copy(f"/out/{name}", f"/usr/local/bin/{name}", stage="build", space=0)
+        result.entrypoint([f"/usr/local/bin/{name}"], space=0)
+        return result
+
+    @staticmethod
+    def _relative(context: Path, source: str | Path) -> str:
+        if isinstance(source, str) and not os.path.isabs(source):
+            return source
+        path = Path(source).expanduser().resolve().absolute()
+        if not path.is_relative_to(context):
+            raise ValueError(
+                f"Golang source is outside of the build context: source={path}, context={context}"
+            )
+        result = path.relative_to(context).as_posix()
+        return "./" + result if result != "." else "."
+
+    def outputs(self) -> list[Path]:
+        if self.platforms:
+            return [Path(options.output) for _, _, options in self.matrix()]
+        if not self.build.output:
+            return []
+        return [Path(self.build.output).expanduser().resolve().absolute()]
+
+    def matrix(self) -> list[tuple[Platform, Tool, GoBuild]]:
+        """
+        Per platform tools (GOOS, GOARCH, CGO_ENABLED) and build options.
+        """
+        output = Path(self.build.output or self.name).expanduser().resolve().absolute()
+        name = output.stem if output.suffix == ".exe" else output.name
+        result = []
+        for platform in self.platforms:
+            tool = copy.deepcopy(self.tool)
+            environs = Environs(inherit=tool.shell.environs is None)
+            environs.update(tool.shell.environs or {})
+            environs.update(platform.environs())
+            tool.shell.environs = environs
+            options = copy.deepcopy(self.build)
+            options.output = output.parent / platform.filename(name)
+            result.append((platform, tool, options))
         return result
 
+    def batchable(self) -> None | str:
+        """
+        Returns key of the binaries that can be built by a single 'go build -o dir/'
+        call (same tool and options apart from output and main package), or None
+        if the target has to be built on its own.
+        """
+        if self.platforms or self.timing or self.pgo or self.sizes:
+            return None
+        if not self.build.output or len(self.build.source) != 1:
+            return None
+        source = str(self.build.source[0]).rstrip("/")
+        output = Path(self.build.output)
+        if source.endswith(".go") or source in (".", "") or output.name != Path(source).name:
+            return None
+        options = copy.deepcopy(self.build)
+        options.output = None
+        options.source = []
+        shell = self.tool.shell
+        return core.json.text({
+            "cmd": [str(c) for c in shell.cmd],
+            "workdir": str(shell.workdir or ""),
+            "environs": dict(shell.environs or {}),
+            "options": options.serialize(),
+            "outdir": str(output.expanduser().resolve().absolute().parent),
+        })
+
+    @staticmethod
+    def batch(targets: list['GolangBinary']) -> bool:
+        """
+        Build binaries of the same batch key by a single 'go build' invocation, so
+        the package graph is loaded and the build cache is checked only once.
+        """
+        first = targets[0]
+        options = copy.deepcopy(first.build)
+        options.source = [t.build.source[0] for t in targets]
+        outdir = Path(first.build.output).expanduser().resolve().absolute().parent
+        names = ", ".join(t.name for t in targets)
+        core.globals.console.print(f"[bold]Build {len(targets)} golang binaries at once: {names}")
+        return first.tool.build(options, outdir=outdir) == 0
+
+    def profile(self) -> GoProfile:
+        """
+        Build the binary with toolexec shim which records every compile, asm and
+        link invocation, print the slowest packages and the critical path.
+        """
+        log = core.globals.paths.cache / "go" / "timing" / f"{self.name}.jsonl"
+        log.unlink(missing_ok=True)
+        options = copy.deepcopy(self.build)
+        options.toolexec = GoProfile.toolexec(log)
+        if self.tool.build(options) != 0:
+            core.globals.console.print(
+                f"[bold red]\[{self.name}] failed to build binary, compile time is not profiled"
+            )
+            core.globals.close(1)
+        result = GoProfile.load(log)
+
+        root = Path(self.tool.shell.workdir or os.getcwd())
+        packages = self.tool.packages(root, *[str(s) for s in self.build.source])
+        length, path = result.critical(packages)
+        total = sum(r.duration for r in result.records)
+
+        table = Table(
+            title=f"SLOWEST PACKAGES ({self.name})",
+            title_style="bold cyan",
+            title_justify="left",
+            show_edge=False,
+            box=None,
+        )
+        table.add_column("Package", justify="left", style="bold", no_wrap=True)
+        table.add_column("Time", justify="right")
+        table.add_column("Share", justify="right")
+        for name, value in list(result.packages().items())[:15]:
+            table.add_row(name, f"{value:.2f}s", f"{100 * value / total:.1f}%" if total else "")
+        core.globals.console.print(table)
+        core.globals.console.print(
+            f"[bold]\[{self.name}] wall {result.wall:.2f}s, tools {total:.2f}s, "
+            f"{len(result.records)} invocations, critical path {length:.2f}s"
+        )
+        if path:
+            core.globals.console.print(" -> ".join(path))
+        if not self.build.force:
+            core.globals.console.print(
+                "[yellow]Cached packages are not compiled, "
+                "use 'build.force' (-a) to profile full build"
+            )
+        if self.trace:
+            result.trace(Path(self.trace))
+            core.globals.console.print(f"[bold]\[{self.name}] trace: {self.trace}")
+        return result
+
+    def optimize(self) -> None | float:
+        """
+        Build binary without PGO, collect CPU profiles by the workload command or
+        benchmarks, merge them into the profile and rebuild binary with it.
+        Returns measured speedup (None if existing profile was used).
+        """
+        pgo = self.pgo
+        source = Path(str(self.build.source[0]) if self.build.source else ".")
+        main = source if source.is_dir() else source.parent
+        profile = Path(pgo.profile or main / "default.pgo")
+        profile = profile.expanduser().resolve().absolute()
+        final = copy.deepcopy(self.build)
+        final.pgo = str(profile)
+        if profile.exists() and not pgo.refresh:
+            if self.tool.build(final) != 0:
+                core.globals.console.print(
+                    f"[bold red]\[{self.name}] PGO: failed to build binary with profile"
+                )
+                core.globals.close(1)
+            return None
+
+        work = core.globals.paths.cache / "go" / "pgo" / self.name
+        shutil.rmtree(work, ignore_errors=True)
+        os.makedirs(work)
+        name = Path(self.build.output).name if self.build.output else self.name
+        base = copy.deepcopy(self.build)
+        base.pgo = "off"
+        base.output = work / "base" / name
+        if self.tool.build(base) != 0:
+            core.globals.console.print(
+                f"[bold red]\[{self.name}] PGO: failed to build binary without profile"
+            )
+            core.globals.close(1)
+
+        if pgo.workload:
+            profiles = []
+            for i in range(pgo.runs):
+                profiles.append(work / f"cpu.{i}.pprof")
+                self._workload(base.output, profiles[-1])
+        else:
+            profiles = self._benchmarks(work)
+        profiles = [p for p in profiles if p.exists()]
+        if not profiles:
+            core.globals.console.print(
+                f"[bold red]\[{self.name}] PGO: no CPU profiles were collected"
+            )
+            core.globals.close(1)
+        # merge into a temporary file, so a failed merge never leaves partial profile
+        merged = work / "merged.pgo"
+        code = self.tool.command("tool", "pprof", "-proto", f"-output={merged}", *profiles).sync()
+        if code != 0 or not merged.exists():
+            core.globals.console.print(
+                f"[bold red]\[{self.name}] PGO: failed to merge CPU profiles"
+            )
+            core.globals.close(1)
+        os.makedirs(profile.parent, exist_ok=True)
+        shutil.move(merged, profile)
+        if self.tool.build(final) != 0:
+            core.globals.console.print(
+                f"[bold red]\[{self.name}] PGO: failed to build binary with profile"
+            )
+            core.globals.close(1)
+
+        if pgo.workload:
+            output = Path(final.output or name).expanduser().resolve().absolute()
+            before, after = [], []
+            for _ in range(pgo.runs):
+                before.append(self._workload(base.output, work / "measure.pprof"))
+                after.append(self._workload(output, work / "measure.pprof"))
+            before, after = statistics.median(before), statistics.median(after)
+        else:
+            before = self._bench("off")
+            after = self._bench(str(profile))
+        speedup = before / after
+        core.globals.console.print(
+            f"[bold]\[{self.name}] PGO: {len(profiles)} profiles merged into '{profile}', "
+            f"speedup {speedup:.3f}x ({before:.4g} -> {after:.4g})"
+        )
+        utils.History("pgo").append({
+            "target": self.name,
+            "mode": "workload" if pgo.workload else "benchmarks",
+            "profiles": len(profiles),
+            "base": before,
+            "pgo": after,
+            "speedup": speedup,
+        })
+        return speedup
+
+    def _workload(self, binary: Path, profile: Path) -> float:
+        """
+        Run workload command against the binary, returns wall time in seconds.
+        """
+        values = {"binary": str(binary), "profile": str(profile)}
+        shell = Shell(
+            name=f"{self.name}.workload",
+            cmd=[arg.format(**values) for arg in self.pgo.workload],
+            workdir=self.tool.shell.workdir,
+            environs=Environs(UMK_PGO_BINARY=str(binary), UMK_PGO_PROFILE=str(profile)),
+        )
+        start = time.perf_counter()
+        if shell.sync() != 0:
+            core.globals.console.print(f"[bold red]\[{self.name}] PGO: workload failed")
+            core.globals.close(1)
+        return time.perf_counter() - start
+
+    def _benchmarks(self, work: Path) -> list[Path]:
+        """
+        Collect CPU profiles of the benchmarks ('-cpuprofile' accepts single package).
+        """
+        result = []
+        packages = self.pgo.packages or [str(s) for s in self.build.source] or ["."]
+        for i, package in enumerate(packages):
+            result.append(work / f"bench.{i}.pprof")
+            code = self.tool.command(
+                "test", "-run=^$", f"-bench={self.pgo.benchmarks}", "-pgo=off",
+                f"-cpuprofile={result[-1]}", package
+            ).sync()
+            if code != 0:
+                core.globals.console.print(
+                    f"[bold red]\[{self.name}] PGO: benchmarks of '{package}' failed"
+                )
+                core.globals.close(1)
+        return result
+
+    def _bench(self, pgo: str) -> float:
+        """
+        Geometric mean of benchmarks ns/op built with the given '-pgo' value
+        (fails if benchmarks fail or none of them matched).
+        """
+        packages = self.pgo.packages or [str(s) for s in self.build.source] or ["."]
+        shell = self.tool.command(
+            "test", "-run=^$", f"-bench={self.pgo.benchmarks}", f"-count={self.pgo.runs}",
+            f"-pgo={pgo}", *packages
+        )
+        shell.handler = Fetch()
+        if shell.sync() != 0:
+            core.globals.console.print(
+                f"[bold red]\[{self.name}] PGO: benchmarks failed (-pgo={pgo})"
+            )
+            core.globals.console.print(shell.handler.outstr(), highlight=False)
+            core.globals.close(1)
+        values: dict[str, list[float]] = {}
+        output = shell.handler.outstr()
+        for found in re.finditer(r"^(Benchmark\S+)\s+\d+\s+([\d.]+) ns/op", output, re.MULTILINE):
+            values.setdefault(found.group(1), []).append(float(found.group(2)))
+        if not values:
+            core.globals.console.print(
+                f"[bold red]\[{self.name}] PGO: no benchmarks matched '{self.pgo.benchmarks}'"
+            )
+            core.globals.close(1)
+        return statistics.geometric_mean([statistics.mean(v) for v in values.values()])
+
+    def analyze(self, binary: Path, platform: str = "") -> bool:
+        """
+        Record size of the built binary, its packages and the largest symbols
+        ('go tool nm') to the history and print deltas against the previous
+        build of the same target and platform. Returns False if the size limit
+        or the allowed growth is exceeded.
+        """
+        human = docker.context.human
+        sizes = self.sizes
+        binary = Path(binary).expanduser().resolve().absolute()
+        if not binary.exists():
+            core.globals.console.print(
+                f"[yellow]\[{self.name}] binary '{binary}' is not found, size is not recorded"
+            )
+            return True
+        symbols = self.tool.symbols(binary)
+        try:
+            repository = git.repository(Path(self.tool.shell.workdir or core.globals.paths.work))
+            commit = repository.head.commit.hexsha
+        except Exception:
+            commit = ""
+        history = utils.History("size")
+        previous = next((
+            r for r in reversed(history.load())
+            if r.get("target") == self.name and r.get("platform", "") == platform
+        ), None)
+        current = {
+            "target": self.name,
+            "platform": platform,
+            "commit": commit,
+            "size": binary.stat().st_size,
+            "symbols": symbols.total if symbols else 0,
+            "packages": symbols.packages() if symbols else {},
+            "top": symbols.top(sizes.symbols) if symbols else {},
+        }
+        history.append(current)
+
+        def delta(now: int, before: None | int) -> str:
+            if before is None:
+                return "new" if previous else ""
+            diff = now - before
+            if diff == 0:
+                return ""
+            color = "red" if diff > 0 else "green"
+            return f"[{color}]{'+' if diff > 0 else '-'}{human(abs(diff))}[/{color}]"
+
+        title = f"{self.name} {platform}".strip()
+        if symbols:
+            before = previous.get("packages", {}) if previous else {}
+            table = Table(
+                title=f"BINARY SIZE ({title})",
+                title_style="bold cyan",
+                title_justify="left",
+                show_edge=False,
+                box=None,
+            )
+            table.add_column("Package", justify="left", style="bold", no_wrap=True)
+            table.add_column("Size", justify="right")
+            table.add_column("Share", justify="right")
+            table.add_column("Delta", justify="right")
+            names = list(current["packages"])[:sizes.packages]
+            # Packages changed the most are shown even if they are not the largest ones
+            changed = sorted(
+                (n for n in set(current["packages"]) | set(before) if n not in names),
+                key=lambda n: abs(current["packages"].get(n, 0) - before.get(n, 0)),
+                reverse=True,
+            )
+            names += [
+                n for n in changed[:sizes.packages]
+                if current["packages"].get(n, 0) != before.get(n, 0)
+            ]
+            for name in names:
+                size = current["packages"].get(name, 0)
+                table.add_row(
+                    name,
+                    human(size),
+                    f"{100 * size / current['symbols']:.1f}%" if current["symbols"] else "",
+                    delta(size, before.get(name)) if previous else "",
+                )
+            core.globals.console.print(table)
+
+            table = Table(show_edge=False, box=None)
+            table.add_column("Symbol", justify="left", style="bold", overflow="fold")
+            table.add_column("Size", justify="right")
+            table.add_column("Delta", justify="right")
+            before = previous.get("top", {}) if previous else {}
+            for name, size in current["top"].items():
+                table.add_row(name, human(size), delta(size, before.get(name)) if previous else "")
+            core.globals.console.print(table)
+        else:
+            core.globals.console.print(
+                f"[yellow]\[{self.name}] binary has no symbol table (linked with '-s'), "
+                f"only size is recorded"
+            )
+
+        line = f"[bold]\[{title}] {binary.name}: {human(current['size'])}"
+        percent = 0.0
+        if previous:
+            diff = current["size"] - previous.get("size", 0)
+            percent = 100 * diff / previous["size"] if previous.get("size") else 0.0
+            since = previous.get("commit", "")[:10] or previous.get("time", "")
+            sign = '+' if diff >= 0 else '-'
+            line += f" ({sign}{human(abs(diff))}, {percent:+.2f}% since {since})"
+        core.globals.console.print(line)
+        ok = True
+        if previous and sizes.growth is not None and percent > sizes.growth:
+            core.globals.console.print(
+                f"[bold red]\[{title}] binary grew by {percent:.2f}% (allowed {sizes.growth:.2f}%)"
+            )
+            ok = False
+        if sizes.limit is not None and current["size"] > sizes.limit:
+            core.globals.console.print(
+                f"[bold red]\[{title}] binary size exceeds the limit of {human(sizes.limit)}"
+            )
+            ok = False
+        return ok
+
+    def affected(self, since: str) -> bool:
+        root = Path(self.tool.shell.workdir or core.globals.paths.work)
+        root = root.expanduser().resolve().absolute()
+        affected = self.tool.affected(root, since)
+        if affected is None:
+            return True
+        sources = set()
+        for source in self.build.source or ["."]:
+            path = (root / str(source)).resolve()
+            sources.add(path.parent if path.suffix == ".go" else path)
+        mains = {p.path for p in self.tool.packages(root).main() if Path(p.dir) in sources}
+        return not mains or bool(mains & affected)
+
     def run(self, **kwargs):
-        self.tool.build(self.build)
+        if self.pgo and self.timing:
+            # PGO pipeline builds the binary several times, its compile time is not representative
+            core.globals.error_console.print(
+                f"\[{self.name}] 'pgo' and 'timing' can't be used together"
+            )
+            core.globals.close(-1)
+        if self.platforms and self.timing:
+            # matrix builds run concurrently, their compile times are not representative
+            core.globals.error_console.print(
+                f"\[{self.name}] 'timing' can't be used with 'platforms'"
+            )
+            core.globals.close(-1)
+        if self.platforms and self.pgo:
+            # workloads and benchmarks run the host binary only
+            core.globals.error_console.print(
+                f"\[{self.name}] 'pgo' can't be used with 'platforms'"
+            )
+            core.globals.close(-1)
+        if not self.platforms:
+            if self.pgo:
+                self.optimize()
+            elif self.timing:
+                self.profile()
+            else:
+                self.tool.build(self.build)
+            if self.sizes and not all(self.analyze(output) for output in self.outputs()):
+                core.globals.close(1)
+            return
+        # Concurrent builds share the Go build cache (it is safe for concurrent use),
+        # so packages common to several platforms are compiled once per GOOS/GOARCH.
+        matrix = self.matrix()
+        jobs = self.jobs or min(len(matrix), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            codes = list(executor.map(lambda item: item[1].build(item[2]), matrix))
+        failed = 0
+        for (platform, _, options), code in zip(matrix, codes):
+            if code == 0:
+                core.globals.console.print(f"[bold]\[{self.name}] {platform}: {options.output}")
+                if self.sizes and not self.analyze(options.output, str(platform)):
+                    failed += 1
+            else:
+                failed += 1
+                core.globals.console.print(
+                    f"[bold red]\[{self.name}] {platform}: failed (code={code})"
+                )
+        if failed:
+            core.globals.close(1)
 
 
 class GolangMod(Interface):
@@ -88,12 +729,113 @@ class GolangMod(Interface):
         default=False,
         description="Vendors downloaded packages"
     )
+    proxy: None | Path = core.Field(
+        default=None,
+        description="Populate file based GOPROXY mirror of the required modules "
+                    "(see 'go.Go.offline')"
+    )
+    jobs: None | int = core.Field(
+        default=None,
+        description="Number of the parallel copies to populate proxy"
+    )
+    fingerprint: bool = core.Field(
+        default=True,
+        description="Skip tidy and vendor if go.mod, go.sum, imports and Go version are unchanged"
+    )
 
     def run(self, **kwargs):
         self.tool.shell.workdir = self.path
-        self.tool.mod.tidy(compat=self.compat)
+        root = Path(self.path or os.getcwd()).expanduser().resolve().absolute()
+        state = core.globals.paths.cache / "go" / "mod" / f"{utils.digest(str(root))[:16]}.digest"
+        current = self.digest(root) if self.fingerprint else ""
+        unchanged = bool(current) and state.exists() and state.read_text() == current
+        if unchanged:
+            core.globals.console.print(f"[bold]\[{self.name}] Module is unchanged, skip tidy")
+        else:
+            self.tool.mod.tidy(compat=self.compat).sync()
         if self.vendor:
-            self.tool.mod.vendor()
+            if unchanged and self.vendored(root):
+                core.globals.console.print(
+                    f"[bold]\[{self.name}] Vendor directory is consistent, skip vendoring"
+                )
+            else:
+                self.tool.mod.vendor().sync()
+        if current and not unchanged:
+            current = self.digest(root)
+            os.makedirs(state.parent, exist_ok=True)
+            state.write_text(current)
+        if self.proxy:
+            self.mirror()
+
+    def digest(self, root: Path) -> str:
+        """
+        Fingerprint of the module files, imports of all packages and Go version.
+        """
+        chunks = [self.tool.version(), self.compat, str(self.vendor)]
+        for name in ("go.mod", "go.sum"):
+            file = root / name
+            chunks.append(utils.digest(file.read_bytes()) if file.exists() else "")
+        packages = self.tool.packages(root)
+        if packages is None:
+            return ""
+        return utils.digest(*chunks, *sorted(packages.imports()))
+
+    @staticmethod
+    def vendored(root: Path) -> bool:
+        """
+        Cheap vendor consistency check: every go.mod requirement is listed
+        in 'vendor/modules.txt'.
+        """
+        modules = root / "vendor" / "modules.txt"
+        if not modules.exists():
+            return False
+        listed = set()
+        for line in modules.read_text().splitlines():
+            parts = line.split()
+            if len(parts) >= 3 and parts[0] == "#":
+                listed.add((parts[1], parts[2]))
+        required = set()
+        block = False
+        for line in (root / "go.mod").read_text().splitlines():
+            line = line.split("//")[0].strip()
+            if line.startswith("require ("):
+                block = True
+                continue
+            if block and line == ")":
+                block = False
+                continue
+            if line.startswith("require "):
+                line = line[len("require "):]
+            elif not block:
+                continue
+            parts = line.split()
+            if len(parts) >= 2:
+                required.add((parts[0], parts[1]))
+        return required <= listed
+
+    def mirror(self):
+        """
+        Download required modules and copy them to the proxy directory.
+        """
+        shell = self.tool.mod.download(json=True)
+        shell.workdir = self.path
+        shell.handler = Fetch()
+        code = shell.sync()
+        modules = GoModule.parse(shell.handler.outstr())
+        failed = [m for m in modules if m.error]
+        for module in failed:
+            core.globals.console.print(f"[bold red]{module.path}@{module.version}: {module.error}")
+        if code != 0 and not modules:
+            core.globals.console.print(
+                f"[bold red]Failed to download modules: {shell.handler.errstr()}"
+            )
+            return
+        proxy = GoProxy(root=self.proxy)
+        copied, skipped = proxy.populate(modules, self.jobs)
+        core.globals.console.print(
+            f"[bold]Go proxy '{proxy.url}': {len(modules) - len(failed)} modules, "
+            f"{copied} files copied, {skipped} up to date"
+        )
 
     def object(self) -> core.Object:
         result = core.Object()
@@ -102,5 +844,511 @@ class GolangMod(Interface):
         result.properties.new("Path", self.path, "Directory with go.mod")
         result.properties.new("Compat", self.compat, desc="Preserves any additional checksums (see 'go help mod tidy')")
         result.properties.new("Vendor", self.vendor, "Vendors packages or not")
+        result.properties.new("Proxy", self.proxy, "File based GOPROXY mirror")
+        result.properties.new(
+            "Fingerprint", self.fingerprint, "Skip tidy and vendor if module is unchanged"
+        )
         return result
 
+
+class GolangBench(Interface):
+    tool: Tool = core.Field(
+        default_factory=Tool,
+        description="Go tool object"
+    )
+    path: None | Path = core.Field(
+        default=None,
+        description="Module directory to run benchmarks in"
+    )
+    packages: list[str] = core.Field(
+        default_factory=lambda: ["./..."],
+        description="Packages to benchmark"
+    )
+    pattern: str = core.Field(
+        default=".",
+        description="Benchmarks pattern ('-bench')"
+    )
+    count: int = core.Field(
+        default=6,
+        description="Number of runs of each benchmark ('-count', at least 5 to detect "
+                    "significant changes)"
+    )
+    benchtime: str = core.Field(
+        default="",
+        description="Benchmark duration or iterations ('-benchtime', e.g. 1s, 100x)"
+    )
+    baseline: str = core.Field(
+        default="",
+        description="Git reference of the baseline results (the latest results of the other "
+                    "commit by default)"
+    )
+    alpha: float = core.Field(
+        default=0.05,
+        description="Significance level of the Mann-Whitney U test"
+    )
+    thresholds: dict[str, float] = core.Field(
+        default_factory=lambda: {"ns/op": 5.0, "allocs/op": 0.0},
+        description="Allowed increase (percent) of the metrics, significant excess fails the target"
+    )
+
+    def affected(self, since: str) -> bool:
+        return bool(self.selection(since) != [])
+
+    def selection(self, since: str) -> None | list[str]:
+        """
+        Affected packages to run (None if all of them).
+        """
+        if not since:
+            return None
+        root = Path(self.path or core.globals.paths.work).expanduser().resolve().absolute()
+        affected = self.tool.affected(root, since, *self.packages)
+        if affected is None:
+            return None
+        listing = self.tool.packages(root, *self.packages)
+        return sorted(p.path for p in listing.listed() if p.path in affected)
+
+    def run(self, **kwargs):
+        packages = self.selection(kwargs.get("since", ""))
+        if packages == []:
+            core.globals.console.print(f"[bold]\[{self.name}] no affected packages")
+            return
+        shell = self.tool.command(
+            "test", "-run=^$", f"-bench={self.pattern}", "-benchmem", f"-count={self.count}",
+            "-json", *([f"-benchtime={self.benchtime}"] if self.benchtime else []),
+            *(packages or self.packages)
+        )
+        shell.workdir = self.path
+        shell.handler = GoTestStream()
+        code = shell.sync()
+        for line in shell.handler.errors:
+            core.globals.console.print(f"[red]{line}", highlight=False)
+        if code != 0:
+            core.globals.console.print(
+                f"[bold red]\[{self.name}] benchmarks failed: {', '.join(shell.handler.failed())}"
+            )
+            core.globals.close(1)
+
+        current: dict[str, dict[str, list[float]]] = {}
+        for bench in shell.handler.benchmarks:
+            for unit, value in bench.metrics.items():
+                current.setdefault(bench.key, {}).setdefault(unit, []).append(value)
+
+        try:
+            repo = git.repository(Path(self.path or core.globals.paths.work))
+            commit = repo.head.commit.hexsha
+            dirty = repo.is_dirty()
+        except Exception:
+            # not a git tree (or no commits yet): the previous run is the baseline
+            repo, commit, dirty = None, "", False
+        history = utils.History("bench")
+        baseline = self.reference(history, repo, commit, dirty)
+        history.append({"target": self.name, "commit": commit, "dirty": dirty, "results": current})
+
+        if baseline is None:
+            core.globals.console.print(
+                f"[bold]\[{self.name}] {len(current)} benchmarks recorded, there is no baseline"
+            )
+            return
+        regressions = self.compare(baseline, current)
+        if regressions:
+            core.globals.console.print(
+                f"[bold red]\[{self.name}] {regressions} regressions against {self.label(baseline)}"
+            )
+            core.globals.close(1)
+
+    def reference(self, history: utils.History, repo, commit: str, dirty: bool) -> None | dict:
+        """
+        Baseline record: the latest one of the 'baseline' commit or the latest
+        one of the other commit (clean HEAD results are baseline of the dirty tree).
+        Without git the latest record is the baseline.
+        """
+        wanted = repo.commit(self.baseline).hexsha if self.baseline and repo else None
+        for record in reversed(history.load()):
+            if record.get("target") != self.name:
+                continue
+            if not commit:
+                return record
+            if wanted is not None:
+                if record.get("commit") == wanted:
+                    return record
+            elif record.get("commit") != commit or (dirty and not record.get("dirty")):
+                return record
+        return None
+
+    @staticmethod
+    def label(record: dict) -> str:
+        return record.get("commit", "")[:10] or record.get("time", "")
+
+    def compare(self, baseline: dict, current: dict[str, dict[str, list[float]]]) -> int:
+        """
+        Print benchstat-like comparison, returns number of significant regressions.
+        """
+        table = Table(
+            title=f"BENCHMARKS ({self.name} vs {self.label(baseline)})",
+            title_style="bold cyan",
+            title_justify="left",
+            show_edge=False,
+            box=None,
+        )
+        for column in ("Benchmark", "Metric", "Old", "New", "Delta", "P"):
+            justify = "left" if column in ("Benchmark", "Metric") else "right"
+            table.add_column(column, justify=justify, no_wrap=True)
+        regressions = 0
+        for key, metrics in sorted(current.items()):
+            for unit, new in metrics.items():
+                old = baseline.get("results", {}).get(key, {}).get(unit)
+                if not old:
+                    continue
+                p = stats.mannwhitney(old, new)
+                before, after = stats.median(old), stats.median(new)
+                delta = (after - before) / before * 100 if before else 0.0
+                low, high = stats.confidence(new)
+                threshold = self.thresholds.get(unit)
+                regressed = threshold is not None and p < self.alpha and delta > threshold
+                regressions += regressed
+                change = "~"
+                if p < self.alpha:
+                    style = "bold red" if regressed else ("green" if delta < 0 else "yellow")
+                    change = f"[{style}]{delta:+.2f}%"
+                table.add_row(
+                    key, unit, f"{before:.4g}", f"{after:.4g} [{low:.4g}, {high:.4g}]", change,
+                    f"{p:.3f}"
+                )
+        core.globals.console.print(table)
+        return regressions
+
+    def object(self) -> core.Object:
+        result = super().object()
+        result.type = "Target.Golang.Bench"
+        result.properties.new("Packages", self.packages, "Packages to benchmark")
+        result.properties.new("Pattern", self.pattern, "Benchmarks pattern")
+        result.properties.new("Count", self.count, "Number of runs of each benchmark")
+        result.properties.new("Baseline", self.baseline, "Git reference of the baseline results")
+        return result
+
+
+class GolangTest(Interface):
+    tool: Tool = core.Field(
+        default_factory=Tool,
+        description="Go tool object"
+    )
+    path: None | Path = core.Field(
+        default=None,
+        description="Module directory to run tests in"
+    )
+    packages: list[str] = core.Field(
+        default_factory=lambda: ["./..."],
+        description="Packages to test"
+    )
+    flags: list[str] = core.Field(
+        default_factory=list,
+        description="Additional 'go test' flags (e.g. -race, -short)"
+    )
+    workers: None | int = core.Field(
+        default=None,
+        description="Number of the parallel 'go test' processes (CPU count by default)"
+    )
+    shard: str = core.Field(
+        default="",
+        description="Run only the 'index/total' shard of the packages (UMK_TEST_SHARD overrides it)"
+    )
+    cache: bool = core.Field(
+        default=True,
+        description="Report passed packages with unchanged fingerprint from the umk results cache"
+    )
+
+    def run(self, **kwargs):
+        root = Path(self.path or core.globals.paths.work).expanduser().resolve().absolute()
+        listing = self.tool.packages(root, *self.packages)
+        if listing is None:
+            core.globals.console.print(f"[bold red]\[{self.name}] failed to list packages")
+            core.globals.close(1)
+        testable = [p.path for p in listing.listed() if p.testable]
+        since = kwargs.get("since", "")
+        if since:
+            affected = self.tool.affected(root, since, *self.packages)
+            if affected is not None:
+                core.globals.console.print(
+                    f"[bold]\[{self.name}] {len(affected & set(testable))} of {len(testable)} "
+                    f"packages are affected since '{since}'"
+                )
+                testable = [name for name in testable if name in affected]
+        # toolchain settings (GOFLAGS with build tags, GOOS/GOARCH, CGO_ENABLED, ...) change
+        # the results
+        env = {**os.environ, **(self.tool.shell.environs or {})}
+        chunks = [
+            self.tool.version(), *self.tool.shell.cmd, *self.flags,
+            *[f"{k}={v}" for k, v in sorted(env.items()) if k.startswith(("GO", "CGO_"))]
+        ]
+        for name in ("go.mod", "go.sum"):
+            file = root / name
+            chunks.append(utils.digest(file.read_bytes()) if file.exists() else "")
+        fingerprints = listing.fingerprints(*chunks)
+
+        durations = self.durations()
+        shard = os.environ.get("UMK_TEST_SHARD", self.shard)
+        if shard:
+            index, total = self.parse(shard)
+            testable = self.split(testable, durations, total)[index]
+
+        results = self.results()
+        cached = [
+            name for name in testable
+            if self.cache and name in fingerprints
+            and results.get(name, {}).get("fingerprint") == fingerprints[name]
+        ]
+        pending = [name for name in testable if name not in cached]
+        workers = max(1, min(self.workers or os.cpu_count() or 1, len(pending)))
+        shards = [s for s in self.split(pending, durations, workers) if s]
+        flags = list(self.flags)
+        if not any(f == "-p" or f.startswith("-p=") for f in flags):
+            flags.append(f"-p={max(1, (os.cpu_count() or 1) // workers)}")
+
+        def execute(names: list[str]) -> GoTestStream:
+            shell = self.tool.command("test", "-json", *flags, *names)
+            shell.workdir = root
+            shell.handler = GoTestStream()
+            shell.sync()
+            return shell.handler
+
+        with ThreadPoolExecutor(max_workers=max(1, len(shards))) as executor:
+            streams = list(executor.map(execute, shards))
+
+        failed, elapsed = [], {}
+        for names, stream in zip(shards, streams):
+            for name in names:
+                package = stream.packages.get(name)
+                if package is None or package.action == "fail" or not package.action:
+                    failed.append(name)
+                    core.globals.console.print(f"[bold red]FAIL {name}")
+                    output = "".join(package.output) if package else ""
+                    core.globals.console.out(output or "\n".join(stream.errors), highlight=False)
+                    results.pop(name, None)
+                    continue
+                elapsed[name] = package.elapsed
+                results[name] = {"fingerprint": fingerprints.get(name), "elapsed": package.elapsed}
+                suffix = "(cached)" if package.cached else f"{package.elapsed:.2f}s"
+                core.globals.console.print(f"[green]ok[/green]   {name} {suffix}", highlight=False)
+        for name in cached:
+            core.globals.console.print(f"[green]ok[/green]   {name} (umk cached)", highlight=False)
+
+        self.save(results)
+        if elapsed:
+            utils.History("tests").append({"target": self.name, "durations": elapsed})
+        core.globals.console.print(
+            f"[bold]\[{self.name}] {len(testable) - len(failed)} passed ({len(cached)} cached), "
+            f"{len(failed)} failed, {len(shards)} shards"
+        )
+        if failed:
+            core.globals.close(1)
+
+    def affected(self, since: str) -> bool:
+        root = Path(self.path or core.globals.paths.work).expanduser().resolve().absolute()
+        affected = self.tool.affected(root, since, *self.packages)
+        if affected is None:
+            return True
+        listing = self.tool.packages(root, *self.packages)
+        return any(p.testable and p.path in affected for p in listing.listed())
+
+    def parse(self, shard: str) -> tuple[int, int]:
+        """
+        Returns zero based index and total number of the 'index/total' shard.
+        """
+        index, _, total = shard.partition("/")
+        if index.isdigit() and total.isdigit() and 0 <= int(index) - 1 < int(total):
+            return int(index) - 1, int(total)
+        core.globals.error_console.print(
+            f"\[{self.name}] invalid shard '{shard}', expected 'index/total' (1 <= index <= total)"
+        )
+        core.globals.close(-1)
+
+    @staticmethod
+    def split(packages: list[str], durations: dict[str, float], count: int) -> list[list[str]]:
+        """
+        Split packages into shards of the similar total duration (longest first
+        to the least loaded shard). Unknown packages get the median duration.
+        """
+        default = statistics.median(durations.values()) if durations else 1.0
+        heap = [(0.0, i) for i in range(max(1, count))]
+        result = [[] for _ in heap]
+        for name in sorted(packages, key=lambda n: durations.get(n, default), reverse=True):
+            load, i = heapq.heappop(heap)
+            result[i].append(name)
+            heapq.heappush(heap, (load + durations.get(name, default), i))
+        return result
+
+    def durations(self) -> dict[str, float]:
+        """
+        The latest known test duration of each package.
+        """
+        result = {}
+        for record in utils.History("tests").load(limit=50):
+            if record.get("target") == self.name:
+                result.update(record.get("durations", {}))
+        return result
+
+    def results(self) -> dict[str, dict]:
+        file = core.globals.paths.cache / "go" / "test" / f"{self.name}.json"
+        try:
+            return core.json.load(file) if file.exists() else {}
+        except ValueError:
+            return {}
+
+    def save(self, results: dict[str, dict]):
+        file = core.globals.paths.cache / "go" / "test" / f"{self.name}.json"
+        os.makedirs(file.parent, exist_ok=True)
+        core.json.save(results, file)
+
+    def object(self) -> core.Object:
+        result = super().object()
+        result.type = "Target.Golang.Test"
+        result.properties.new("Packages", self.packages, "Packages to test")
+        result.properties.new("Flags", self.flags, "Additional 'go test' flags")
+        result.properties.new("Shard", self.shard, "Shard to run (index/total)")
+        return result
+
+
+class GolangCoverage(Interface):
+    tool: Tool = core.Field(
+        default_factory=Tool,
+        description="Go tool object"
+    )
+    path: None | Path = core.Field(
+        default=None,
+        description="Module directory to run tests in"
+    )
+    packages: list[str] = core.Field(
+        default_factory=lambda: ["./..."],
+        description="Packages to test"
+    )
+    flags: list[str] = core.Field(
+        default_factory=list,
+        description="Additional 'go test' flags"
+    )
+    mode: str = core.Field(
+        default="atomic",
+        description="Coverage mode ('-covermode')"
+    )
+    coverpkg: list[str] = core.Field(
+        default_factory=list,
+        description="Packages to instrument ('-coverpkg')"
+    )
+    commands: list[list[str]] = core.Field(
+        default_factory=list,
+        description="Integration runs of the coverage instrumented binaries (each gets its own "
+                    "GOCOVERDIR)"
+    )
+    remotes: dict[str, str] = core.Field(
+        default_factory=dict,
+        description="Coverage directories to download (remote environment name -> GOCOVERDIR "
+                    "inside it)"
+    )
+    workers: None | int = core.Field(
+        default=None,
+        description="Number of the parallel test shards and merges (CPU count by default)"
+    )
+    profile: Path = core.Field(
+        default=Path("coverage.out"),
+        description="Text coverage profile file to write"
+    )
+    minimum: None | float = core.Field(
+        default=None,
+        description="Fail if total statements coverage (percent) is lower"
+    )
+
+    def run(self, **kwargs):
+        root = Path(self.path or core.globals.paths.work).expanduser().resolve().absolute()
+        coverage = GoCoverage(root=core.globals.paths.cache / "go" / "cover" / self.name)
+        coverage.clean()
+        jobs = self.workers or os.cpu_count() or 1
+
+        listing = self.tool.packages(root, *self.packages)
+        testable = list(self.packages)
+        if listing:
+            testable = [p.path for p in listing.listed() if p.testable]
+        shards = [s for s in GolangTest.split(testable, {}, min(jobs, max(1, len(testable)))) if s]
+        options = [f"-covermode={self.mode}", *self.flags]
+        if self.coverpkg:
+            options.append(f"-coverpkg={','.join(self.coverpkg)}")
+
+        def test(names: list[str]) -> None | int:
+            directory = coverage.run('test')
+            shell = self.tool.command(
+                "test", "-cover", *options, *names, "-args", f"-test.gocoverdir={directory}"
+            )
+            shell.workdir = root
+            return shell.sync()
+
+        with ThreadPoolExecutor(max_workers=max(1, len(shards))) as executor:
+            failed = sum(code != 0 for code in executor.map(test, shards))
+
+        for i, command in enumerate(self.commands):
+            shell = Shell(
+                name=f"{self.name}.{i}",
+                cmd=command,
+                workdir=root,
+                environs=Environs(GOCOVERDIR=str(coverage.run(f"cmd{i}"))),
+            )
+            failed += shell.sync() != 0
+
+        find = kwargs.get("remote")
+        for name, directory in self.remotes.items():
+            environment = find(name) if find else None
+            if environment is None:
+                core.globals.console.print(
+                    f"[bold red]\[{self.name}] remote environment '{name}' not found"
+                )
+                failed += 1
+                continue
+            local = coverage.run(name)
+            local.rmdir()
+            environment.download({directory: local})
+
+        runs = coverage.runs()
+        merged = Path(coverage.root) / "merged"
+        if not runs or not coverage.merge(self.tool, runs, merged, jobs):
+            core.globals.console.print(f"[bold red]\[{self.name}] no coverage data to merge")
+            core.globals.close(1)
+        percents = coverage.percent(self.tool, merged)
+        profile = Path(self.profile) if Path(self.profile).is_absolute() else root / self.profile
+        coverage.textfmt(self.tool, merged, profile)
+        total = coverage.total(profile)
+
+        table = Table(
+            title=f"COVERAGE ({self.name})",
+            title_style="bold cyan",
+            title_justify="left",
+            show_edge=False,
+            box=None,
+        )
+        table.add_column("Package", justify="left", style="bold", no_wrap=True)
+        table.add_column("Statements", justify="right")
+        for name, value in sorted(percents.items()):
+            table.add_row(name, f"{value:.1f}%")
+        core.globals.console.print(table)
+        core.globals.console.print(
+            f"[bold]\[{self.name}] total {total:.1f}% of statements, {len(runs)} runs merged, "
+            f"profile: {profile}"
+        )
+        utils.History("coverage").append(
+            {"target": self.name, "total": total, "packages": percents}
+        )
+        if failed:
+            core.globals.console.print(f"[bold red]\[{self.name}] {failed} runs failed")
+            core.globals.close(1)
+        if self.minimum is not None and total < self.minimum:
+            core.globals.console.print(
+                f"[bold red]\[{self.name}] coverage {total:.1f}% is lower than {self.minimum:.1f}%"
+            )
+            core.globals.close(1)
+
+    def outputs(self) -> list[Path]:
+        return [Path(self.profile).expanduser().resolve().absolute()]
+
+    def object(self) -> core.Object:
+        result = super().object()
+        result.type = "Target.Golang.Coverage"
+        result.properties.new("Packages", self.packages, "Packages to test")
+        result.properties.new("Mode", self.mode, "Coverage mode")
+        result.properties.new("Profile", self.profile, "Text coverage profile file")
+        return result
@@ -3,6 +3,7 @@ import inspect
 
 from umk import core
 from umk.core.typings import Callable, Any
+from umk.framework.filesystem import Path
 from umk.framework.system.shell import Shell
 
 
@@ -28,6 +29,18 @@ class Interface(core.Model):
         result.properties.new(name="Description", value=self.description, desc="Target description")
         return result
 
+    def outputs(self) -> list[Path]:
+        """
+        Files produced by the target (downloaded back after remote execution).
+        """
+        return []
+
+    def affected(self, since: str) -> bool:
+        """
+        Whether the target is affected by the git changes since the given reference.
+        """
+        return True
+
     @abc.abstractmethod
     def run(self, **kwargs):
         raise NotImplemented()
@@ -1,2 +1,4 @@
 from asyncio import gather as parallel
 from .code import caller
+from .digest import digest
+from .history import History
@@ -0,0 +1,14 @@
+import hashlib
+
+
+def digest(*chunks: str | bytes) -> str:
+    """
+    Returns sha256 hex digest of the given chunks.
+    """
+    result = hashlib.sha256()
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        result.update(chunk)
+        result.update(b"\0")
+    return result.hexdigest()
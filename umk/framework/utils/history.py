@@ -0,0 +1,41 @@
+import datetime
+import json
+import os
+
+from umk import core
+from umk.core.typings import Any
+from umk.framework.filesystem import Path
+
+
+class History:
+    """
+    Append-only records store (JSON lines under '.unimake/.cache/history').
+    """
+
+    def __init__(self, name: str, root: None | Path = None):
+        self.file = Path(root or core.globals.paths.cache / "history") / f"{name}.jsonl"
+
+    def append(self, record: core.Model | dict[str, Any]):
+        if isinstance(record, core.Model):
+            record = record.model_dump(mode="json")
+        record = {"time": datetime.datetime.now().isoformat(timespec="seconds"), **record}
+        os.makedirs(self.file.parent, exist_ok=True)
+        with open(self.file, "a") as stream:
+            stream.write(json.dumps(record) + "\n")
+
+    def load(self, limit: None | int = None) -> list[dict[str, Any]]:
+        """
+        Returns records (the last ones if limit is given), broken lines are skipped.
+        """
+        if not self.file.exists():
+            return []
+        result = []
+        with open(self.file, "r") as stream:
+            for line in stream:
+                try:
+                    result.append(json.loads(line))
+                except ValueError:
+                    continue
+        if limit is not None:
+            result = result[-limit:]
+        return result
@@ -0,0 +1,85 @@
+import functools
+import math
+import statistics
+
+from umk.core.typings import Sequence
+
+
+def median(values: Sequence[float]) -> float:
+    return statistics.median(values) if values else math.nan
+
+
+def confidence(values: Sequence[float], level: float = 0.95) -> tuple[float, float]:
+    """
+    Distribution-free confidence interval of the median (binomial order
+    statistics). Small samples fall back to the (min, max) range.
+    """
+    x = sorted(values)
+    n = len(x)
+    if n == 0:
+        return math.nan, math.nan
+    alpha = (1.0 - level) / 2
+    k = 0
+    cdf = 0.0
+    for i in range(n):
+        cdf += math.comb(n, i) / 2 ** n
+        if cdf > alpha:
+            break
+        k = i
+    k = min(k, (n - 1) // 2)
+    return x[k], x[n - 1 - k]
+
+
+@functools.lru_cache(maxsize=None)
+def _frequencies(m: int, n: int) -> tuple[int, ...]:
+    # Number of the arrangements giving each U value for sample sizes m, n
+    if m == 0 or n == 0:
+        return (1,)
+    a = _frequencies(m - 1, n)
+    b = _frequencies(m, n - 1)
+    result = [0] * (m * n + 1)
+    for u, count in enumerate(a):
+        result[u + n] += count
+    for u, count in enumerate(b):
+        result[u] += count
+    return tuple(result)
+
+
+def mannwhitney(a: Sequence[float], b: Sequence[float]) -> float:
+    """
+    Two-sided p-value of the Mann-Whitney U test. Exact distribution is used
+    for small samples without ties, normal approximation otherwise.
+    """
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    merged = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    ranks = [0.0] * len(merged)
+    ties = []
+    i = 0
+    while i < len(merged):
+        j = i
+        while j + 1 < len(merged) and merged[j + 1][0] == merged[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        if j > i:
+            ties.append(j - i + 1)
+        i = j + 1
+    r1 = sum(rank for rank, (_, group) in zip(ranks, merged) if group == 0)
+    u = r1 - n1 * (n1 + 1) / 2
+
+    if not ties and n1 <= 30 and n2 <= 30:
+        freq = _frequencies(n1, n2)
+        total = sum(freq)
+        below = sum(freq[:int(u) + 1]) / total
+        above = sum(freq[int(u):]) / total
+        return min(1.0, 2 * min(below, above))
+
+    n = n1 + n2
+    mu = n1 * n2 / 2
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - sum(t ** 3 - t for t in ties) / (n * (n - 1))))
+    if sigma == 0:
+        return 1.0
+    z = max(0.0, abs(u - mu) - 0.5) / sigma
+    return min(1.0, math.erfc(z / math.sqrt(2)))
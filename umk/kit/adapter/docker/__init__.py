@@ -11,6 +11,7 @@ from umk.framework.adapters.docker.file import From as FileFrom
 from umk.framework.adapters.docker.file import Healthcheck as FileHealthcheck
 from umk.framework.adapters.docker.file import Label as FileLabel
 from umk.framework.adapters.docker.file import Maintainer as FileMaintainer
+from umk.framework.adapters.docker.file import Mount as FileMount
 from umk.framework.adapters.docker.file import OnBuild as FileOnBuild
 from umk.framework.adapters.docker.file import Run as FileRun
 from umk.framework.adapters.docker.file import Shell as FileShell
@@ -65,6 +66,7 @@ __all__ = [
     "FileHealthcheck",
     "FileLabel",
     "FileMaintainer",
+    "FileMount",
     "FileOnBuild",
     "FileRun",
     "FileShell",
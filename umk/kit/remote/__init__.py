@@ -1,15 +1,21 @@
 from umk.framework.remote.docker import Compose as DockerCompose
 from umk.framework.remote.docker import Container as DockerContainer
+from umk.framework.remote.docker import GoCache as DockerGoCache
 from umk.framework.remote.docker import Login as DockerLogin
+from umk.framework.remote.docker import Pool as DockerPool
 from umk.framework.remote.interface import Interface
 from umk.framework.remote.ssh import SecureShell
+from umk.framework.remote.ssh import Pool as SecureShellPool
 
 __all__ = [
     "Interface",
     "DockerContainer",
     "DockerCompose",
     "DockerLogin",
+    "DockerPool",
+    "DockerGoCache",
     "SecureShell",
+    "SecureShellPool",
 ]
 
 
@@ -24,12 +30,22 @@ class docker:
         # See implementation in runtime.Instance.implementation()
         raise NotImplemented()
 
+    @staticmethod
+    def pool(factory):
+        # See implementation in runtime.Instance.implementation()
+        raise NotImplemented()
+
 
 def ssh(factory):
     # See implementation in runtime.Instance.implementation()
     raise NotImplemented()
 
 
+def hosts(factory):
+    # See implementation in runtime.Instance.implementation()
+    raise NotImplemented()
+
+
 def custom():
     # See implementation in runtime.Instance.implementation()
     raise NotImplemented()
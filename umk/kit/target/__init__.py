@@ -8,6 +8,9 @@ from umk.framework.target.packages import SystemPackages
 
 from umk.framework.target.golang import GolangBinary
 from umk.framework.target.golang import GolangMod
+from umk.framework.target.golang import GolangBench
+from umk.framework.target.golang import GolangTest
+from umk.framework.target.golang import GolangCoverage
 
 
 def run(*names: str):
@@ -37,7 +40,7 @@ def command(func):
 
 class go:
     @staticmethod
-    def binary(debug=True):
+    def binary(debug=True, platforms=None, jobs=None):
         # See implementation in runtime.Instance.implementation()
         raise NotImplemented()
 
@@ -46,6 +49,21 @@ class go:
         # See implementation in runtime.Instance.implementation()
         raise NotImplemented()
 
+    @staticmethod
+    def bench(func):
+        # See implementation in runtime.Instance.implementation()
+        raise NotImplemented()
+
+    @staticmethod
+    def test(func):
+        # See implementation in runtime.Instance.implementation()
+        raise NotImplemented()
+
+    @staticmethod
+    def cover(func):
+        # See implementation in runtime.Instance.implementation()
+        raise NotImplemented()
+
 
 def packages(func):
     # See implementation in runtime.Instance.implementation()
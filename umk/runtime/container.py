@@ -3,6 +3,7 @@ from importlib import util as importer
 from pathlib import Path
 
 from umk import core
+from umk.framework import utils
 from umk.kit import config
 from umk.kit import remote
 from umk.runtime.config import Config
@@ -43,10 +44,23 @@ class Container:
         self.project = Project()
         self.targets = Targets()
         self.remotes = Remote()
+        self._signature = None
 
     def load(self, options: Options):
         root = options.root.expanduser().resolve().absolute()
-        sys.path.insert(0, root.as_posix())
+        signature = self.signature(root, options)
+        if signature == self._signature:
+            # already loaded (warm agent process)
+            return
+        # scripts register targets, remotes and project again
+        self.reset()
+        if root.as_posix() not in sys.path:
+            sys.path.insert(0, root.as_posix())
+        # scripts import each other ('from config import Config'), drop stale modules
+        for name, module in list(sys.modules.items()):
+            file = getattr(module, "__file__", None)
+            if file and Path(file).parent == root:
+                del sys.modules[name]
 
         with_config = (root / "config.py").exists()
         with_remote = (root / "remote.py").exists()
@@ -68,6 +82,30 @@ class Container:
         self.targets.setup(self.config.instance, self.project.instance)
         if with_remote:
             self.remotes.setup(self.config.instance, self.project.instance)
+        self._signature = signature
+
+    def reset(self):
+        """
+        Drop registered config, project, targets and remotes (with the pending
+        decorators) and force reloading on the next 'load' call.
+        """
+        self._modules = {}
+        self.config = Config()
+        self.project = Project()
+        self.targets = Targets()
+        self.remotes = Remote()
+        self._signature = None
+
+    @staticmethod
+    def signature(root: Path, options: Options) -> str:
+        """
+        Digest of the load options and '.unimake' scripts (and saved config) modification times.
+        """
+        files = sorted(root.glob("*.py"))
+        if options.config.file:
+            files.append(core.globals.paths.config)
+        stamps = [f"{file}:{file.stat().st_mtime_ns}" for file in files if file.exists()]
+        return utils.digest(core.json.text(options), *stamps)
 
     def find_remote(self, default: bool, specific: str) -> remote.Interface:
         if default:
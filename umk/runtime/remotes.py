@@ -37,6 +37,31 @@ class Remote(core.Model):
                 )
             ),
         )
+        hosts: utils.Decorator = core.Field(
+            description="Decorator of the remote 'hosts'",
+            default_factory=lambda: utils.Decorator(
+                stack=2,
+                input=utils.Decorator.Input(
+                    subject="function",
+                    sig=utils.Decorator.Input.Signature(min=1)
+                ),
+                module="remote",
+                errors=utils.Decorator.OnErrors(
+                    module=utils.SourceError(
+                        "Failed to register remote environment 'hosts' outside of the "
+                        ".unimake/remote.py"
+                    ),
+                    subject=utils.FunctionError(
+                        "Failed to register remote environment 'hosts'. "
+                        "Use 'umk.framework.remote.hosts with functions"
+                    ),
+                    sig=utils.SignatureError(
+                        "Failed to register remote environment 'hosts'. "
+                        "Function must accept 1 argument at least"
+                    ),
+                )
+            ),
+        )
         container: utils.Decorator = core.Field(
             description="Decorator of the remote 'docker.container'",
             default_factory=lambda: utils.Decorator(
@@ -53,6 +78,31 @@ class Remote(core.Model):
                 )
             ),
         )
+        pool: utils.Decorator = core.Field(
+            description="Decorator of the remote 'docker.pool'",
+            default_factory=lambda: utils.Decorator(
+                stack=2,
+                input=utils.Decorator.Input(
+                    subject="function",
+                    sig=utils.Decorator.Input.Signature(min=1)
+                ),
+                module="remote",
+                errors=utils.Decorator.OnErrors(
+                    module=utils.SourceError(
+                        "Failed to register remote environment 'docker.pool' outside of the "
+                        ".unimake/remote.py"
+                    ),
+                    subject=utils.FunctionError(
+                        "Failed to register remote environment 'docker.pool'. "
+                        "Use 'umk.framework.remote.docker.pool with functions"
+                    ),
+                    sig=utils.SignatureError(
+                        "Failed to register remote environment 'docker.pool'. "
+                        "Function must accept 1 argument at least"
+                    ),
+                )
+            ),
+        )
         compose: utils.Decorator = core.Field(
             description="Decorator of the remote 'docker.compose'",
             default_factory=lambda: utils.Decorator(
@@ -106,8 +156,10 @@ class Remote(core.Model):
         remote.find = self.find
         remote.default = lambda on_err=None: self.get(self.default, on_err)
         remote.ssh = self.decorator.ssh.register
+        remote.hosts = self.decorator.hosts.register
         remote.docker.container = self.decorator.container.register
         remote.docker.compose = self.decorator.compose.register
+        remote.docker.pool = self.decorator.pool.register
         remote.custom = self.decorator.custom.register
 
     def setup(self, c: config.Interface, p: project.Interface):
@@ -126,6 +178,8 @@ class Remote(core.Model):
             self.items[r.name] = r
         for defer in self.decorator.compose.defers:
             src = remote.DockerCompose()
+            src.ignore = p.layout.ignores()
+            src.layout = p.layout
             sig = self.decorator.compose.input.sig
             defer(sig.min, sig.max, src, c, p)
             append(src)
@@ -134,11 +188,25 @@ class Remote(core.Model):
             sig = self.decorator.container.input.sig
             defer(sig.min, sig.max, src, c, p)
             append(src)
+        for defer in self.decorator.pool.defers:
+            src = remote.DockerPool()
+            sig = self.decorator.pool.input.sig
+            defer(sig.min, sig.max, src, c, p)
+            append(src)
         for defer in self.decorator.ssh.defers:
             src = remote.SecureShell()
+            src.ignore = p.layout.ignores()
             sig = self.decorator.ssh.input.sig
             defer(sig.min, sig.max, src, c, p)
             append(src)
+        # after 'ssh' ones, so they can be found by 'remote.find'
+        for defer in self.decorator.hosts.defers:
+            src = remote.SecureShellPool()
+            sig = self.decorator.hosts.input.sig
+            defer(sig.min, sig.max, src, c, p)
+            for host in src.hosts:
+                host.ignore = host.ignore or p.layout.ignores()
+            append(src)
         for defer in self.decorator.custom.defers:
             res = defer(0, 2, c, p)
             append(res)
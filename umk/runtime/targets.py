@@ -1,5 +1,5 @@
 from umk import core
-from umk.kit import config, target, project
+from umk.kit import config, target, project, remote
 from umk.core.typings import Generator
 from umk.runtime import utils
 
@@ -68,6 +68,78 @@ class Targets(core.Model):
                 )
             ),
         )
+        go_bench: utils.Decorator = core.Field(
+            description="Decorator of the target 'go.bench'",
+            default_factory=lambda: utils.Decorator(
+                stack=2,
+                input=utils.Decorator.Input(
+                    subject="function",
+                    sig=utils.Decorator.Input.Signature(min=1)
+                ),
+                module="targets",
+                errors=utils.Decorator.OnErrors(
+                    module=utils.SourceError(
+                        "Failed to register target 'go.bench' outside of the .unimake/targets.py"
+                    ),
+                    subject=utils.FunctionError(
+                        "Failed to register target 'go.bench'. "
+                        "Use 'umk.framework.targets.go.bench' with functions"
+                    ),
+                    sig=utils.SignatureError(
+                        "Failed to register target 'go.bench'. "
+                        "Function must accept 1 argument at least"
+                    ),
+                )
+            ),
+        )
+        go_test: utils.Decorator = core.Field(
+            description="Decorator of the target 'go.test'",
+            default_factory=lambda: utils.Decorator(
+                stack=2,
+                input=utils.Decorator.Input(
+                    subject="function",
+                    sig=utils.Decorator.Input.Signature(min=1)
+                ),
+                module="targets",
+                errors=utils.Decorator.OnErrors(
+                    module=utils.SourceError(
+                        "Failed to register target 'go.test' outside of the .unimake/targets.py"
+                    ),
+                    subject=utils.FunctionError(
+                        "Failed to register target 'go.test'. "
+                        "Use 'umk.framework.targets.go.test' with functions"
+                    ),
+                    sig=utils.SignatureError(
+                        "Failed to register target 'go.test'. "
+                        "Function must accept 1 argument at least"
+                    ),
+                )
+            ),
+        )
+        go_cover: utils.Decorator = core.Field(
+            description="Decorator of the target 'go.cover'",
+            default_factory=lambda: utils.Decorator(
+                stack=2,
+                input=utils.Decorator.Input(
+                    subject="function",
+                    sig=utils.Decorator.Input.Signature(min=1)
+                ),
+                module="targets",
+                errors=utils.Decorator.OnErrors(
+                    module=utils.SourceError(
+                        "Failed to register target 'go.cover' outside of the .unimake/targets.py"
+                    ),
+                    subject=utils.FunctionError(
+                        "Failed to register target 'go.cover'. "
+                        "Use 'umk.framework.targets.go.cover' with functions"
+                    ),
+                    sig=utils.SignatureError(
+                        "Failed to register target 'go.cover'. "
+                        "Function must accept 1 argument at least"
+                    ),
+                )
+            ),
+        )
         command: utils.Decorator = core.Field(
             description="Decorator of the target 'command'",
             default_factory=lambda: utils.Decorator(
@@ -125,18 +197,44 @@ class Targets(core.Model):
     def get(self, name: str, on_err=None) -> target.Interface:
         return self.items.get(name, on_err)
 
-    def run(self, *names: str):
+    def run(self, *names: str, since: str = ""):
         found = []
         for name in names:
             if name not in self.items:
                 core.globals.console.print(f"[yellow bold]Target '{name}' not found")
+            elif since and not self.get(name).affected(since):
+                core.globals.console.print(
+                    f"[bold]Target '{name}' is not affected since '{since}', skip"
+                )
             else:
                 found.append(name)
-        for name in found:
+        for batch in self.batches(*found):
+            if len(batch) > 1:
+                if target.GolangBinary.batch(batch):
+                    continue
+                core.globals.console.print(
+                    "[yellow bold]Batched build failed, build binaries one by one"
+                )
+            for t in batch:
+                t.run(p=project.get(), c=config.get(), since=since, remote=remote.find)
+
+    def batches(self, *names: str) -> list[list[target.Interface]]:
+        """
+        Split targets into runs keeping their order: consecutive golang binaries
+        which can be built by a single 'go build' call are grouped together.
+        """
+        result: list[list[target.Interface]] = []
+        last = None
+        for name in names:
             t = self.get(name)
-            p = project.get()
-            c = config.get()
-            t.run(p=p, c=c)
+            key = t.batchable() if isinstance(t, target.GolangBinary) else None
+            if key is not None and key == last:
+                if not any(t is other for other in result[-1]):
+                    result[-1].append(t)
+                continue
+            result.append([t])
+            last = key
+        return result
 
     def init(self):
         target.run = self.run
@@ -146,6 +244,9 @@ class Targets(core.Model):
         target.packages = self.decorator.packages.register
         target.go.binary = self.decorator.go_binary.register
         target.go.mod = self.decorator.go_mod.register
+        target.go.bench = self.decorator.go_bench.register
+        target.go.test = self.decorator.go_test.register
+        target.go.cover = self.decorator.go_cover.register
 
     def setup(self, c: config.Interface, p: project.Interface):
         def append(tar: target.Interface):
@@ -168,6 +269,12 @@ class Targets(core.Model):
             src = target.GolangBinary()
             sig = self.decorator.go_binary.input.sig
             with_debug = defer.args.get("debug", True)
+            src.platforms = [
+                pl if isinstance(pl, target.GolangBinary.Platform)
+                else target.GolangBinary.Platform.parse(pl)
+                for pl in defer.args.get("platforms", [])
+            ]
+            src.jobs = defer.args.get("jobs", None)
             defer(sig.min, sig.max, src, c, p)
             if with_debug:
                 d, r = target.GolangBinary.new(
@@ -177,7 +284,14 @@ class Targets(core.Model):
                     tool=src.tool,
                     build=src.build,
                     port=src.debug.port,
+                    platforms=src.platforms,
+                    jobs=src.jobs,
                 )
+                for variant in (d, r):
+                    variant.timing = src.timing
+                    variant.trace = src.trace
+                    variant.pgo = src.pgo
+                    variant.sizes = src.sizes
                 append(d)
                 append(r)
             else:
@@ -187,16 +301,26 @@ class Targets(core.Model):
             sig = self.decorator.command.input.sig
             defer(sig.min, sig.max, src, c, p)
             append(src)
-        for defer in self.decorator.go_binary.defers:
-            src = target.GolangBinary()
-            sig = self.decorator.go_binary.input.sig
-            defer(sig.min, sig.max, src, c, p)
-            append(src)
         for defer in self.decorator.go_mod.defers:
             src = target.GolangMod()
             sig = self.decorator.go_mod.input.sig
             defer(sig.min, sig.max, src, c, p)
             append(src)
+        for defer in self.decorator.go_bench.defers:
+            src = target.GolangBench()
+            sig = self.decorator.go_bench.input.sig
+            defer(sig.min, sig.max, src, c, p)
+            append(src)
+        for defer in self.decorator.go_test.defers:
+            src = target.GolangTest()
+            sig = self.decorator.go_test.input.sig
+            defer(sig.min, sig.max, src, c, p)
+            append(src)
+        for defer in self.decorator.go_cover.defers:
+            src = target.GolangCoverage()
+            sig = self.decorator.go_cover.input.sig
+            defer(sig.min, sig.max, src, c, p)
+            append(src)
         for defer in self.decorator.packages.defers:
             src = target.SystemPackages()
             sig = self.decorator.packages.input.sig
@@ -22,6 +22,7 @@ class RemoteState:
             "format": False,
             "remote": False,
             "target": False,
+            "agent": False,
         }
 
         position = None